@@ -0,0 +1,244 @@
+"""
+Benchmarks of the readers throughput and memory, for the files in test/test_files and synthetic large files.
+Each case is timed `repeat` times, and run once more under tracemalloc to get its peak memory.
+
+The results are saved as JSON, and can be compared against a baseline run. A case is a regression when its
+median time or its peak memory grows more than the threshold, and the time grows more than `min_delta` seconds.
+
+Usage:
+    python benchmarks/bench_readers.py [--repeat 5] [--output results.json] [--baseline baseline.json]
+"""
+import argparse
+import datetime
+import json
+import logging
+import os
+import pathlib
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, NamedTuple, Optional
+
+import numpy as np
+from rich.table import Table
+
+from wellbelog import __version__
+from wellbelog.belodlis.reader import DlisReader
+from wellbelog.belolas.reader import LasReader
+from wellbelog.belolis.reader import LisReader
+from wellbelog.main_reader import MainReader
+from wellbelog.synthetic import write_dlis, write_las, write_lis
+from wellbelog.utils.console import console
+
+FILES_FOLDER = pathlib.Path(__file__).parent.parent / 'test' / 'test_files'
+RESULTS_FOLDER = pathlib.Path(__file__).parent / 'results'
+
+DLIS_FILE = FILES_FOLDER / '1PIR1AL_conv_ccl_canhoneio.dlis'
+LIS_FILE = FILES_FOLDER / '1-MPE-3-AL.lis'
+LAS_FILE = FILES_FOLDER / '1-MPE-3-AL_hals-dslt-tdd-hgns-gr_resistividade_repetida.las'
+
+
+class Case(NamedTuple):
+    """
+    A benchmark case.
+
+    Attributes:
+        name (str): The name of the case, the key of its results.
+        function (Callable): The function timed, it takes no arguments.
+        size (int): The size of the input in bytes, used for the throughput. 0 when it does not apply.
+    """
+    name: str
+    function: Callable[[], Any]
+    size: int = 0
+
+
+def measure(case: Case, repeat: int) -> dict[str, Any]:
+    """
+    Time a case and measure its peak memory.
+
+    Returns:
+        dict: The median and min times in seconds, the peak memory in bytes, and the throughput in MB/s.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        case.function()
+        times.append(time.perf_counter() - start)
+
+    # NOTE A separate run, tracemalloc slows down the allocations
+    tracemalloc.start()
+    try:
+        case.function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(times)
+    result = {'median': median, 'min': min(times), 'peak_memory': peak, 'size': case.size}
+    if case.size:
+        result['throughput'] = case.size / 1024 ** 2 / median
+    return result
+
+
+def build_cases(folder: pathlib.Path, synthetic_samples: int, synthetic_curves: int) -> list[Case]:
+    """
+    Create the cases, reading the files in test/test_files and synthetic files of each format written to `folder`.
+    """
+    files = [('dlis', DLIS_FILE), ('lis', LIS_FILE), ('las', LAS_FILE)]
+    if synthetic_samples:
+        for kind, writer in (('dlis', write_dlis), ('lis', write_lis), ('las', write_las)):
+            path = writer(folder / f'synthetic.{kind}', samples=synthetic_samples, curves=synthetic_curves, null_density=0.01)
+            files.append((f'synthetic_{kind}', pathlib.Path(path)))
+
+    readers = {
+        'dlis': lambda path: DlisReader().process_physical_file(str(path)),
+        'lis': lambda path: LisReader().process_physical_file(str(path)),
+        'las': lambda path: LasReader().process_las_file(str(path)),
+    }
+    main_reader = MainReader()
+
+    cases = []
+    for name, path in files:
+        size = path.stat().st_size
+        kind = name.rsplit('_', 1)[-1]
+        method = {'dlis': 'DlisReader.process_physical_file', 'lis': 'LisReader.process_physical_file'}.get(kind, 'LasReader.process_las_file')
+        cases.append(Case(f'{method} ({name})', lambda path=path, kind=kind: readers[kind](path), size))
+        cases.append(Case(f'MainReader.load_file ({name})', lambda path=path: main_reader.load_file(str(path)), size))
+
+    # NOTE The exports use the data of the largest LAS file, the frames of the dlis test file are small
+    las_data = LasReader().process_las_file(str(files[-1][1] if synthetic_samples else LAS_FILE)).data
+    dlis_data = DlisReader().process_physical_file(str(DLIS_FILE)).logical_files[0].frames[0].data
+    cases.append(Case('LasDataframe.as_df', las_data.as_df))
+    cases.append(Case('FrameDataframe.as_df', dlis_data.as_df))
+    cases.append(Case('LasDataframe.to_csv', lambda: las_data.to_csv(folder / 'export.csv')))
+    try:
+        import openpyxl  # noqa: F401
+        cases.append(Case('LasDataframe.to_excel', lambda: las_data.to_excel(folder / 'export.xlsx')))
+    except ImportError:
+        console.print('[yellow]openpyxl is not installed, skipping the to_excel case.[/yellow]')
+    return cases
+
+
+def environment() -> dict[str, Any]:
+    """
+    The versions and the commit of the run, saved with the results.
+    """
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+            cwd=pathlib.Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'wellbelog': __version__,
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float, min_delta: float) -> list[str]:
+    """
+    Compare the results of a run against a baseline run.
+
+    Args:
+        results (dict): The results of the run.
+        baseline (dict): The results of the baseline run.
+        threshold (float): The max ratio of the time or the memory, like 1.2 for 20% slower.
+        min_delta (float): The min time increase, in seconds, to flag a time regression.
+
+    Returns:
+        list[str]: The names of the regressed cases.
+    """
+    table = Table(title=f'Comparison against the baseline (threshold {threshold:.2f}x)')
+    table.add_column('Case', style='green')
+    table.add_column('Time ratio', style='cyan')
+    table.add_column('Memory ratio', style='cyan')
+    table.add_column('Status', style='magenta')
+
+    regressions = []
+    for name, result in results['results'].items():
+        old = baseline['results'].get(name)
+        if old is None:
+            table.add_row(name, '-', '-', 'new')
+            continue
+        time_ratio = result['median'] / old['median'] if old['median'] else 1.0
+        memory_ratio = result['peak_memory'] / old['peak_memory'] if old['peak_memory'] else 1.0
+        slower = time_ratio > threshold and result['median'] - old['median'] > min_delta
+        regressed = slower or memory_ratio > threshold
+        if regressed:
+            regressions.append(name)
+        table.add_row(name, f'{time_ratio:.2f}x', f'{memory_ratio:.2f}x', '[red]REGRESSION[/red]' if regressed else 'ok')
+    console.print(table)
+    return regressions
+
+
+def main(
+    repeat: int = 5,
+    output: Optional[str] = None,
+    baseline: Optional[str] = None,
+    threshold: float = 1.2,
+    min_delta: float = 0.005,
+    synthetic_samples: int = 200_000,
+    synthetic_curves: int = 20,
+) -> int:
+    # NOTE Silencing the readers, the logging would be timed too
+    logging.disable(logging.CRITICAL)
+    with tempfile.TemporaryDirectory(prefix='wellbelog-bench-') as folder:
+        cases = build_cases(pathlib.Path(folder), synthetic_samples, synthetic_curves)
+        results = {
+            'created_at': datetime.datetime.now().isoformat(timespec='seconds'),
+            'environment': environment(),
+            'repeat': repeat,
+            'results': {},
+        }
+        for case in cases:
+            results['results'][case.name] = measure(case, repeat)
+
+    table = Table(title=f'Readers benchmark (median of {repeat})')
+    table.add_column('Case', style='green')
+    table.add_column('Median (ms)', style='cyan')
+    table.add_column('Peak memory (MB)', style='cyan')
+    table.add_column('Throughput (MB/s)', style='magenta')
+    for name, result in results['results'].items():
+        throughput = result.get('throughput')
+        table.add_row(
+            name, f"{result['median'] * 1000:.2f}", f"{result['peak_memory'] / 1024 ** 2:.2f}",
+            f'{throughput:.2f}' if throughput else '-',
+        )
+    console.print(table)
+
+    output = pathlib.Path(output) if output else RESULTS_FOLDER / f"{results['created_at'].replace(':', '-')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    console.print(f'Results saved to {output}')
+
+    if baseline:
+        regressions = compare(results, json.loads(pathlib.Path(baseline).read_text()), threshold, min_delta)
+        if regressions:
+            console.print(f'[red]{len(regressions)} regression(s): {", ".join(regressions)}[/red]')
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='The number of timed runs of each case.')
+    parser.add_argument('--output', help='The JSON file of the results, defaults to benchmarks/results/<date>.json.')
+    parser.add_argument('--baseline', help='A JSON file of a previous run, to flag the regressions.')
+    parser.add_argument('--threshold', type=float, default=1.2, help='The max ratio of the time or memory.')
+    parser.add_argument('--min-delta', type=float, default=0.005, help='The min time increase in seconds to flag.')
+    parser.add_argument('--synthetic-samples', type=int, default=200_000, help='The samples of the synthetic files, 0 to skip them.')
+    parser.add_argument('--synthetic-curves', type=int, default=20, help='The curves of the synthetic files.')
+    arguments = parser.parse_args()
+    sys.exit(main(
+        arguments.repeat, arguments.output, arguments.baseline, arguments.threshold, arguments.min_delta,
+        arguments.synthetic_samples, arguments.synthetic_curves,
+    ))
@@ -0,0 +1,59 @@
+"""
+Compares the time of the metadata scan against the full reading of the files in test/test_files.
+
+Usage:
+    python benchmarks/bench_scan.py [repeat]
+"""
+import logging
+import pathlib
+import sys
+import time
+
+from rich.table import Table
+
+from wellbelog.belodlis.reader import DlisReader
+from wellbelog.belolas.reader import LasReader
+from wellbelog.belolis.reader import LisReader
+from wellbelog.utils.console import console
+
+FILES_FOLDER = pathlib.Path(__file__).parent.parent / 'test' / 'test_files'
+
+
+def best_time(function, path: str, repeat: int) -> float:
+    """
+    The best time of `repeat` calls, in milliseconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(path)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main(repeat: int = 5) -> Table:
+    # NOTE Silencing the readers, the logging would be timed too
+    logging.disable(logging.CRITICAL)
+    dlis_reader, lis_reader, las_reader = DlisReader(), LisReader(), LasReader()
+    cases = [
+        ('1PIR1AL_conv_ccl_canhoneio.dlis', dlis_reader.process_physical_file, dlis_reader.scan),
+        ('1-MPE-3-AL.lis', lis_reader.process_physical_file, lis_reader.scan),
+        ('1-MPE-3-AL_hals-dslt-tdd-hgns-gr_resistividade_repetida.las', las_reader.process_las_file, las_reader.scan),
+    ]
+
+    table = Table(title=f'scan vs full reading (best of {repeat})')
+    table.add_column('File', style='green')
+    table.add_column('Full reading (ms)', style='cyan')
+    table.add_column('Scan (ms)', style='cyan')
+    table.add_column('Speedup', style='magenta')
+    for file_name, process, scan in cases:
+        path = str(FILES_FOLDER / file_name)
+        full_time = best_time(process, path, repeat)
+        scan_time = best_time(scan, path, repeat)
+        table.add_row(file_name, f'{full_time:.2f}', f'{scan_time:.2f}', f'{full_time / scan_time:.1f}x')
+    console.print(table)
+    return table
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
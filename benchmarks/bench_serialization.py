@@ -0,0 +1,79 @@
+"""
+Compares the binary serialization of the models against the JSON of pydantic, for the files in test/test_files.
+The JSON is made from the records models, the current path, and the binary from the columnar models.
+
+Usage:
+    python benchmarks/bench_serialization.py [repeat]
+"""
+import logging
+import pathlib
+import sys
+import time
+
+from rich.table import Table
+
+from wellbelog.belodlis.reader import DlisReader
+from wellbelog.belolas.reader import LasReader
+from wellbelog.belolis.reader import LisReader
+from wellbelog.utils import binary
+from wellbelog.utils.console import console
+
+FILES_FOLDER = pathlib.Path(__file__).parent.parent / 'test' / 'test_files'
+
+
+def best_time(function, argument, repeat: int) -> float:
+    """
+    The best time of `repeat` calls, in milliseconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(argument)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main(repeat: int = 5) -> Table:
+    # NOTE Silencing the readers, the logging would be timed too
+    logging.disable(logging.CRITICAL)
+    cases = [
+        ('1PIR1AL_conv_ccl_canhoneio.dlis', lambda columnar: DlisReader(columnar=columnar).process_physical_file),
+        ('1-MPE-3-AL.lis', lambda columnar: LisReader(columnar=columnar).process_physical_file),
+        ('1-MPE-3-AL_hals-dslt-tdd-hgns-gr_resistividade_repetida.las', lambda columnar: LasReader(columnar=columnar).process_las_file),
+    ]
+
+    table = Table(title=f'binary vs JSON serialization (best of {repeat})')
+    table.add_column('File', style='green')
+    table.add_column('JSON size (KB)', style='cyan')
+    table.add_column('Binary size (KB)', style='cyan')
+    table.add_column('JSON dump / load (ms)', style='cyan')
+    table.add_column('Binary dump / load (ms)', style='cyan')
+    table.add_column('Speedup', style='magenta')
+    for file_name, reader in cases:
+        path = str(FILES_FOLDER / file_name)
+        records_model = reader(False)(path)
+        columnar_model = reader(True)(path)
+        model_class = type(records_model)
+
+        json_data = records_model.model_dump_json()
+        json_dump = best_time(lambda model: model.model_dump_json(), records_model, repeat)
+        json_load = best_time(model_class.model_validate_json, json_data, repeat)
+
+        binary_data = binary.dumps(columnar_model)
+        binary_dump = best_time(binary.dumps, columnar_model, repeat)
+        binary_load = best_time(binary.loads, binary_data, repeat)
+
+        table.add_row(
+            file_name,
+            f'{len(json_data) / 1024:.1f}',
+            f'{len(binary_data) / 1024:.1f}',
+            f'{json_dump:.2f} / {json_load:.2f}',
+            f'{binary_dump:.2f} / {binary_load:.2f}',
+            f'{(json_dump + json_load) / (binary_dump + binary_load):.1f}x',
+        )
+    console.print(table)
+    return table
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
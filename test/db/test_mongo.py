@@ -0,0 +1,69 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from wellbelog.belodlis.reader import DlisReader
+from wellbelog.belolas.reader import LasReader
+from wellbelog.belolis.reader import LisReader
+from wellbelog.db.mongo import MongoSink
+from wellbelog.schemas.dlis import PhysicalFileModel
+from wellbelog.schemas.las import LasFileModel
+from wellbelog.schemas.lis import PhysicalLisFileModel
+from wellbelog.utils.store import model_dataframes
+
+mongomock = pytest.importorskip('mongomock')
+
+folder_path = Path(__file__).parent.parent / 'test_files'
+dlis_path = folder_path / '1PIR1AL_conv_ccl_canhoneio.dlis'
+lis_path = folder_path / '1-MPE-3-AL.lis'
+las_path = folder_path / '1-MPE-3-AL_hals-dslt-tdd-hgns-gr_resistividade_repetida.las'
+
+
+@pytest.fixture
+def database():
+    return mongomock.MongoClient()['wellbelog']
+
+
+@pytest.mark.parametrize('read, model_class', [
+    (lambda: DlisReader().process_physical_file(dlis_path), PhysicalFileModel),
+    (lambda: LisReader(columnar=True).process_physical_file(str(lis_path)), PhysicalLisFileModel),
+    (lambda: LasReader(columnar=True).process_las_file(las_path), LasFileModel),
+])
+def test_mongo_round_trip(database, read, model_class):
+    model = read()
+    sink = MongoSink(database)
+    file_id = sink.write(model)
+    assert model.id == file_id
+    assert database['files'].count_documents({}) == 1
+
+    stored = sink.read(file_id)
+    assert isinstance(stored, model_class)
+    assert stored.file_name == model.file_name
+    original_frames, stored_frames = model_dataframes(model), model_dataframes(stored)
+    assert len(stored_frames) == len(original_frames) > 0
+    for original, frame in zip(original_frames, stored_frames):
+        assert frame.columns_names == original.columns_names
+        for name, values in original.as_arrays().items():
+            np.testing.assert_array_equal(frame.arrays[name], values)
+
+
+def test_mongo_chunks_and_batches(database):
+    model = LasReader(columnar=True).process_las_file(las_path)
+    # NOTE Tiny chunks and batches, to check the splitting
+    sink = MongoSink(database, batch_size=7, max_chunk_bytes=1024)
+    file_ids = sink.write_many([model, model.model_copy(update={'id': None})])
+    assert len(set(file_ids)) == 2
+
+    columns = len(model.data.arrays)
+    chunks = database['curve_chunks'].count_documents({'file_id': file_ids[0]})
+    assert chunks == columns * int(np.ceil(model.data.arrays['DEPT'].nbytes / 1024))
+    assert all(len(chunk['data']) <= 1024 for chunk in database['curve_chunks'].find())
+
+    stored = sink.read(file_ids[1])
+    np.testing.assert_array_equal(stored.data.arrays['DEPT'], model.data.arrays['DEPT'])
+
+    sink.delete(file_ids[0])
+    assert database['curve_chunks'].count_documents({'file_id': file_ids[0]}) == 0
+    with pytest.raises(KeyError):
+        sink.read(file_ids[0])
@@ -0,0 +1,83 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from sqlalchemy import func, select
+
+from wellbelog.belodlis.reader import DlisReader
+from wellbelog.belolas.reader import LasReader
+from wellbelog.belolis.reader import LisReader
+from wellbelog.db.sql import SqlSink
+from wellbelog.schemas.dlis import PhysicalFileModel
+from wellbelog.schemas.las import LasFileModel
+from wellbelog.schemas.lis import PhysicalLisFileModel
+from wellbelog.synthetic import write_dlis
+from wellbelog.utils.store import model_dataframes
+
+folder_path = Path(__file__).parent.parent / 'test_files'
+dlis_path = folder_path / '1PIR1AL_conv_ccl_canhoneio.dlis'
+lis_path = folder_path / '1-MPE-3-AL.lis'
+las_path = folder_path / '1-MPE-3-AL_hals-dslt-tdd-hgns-gr_resistividade_repetida.las'
+
+
+def count(sink: SqlSink, table: str) -> int:
+    with sink.engine.connect() as connection:
+        return connection.execute(select(func.count()).select_from(sink.tables[table])).scalar()
+
+
+@pytest.mark.parametrize('layout', ['long', 'wide'])
+@pytest.mark.parametrize('read, model_class', [
+    (lambda: DlisReader().process_physical_file(dlis_path), PhysicalFileModel),
+    (lambda: LisReader(columnar=True).process_physical_file(str(lis_path)), PhysicalLisFileModel),
+    (lambda: LasReader(columnar=True, mask_nulls=True).process_las_file(las_path), LasFileModel),
+])
+def test_sql_round_trip(layout, read, model_class):
+    model = read()
+    sink = SqlSink('sqlite://', layout=layout, batch_size=5000, commit_size=20000)
+    file_id = sink.write(model)
+
+    stored = sink.read(file_id)
+    assert isinstance(stored, model_class)
+    assert stored.file_name == model.file_name
+    original_frames, stored_frames = model_dataframes(model), model_dataframes(stored)
+    assert len(stored_frames) == len(original_frames) > 0
+    for original, frame in zip(original_frames, stored_frames):
+        assert frame.columns_names == original.columns_names
+        for name, values in original.as_arrays().items():
+            np.testing.assert_array_equal(frame.arrays[name], values)
+
+
+def test_sql_long_layout():
+    model = LasReader(columnar=True).process_las_file(las_path)
+    sink = SqlSink('sqlite://', batch_size=1000)
+    file_id = sink.write(model)
+
+    rows, columns = len(model.data.arrays['DEPT']), len(model.data.arrays)
+    assert count(sink, 'samples') == rows * columns
+    assert count(sink, 'channels') == columns
+    with sink.engine.connect() as connection:
+        channels = sink.tables['channels']
+        unit = connection.execute(select(channels.c.unit).where(channels.c.name == 'DEPT')).scalar()
+    assert unit == model.channels_metadata()['DEPT']['unit']
+
+    sink.delete(file_id)
+    assert count(sink, 'samples') == count(sink, 'files') == 0
+    with pytest.raises(KeyError):
+        sink.read(file_id)
+
+
+def test_sql_wide_array_channels(tmp_path):
+    path = write_dlis(tmp_path / 'wide.dlis', samples=20, curves=2, array_curves=1, array_shape=(3000,))
+    model = DlisReader(columnar=True).process_physical_file(path)
+    sink = SqlSink('sqlite://', layout='wide')
+    file_id = sink.write(model)
+
+    # NOTE The array channel does not fit in the wide table, its samples go to the long table
+    assert count(sink, 'samples') == 20 * 3000
+    for original, frame in zip(model_dataframes(model), model_dataframes(sink.read(file_id))):
+        assert frame.columns_names == original.columns_names
+        for name, values in original.as_arrays().items():
+            np.testing.assert_array_equal(frame.arrays[name], values)
+
+    with pytest.raises(ValueError, match='long layout'):
+        SqlSink('sqlite://', layout='wide', max_columns=3).write(model)
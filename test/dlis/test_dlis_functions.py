@@ -1,8 +1,15 @@
 from pathlib import Path
 
 from dlisio import dlis
+import numpy as np
+import pandas as pd
+import pytest
 
-from wellbelog.belodlis.functions import unpack_physical_dlis, open_dlis_file
+from wellbelog.belodlis.functions import unpack_physical_dlis, open_dlis_file, iter_frame_chunks
+from wellbelog.belodlis.objects_parsers import SummaryBuilder
+from wellbelog.belodlis.objects_parsers.frame_parser import FrameProcessor
+from wellbelog.belodlis.objects_parsers.sumaries import MAIN_PARAMETERS
+from wellbelog.belodlis.reader import DlisReader
 
 folder_path = Path(__file__).parent.parent / 'test_files'
 file_path = folder_path / '1PIR1AL_conv_ccl_canhoneio.dlis'
@@ -15,3 +22,70 @@ def test_open_dlis_file():
     assert isinstance(logical_files, list)
     assert len(logical_files) > 0
     assert isinstance(logical_files[0], dlis.LogicalFile)
+
+
+def test_iter_frame_chunks():
+    physical_file = open_dlis_file(file_path)
+    frame = unpack_physical_dlis(physical_file)[0].frames[0]
+    chunks = list(iter_frame_chunks(frame, chunk_size=100))
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert np.array_equal(np.concatenate(chunks), frame.curves())
+
+
+def test_reader_frame_chunks():
+    reader = DlisReader()
+    chunks = list(reader.iter_frame_chunks(file_path, chunk_size=200, as_dataframe=True))
+    assert isinstance(chunks[0], pd.DataFrame)
+    assert 'TDEP' in chunks[0].columns
+    assert sum(len(chunk) for chunk in chunks) == 765
+
+    windows = list(reader.iter_frame_chunks(file_path, depth_step=50.0))
+    tdep = windows[0]['TDEP']
+    assert abs(tdep[0] - tdep[-1]) < 50.0
+
+
+def test_logical_file_summary():
+    logical_file = unpack_physical_dlis(open_dlis_file(file_path))[0]
+    builder = SummaryBuilder()
+
+    summary = builder.build(logical_file)
+    assert len(summary.parameters) == len(logical_file.parameters)
+    assert summary.remarks['R1'].startswith('01.MUNICIPIO')
+    assert summary.tools[0]['generic_name'] == 'LAS'
+    # NOTE The header is only rendered when it is asked for
+    assert summary.header is None
+    assert 'File-header' in builder.build(logical_file, sections=['header']).header
+
+    main = builder.build(logical_file, sections=['parameters'], parameters=MAIN_PARAMETERS)
+    assert [parameter['name'] for parameter in main.parameters] == [name for name in MAIN_PARAMETERS if name in {
+        parameter['name'] for parameter in summary.parameters
+    }]
+    assert main.tools is None and main.remarks is None
+
+    # NOTE The sections are memoized per logical file
+    tools = builder.section(logical_file, 'tools')
+    assert builder.section(logical_file, 'tools') is tools
+    builder.clear()
+    assert builder.section(logical_file, 'tools') is not tools
+
+    reader = DlisReader(summary_sections=['parameters'], summary_parameters=['CN', 'WN'])
+    logical = reader.process_physical_file(file_path).logical_files[0]
+    assert [parameter['name'] for parameter in logical.summary.parameters] == ['CN', 'WN']
+    assert DlisReader(summary_sections=[]).process_physical_file(file_path).logical_files[0].summary is None
+
+
+def test_curves_to_arrays_errors():
+    class BrokenFrame:
+        def __init__(self, error):
+            self.error = error
+
+        def curves(self):
+            raise self.error
+
+    # NOTE The ValueError, like repeated channel names, is raised like in dlis_curves_to_dataframe
+    with pytest.raises(ValueError):
+        FrameProcessor.dlis_curves_to_arrays(BrokenFrame(ValueError('duplicated mnemonics')))
+    with pytest.raises(ValueError):
+        FrameProcessor.dlis_curves_to_dataframe(BrokenFrame(ValueError('duplicated mnemonics')))
+    error = RuntimeError('broken frame')
+    assert FrameProcessor.dlis_curves_to_arrays(BrokenFrame(error)) is error
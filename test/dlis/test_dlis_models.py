@@ -1,9 +1,15 @@
 from pathlib import Path
+import pickle
 
+import numpy as np
+import pytest
 import pandas as pd
 
 from wellbelog.belodlis.reader import DlisReader
-from wellbelog.schemas.dlis import FrameModel
+from wellbelog.schemas.dlis import (
+    FrameChannel, FrameChannelTable, FrameDataframe, FrameModel, LazyFrameDataframe, LogicalFileModel
+)
+from wellbelog.synthetic import write_dlis
 
 folder_path = Path(__file__).parent.parent / 'test_files'
 file_path = folder_path / '1PIR1AL_conv_ccl_canhoneio.dlis'
@@ -70,3 +76,155 @@ def test_frame_schema_methods():
 
     assert frame.logical_file_id == logical_file.logical_id
     assert isinstance(frame.data.as_df(), pd.DataFrame)
+
+
+def test_columnar_frame_data():
+    reader = DlisReader(columnar=True)
+    physical_file = reader.process_physical_file(file_path)
+    frame = physical_file.logical_files[0].get_frame()
+
+    assert frame.data.is_columnar
+    assert frame.data.data is None
+    assert frame.data.index_name == 'TDEP'
+    assert frame.data.arrays['CCL'].dtype == np.float32
+
+    # NOTE The dataframe is a view over the arrays
+    df = frame.data.as_df()
+    assert np.shares_memory(df['CCL'].to_numpy(), frame.data.arrays['CCL'])
+
+    # NOTE The records match the default mode, without the JSON rounding
+    records = DlisReader().process_physical_file(file_path).logical_files[0].get_frame().data.data
+    assert len(frame.data.records()) == len(records)
+    assert frame.data.records()[1] == pytest.approx(records[1])
+
+
+def test_lazy_frame_data():
+    reader = DlisReader(lazy=True, columnar=True)
+    physical_file = reader.process_physical_file(file_path)
+    frame = physical_file.logical_files[0].get_frame()
+    assert isinstance(frame.data, LazyFrameDataframe)
+    assert not frame.data.is_loaded
+
+    # NOTE The data is decoded on the first access
+    df = frame.data.as_df()
+    assert frame.data.is_loaded
+    assert 'CCL' in df.columns
+
+    # NOTE After releasing, the data is decoded again
+    frame.data.release()
+    assert not frame.data.is_loaded
+    assert frame.data.rows_count == len(df)
+
+    # NOTE After closing the file, the released data can not be loaded
+    physical_file.close()
+    frame.data.release()
+    with pytest.raises(RuntimeError):
+        frame.data.as_df()
+
+
+def test_frame_channel_table():
+    frame = DlisReader().process_physical_file(file_path).logical_files[0].get_frame()
+    channels = frame.channels
+    assert isinstance(channels, FrameChannelTable)
+    assert channels.names == frame.curves_names == [channel.name for channel in channels]
+    assert channels.get('CCL').units == channels[channels.index['CCL']].units
+    assert channels.get('MISSING') is None and 'CCL' in channels
+    tdep = frame.get_curve('TDEP')
+    assert isinstance(tdep, FrameChannel) and tdep.name == 'TDEP'
+    assert [model.name for model in channels.models()] == channels.names
+
+    # NOTE The channels models and dicts are still accepted, and dumped without their ids and timestamps
+    models = FrameModel(file_name='f', logical_file_id='0', channels=channels.models())
+    dicts = FrameModel(file_name='f', logical_file_id='0', channels=[channel.model_dump() for channel in channels.models()])
+    assert models.channels == dicts.channels == channels
+    dump = frame.model_dump(mode='json', exclude_none=True)['channels']
+    assert dump[0] == {key: value for key, value in channels.row(0).items() if value is not None}
+    assert FrameModel.model_validate_json(frame.model_dump_json()).channels == channels
+    assert pickle.loads(pickle.dumps(frame)).channels == channels
+
+
+def test_channels_table_repeated_names():
+    channels = FrameChannelTable({'name': ['TDEP', 'GR', 'GR'], 'units': ['m', 'gAPI', 'cps']})
+    # NOTE With repeated names, the first channel is kept by the lookups and by the metadata
+    assert channels.index == {'TDEP': 0, 'GR': 1}
+    assert channels.get('GR').units == 'gAPI'
+    assert channels.metadata(['units']) == {'TDEP': {'units': 'm'}, 'GR': {'units': 'gAPI'}}
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_frame_parquet(tmp_path, columnar):
+    pytest.importorskip('pyarrow')
+    physical_file = DlisReader(columnar=columnar).process_physical_file(file_path)
+    frame = physical_file.logical_files[0].get_frame()
+    path = frame.to_parquet(tmp_path / 'frame.parquet')
+
+    loaded = FrameModel.read_parquet(path)
+    assert loaded.file_name == frame.file_name
+    assert loaded.data.is_columnar
+    assert loaded.data.columns_names == frame.data.columns_names
+    tdep = next(channel for channel in loaded.channels if channel.name == 'TDEP')
+    assert tdep.units == frame.channels_metadata()['TDEP']['units']
+    pd.testing.assert_frame_equal(loaded.data.as_df(), frame.data.as_df(), check_dtype=False)
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_frame_slice_depth(columnar):
+    frame = DlisReader(columnar=columnar).process_physical_file(file_path).logical_files[0].get_frame()
+    index = frame.data.depth_index()
+    # NOTE The test file is an up log
+    assert index.direction == 'DECREASING'
+
+    rows = frame.slice_depth(3300, 3250, curves=['CCL'])
+    assert list(rows.keys()) == ['TDEP', 'CCL']
+    assert np.all((rows['TDEP'] >= 3250) & (rows['TDEP'] <= 3300))
+    df = frame.data.as_df()
+    expected = df[(df['TDEP'] >= 3250) & (df['TDEP'] <= 3300)]
+    assert len(rows['TDEP']) == len(expected)
+    np.testing.assert_allclose(rows['CCL'], expected['CCL'], rtol=1e-6)
+
+    with pytest.raises(ValueError):
+        frame.slice_depth(3250, 3300, curves=['NOT_A_CURVE'])
+
+
+@pytest.mark.parametrize('method', ['linear', 'nearest'])
+def test_merge_frames(tmp_path, method):
+    path = write_dlis(
+        tmp_path / 'frames.dlis', frames=3, samples=60, curves=2, array_curves=1, array_shape=(3,), decreasing=True,
+    )
+    logical_file = DlisReader(columnar=True).process_physical_file(path).logical_files[0]
+    merged = logical_file.merge_frames(method=method)
+
+    frames = logical_file.frames
+    assert merged.data.columns_names == ['DEPT', 'CURVE0', 'CURVE1', 'ARRAY0', 'F1CURVE0', 'F1CURVE1', 'F1ARRAY0',
+                                         'F2CURVE0', 'F2CURVE1', 'F2ARRAY0']
+    assert merged.channels_metadata()['F1CURVE1'] == frames[1].channels_metadata()['F1CURVE1']
+    # NOTE The depth axis is the one of the fastest frame, so its curves are not changed
+    assert np.allclose(merged.data.arrays['DEPT'], frames[0].data.arrays['DEPT'])
+    assert np.allclose(merged.data.arrays['CURVE0'], frames[0].data.arrays['CURVE0'])
+    assert merged.data.arrays['ARRAY0'].shape == (60, 3)
+
+    # NOTE The samples of the slow frames are found on the common depth
+    slow = frames[1].data.arrays
+    rows = np.abs(merged.data.arrays['DEPT'][None, :] - slow['DEPT'][:, None]).argmin(axis=1)
+    assert np.allclose(merged.data.arrays['F1CURVE0'][rows], slow['F1CURVE0'])
+    assert np.isnan(merged.data.arrays['F2CURVE0'][-1])
+
+
+def test_merge_frames_names_and_units():
+    def frame(arrays, units='m'):
+        channels = FrameChannelTable({'name': list(arrays), 'units': [units] + [None] * (len(arrays) - 1)})
+        data = FrameDataframe.from_arrays(arrays, file_name='f', logical_file_id='0', index_name='DEPT')
+        return FrameModel(file_name='f', logical_file_id='0', channels=channels, data=data)
+
+    depth = np.arange(10, dtype=np.float64)
+    first = frame({'DEPT': depth, 'GR': depth, 'GR_1': depth + 1})
+    second = frame({'DEPT': depth, 'GR': depth + 2, 'NPHI': depth + 3})
+    merged = LogicalFileModel(file_name='f', frames=[first, second]).merge_frames()
+    # NOTE The suffixed name does not take the name of a channel of the frames
+    assert merged.data.columns_names == ['DEPT', 'GR', 'GR_1', 'GR_1_1', 'NPHI']
+    np.testing.assert_allclose(merged.data.arrays['GR_1'], depth + 1)
+    np.testing.assert_allclose(merged.data.arrays['GR_1_1'], depth + 2)
+
+    feet = frame({'DEPT': depth, 'RHOB': depth}, units='ft')
+    with pytest.raises(ValueError, match='different units'):
+        LogicalFileModel(file_name='f', frames=[first, feet]).merge_frames()
@@ -3,7 +3,7 @@ from pathlib import Path
 from dlisio import dlis
 import pytest
 
-from wellbelog.belodlis.reader import DlisReader
+from wellbelog.belodlis.reader import DlisReader, _split_positions
 
 folder_path = Path(__file__).parent.parent / 'test_files'
 file_path = folder_path / '1PIR1AL_conv_ccl_canhoneio.dlis'
@@ -54,3 +54,30 @@ def load_raw_unpack():
     assert isinstance(logical, list)
     assert isinstance(logical[0], dlis.LogicalFile)
     assert len(logical) > 0
+
+
+def test_read_all_logical_files():
+    physical_file = DlisReader().process_physical_file(file_path)
+    assert [file.logical_id for file in physical_file.logical_files] == ['GEOLOAD.1', 'GEOLOAD.2', 'GEOLOAD.3']
+
+
+@pytest.mark.parametrize('pool', ['thread', 'process'])
+def test_read_logical_files_parallel(pool):
+    serial = DlisReader(columnar=True).process_physical_file(file_path)
+    parallel = DlisReader(columnar=True, workers=3, pool=pool).process_physical_file(file_path)
+    # NOTE The logical files keep the order of the file
+    assert [file.logical_id for file in parallel.logical_files] == [file.logical_id for file in serial.logical_files]
+    for serial_file, parallel_file in zip(serial.logical_files, parallel.logical_files):
+        assert parallel_file.get_frame().data.rows_count == serial_file.get_frame().data.rows_count
+
+    error_file = DlisReader(workers=3, pool=pool).process_physical_file(error_file_path)
+    assert error_file.error
+
+
+def test_read_logical_files_process_blocks():
+    assert _split_positions(3, 2) == [range(0, 2), range(2, 3)]
+    assert _split_positions(4, 4) == [range(0, 1), range(1, 2), range(2, 3), range(3, 4)]
+    # NOTE Fewer workers than logical files, a worker processes a block of them
+    serial = DlisReader(columnar=True).process_physical_file(file_path)
+    parallel = DlisReader(columnar=True, workers=2, pool='process').process_physical_file(file_path)
+    assert [file.logical_id for file in parallel.logical_files] == [file.logical_id for file in serial.logical_files]
@@ -3,7 +3,7 @@ from pathlib import Path
 from lasio import LASFile
 
 from wellbelog.belolas.functions import open_las_file, process_curves_items
-from wellbelog.schemas.las import LasCurvesSpecs
+from wellbelog.schemas.las import LasCurvesSpecs, LasCurvesTable
 
 
 folder_path = Path(__file__).parent.parent / 'test_files'
@@ -18,6 +18,8 @@ def test_open_las_file():
 def test_process_curves_items():
     las_file = open_las_file(file_path)
     curves = process_curves_items(las_file)
-    assert isinstance(curves, list)
+    assert isinstance(curves, LasCurvesTable)
     assert len(curves) > 0
-    assert isinstance(curves[0], LasCurvesSpecs)
+    assert curves[0].mnemonic == curves.names[0] == las_file.curves[0].mnemonic
+    assert curves[0].shape == las_file.curves[0].data.shape
+    assert isinstance(curves.model(0), LasCurvesSpecs)
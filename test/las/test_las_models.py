@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pandas as pd
+import pytest
 from rich.table import Table
 
 from wellbelog.belolas.reader import LasReader
@@ -20,6 +22,8 @@ def test_lasfile_schema():
 
     gr_curve = las_file.get_curve('GR')
     assert isinstance(gr_curve, LasCurvesSpecs)
+    assert gr_curve.unit == las_file.specs.get('GR').unit
+    assert las_file.get_curve('MISSING') is None
 
 
 def test_tableview():
@@ -28,3 +32,37 @@ def test_tableview():
     table = las_file.table_view()
     assert isinstance(table, Table)
     assert ['File Name', 'Curves', 'Error'] == [column.header for column in table.columns]
+
+
+def test_columnar_las_data():
+    reader = LasReader(columnar=True)
+    las_file = reader.process_las_file(file_path)
+    assert las_file.data.is_columnar
+    assert las_file.data.index_name == 'DEPT'
+    assert las_file.data.columns_names == las_file.curves_names
+
+    df = las_file.data.as_df()
+    assert 'DEPT' in df.columns
+    assert df.shape == las_file.data.shape
+    assert las_file.data.rows_count == df.shape[0]
+
+
+def test_las_parquet(tmp_path):
+    pytest.importorskip('pyarrow')
+    las_file = LasReader(columnar=True).process_las_file(file_path)
+    path = las_file.to_parquet(tmp_path / 'file.parquet', compression='snappy')
+
+    loaded = LasFileModel.read_parquet(path)
+    assert loaded.file_name == las_file.file_name
+    assert loaded.data.shape == las_file.data.shape
+    assert [spec.unit for spec in loaded.specs] == [spec.unit for spec in las_file.specs]
+    pd.testing.assert_frame_equal(loaded.data.as_df(), las_file.data.as_df())
+
+
+def test_las_slice_depth():
+    records = LasReader().process_las_file(file_path)
+    columnar = LasReader(columnar=True).process_las_file(file_path)
+    expected = columnar.slice_depth(1500, 1510, curves=['GR'], as_dataframe=True)
+    assert list(expected.columns) == ['DEPT', 'GR']
+    assert expected['DEPT'].between(1500, 1510).all()
+    pd.testing.assert_frame_equal(records.slice_depth(1500, 1510, curves=['GR'], as_dataframe=True), expected)
@@ -1,7 +1,14 @@
 from pathlib import Path
 from dlisio import lis
+import numpy as np
+import pytest
 
-from wellbelog.belolis.functions import read_lis_file, parse_lis_physical_file
+from wellbelog.belolis import functions
+from wellbelog.belolis.functions import (
+    read_lis_file, parse_lis_physical_file, iter_curves_chunks, read_format_spec, get_curves
+)
+from wellbelog.belolis.reader import LisReader
+from wellbelog.synthetic import write_lis
 
 folder_path = Path(__file__).parent.parent / 'test_files'
 file_path = f'{folder_path}/1-MPE-3-AL.lis'
@@ -18,3 +25,51 @@ def test_parse_physical_file():
     assert isinstance(lis_logical, list)
     assert isinstance(lis_logical[0], lis.LogicalFile)
     assert len(lis_logical) > 0
+
+
+def test_iter_curves_chunks():
+    lis_logical = parse_lis_physical_file(read_lis_file(file_path))[1]
+    spec = lis_logical.data_format_specs()[1]
+    chunks = list(iter_curves_chunks(lis_logical, spec, chunk_size=100))
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert np.array_equal(np.concatenate(chunks), lis.curves(lis_logical, spec))
+
+
+def test_reader_curves_chunks():
+    reader = LisReader()
+    chunks = list(reader.iter_curves_chunks(file_path, logical_file=1, format_spec=1, chunk_size=100, as_dataframe=True))
+    assert sum(len(chunk) for chunk in chunks) == 8953
+
+
+@pytest.mark.parametrize('synthetic', [False, True])
+def test_read_format_spec_per_rate(tmp_path, monkeypatch, synthetic):
+    path = str(write_lis(tmp_path / 'fast.lis', samples=200, array_curves=1, array_shape=(4,))) if synthetic else file_path
+    with lis.load(path) as files:
+        specs = [(logical_file, spec) for logical_file in files for spec in logical_file.data_format_specs()]
+        assert specs and not any(functions._has_fast_strings(spec) for _, spec in specs)
+        one_pass = [read_format_spec(logical_file, spec, null_values=set()) for logical_file, spec in specs]
+        # NOTE The format specs with fast string channels are read per sample rate, forced here
+        monkeypatch.setattr(functions, '_has_fast_strings', lambda format_spec: True)
+        per_rate = [read_format_spec(logical_file, spec, null_values=set()) for logical_file, spec in specs]
+
+    for expected, data in zip(one_pass, per_rate):
+        assert data.dtype == expected.dtype
+        for name in expected.dtype.names:
+            np.testing.assert_array_equal(data[name], expected[name])
+    if synthetic:
+        assert any(expected.dtype[name].ndim for expected in one_pass for name in expected.dtype.names)
+
+
+def test_read_format_spec_without_internals(monkeypatch):
+    with lis.load(file_path) as files:
+        logical_file = files[1]
+        expected = [read_format_spec(logical_file, spec) for spec in logical_file.data_format_specs()]
+        # NOTE Without the dlisio internals, the format specs are read with lis.curves
+        monkeypatch.setattr(functions, 'ONE_PASS_READING', False)
+        curves = get_curves(logical_file)
+
+    assert len(curves) == len(expected)
+    for data, df in zip(expected, curves):
+        assert list(df.columns) == [name.strip() for name in data.dtype.names]
+        for name in data.dtype.names:
+            np.testing.assert_array_equal(df[name.strip()].to_numpy(), data[name])
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 
 from wellbelog.belolis.reader import LisReader
 from wellbelog.schemas.lis import PhysicalLisFileModel, LogicalLisFileModel, FrameLisCurves
@@ -61,3 +63,44 @@ def test_lis_logical_file_table():
     assert table.columns[2].header == 'Curves'
     assert table.columns[3].header == 'Error'
     assert table.title == '1-MPE-3-AL.lis'
+
+
+def test_lis_columnar_frames():
+    file = LisReader(columnar=True).process_physical_file(file_path)
+    logical_file = file.logical_files[1]
+    frame = logical_file.frames[1]
+    assert frame.is_columnar
+    assert frame.index_name == 'DEPT'
+    assert 'SP' in logical_file.curves_names
+
+    records = LisReader().process_physical_file(file_path).logical_files[1].frames[1].data
+    assert len(frame.records()) == len(records)
+    assert frame.records()[1] == pytest.approx(records[1])
+
+
+def test_lis_parquet(tmp_path):
+    pytest.importorskip('pyarrow')
+    from wellbelog.utils.arrow import read_parquet, table_channels
+
+    logical_file = LisReader(columnar=True).process_physical_file(file_path).logical_files[1]
+    path = logical_file.to_parquet(tmp_path / 'frame.parquet', index=1)
+
+    loaded = FrameLisCurves.read_parquet(path)
+    assert loaded.logical_file_id == logical_file.frames[1].logical_file_id
+    assert loaded.rows_count == 8953
+    assert table_channels(read_parquet(path))['GR']['units'] == 'GAPI'
+
+
+def test_lis_slice_depth():
+    logical_file = LisReader(columnar=True).process_physical_file(file_path).logical_files[1]
+    rows = logical_file.slice_depth(500, 510, curves=['GR'], index=1)
+    assert list(rows.keys()) == ['DEPT', 'GR']
+    assert len(rows['DEPT']) > 0
+    assert ((rows['DEPT'] >= 500) & (rows['DEPT'] <= 510)).all()
+
+
+def test_lis_mask_nulls():
+    frame = LisReader(columnar=True, mask_nulls=True).process_physical_file(file_path).logical_files[1].frames[1]
+    df = frame.as_df()
+    assert not df.isin([-999.25]).any().any()
+    assert df.isna().any().any()
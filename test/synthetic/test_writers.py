@@ -0,0 +1,83 @@
+import numpy as np
+from dlisio import lis
+
+from wellbelog.belodlis.reader import DlisReader
+from wellbelog.belolas.reader import LasReader
+from wellbelog.belolis.reader import LisReader
+from wellbelog.schemas.synthetic import SyntheticLogSpec
+from wellbelog.synthetic import write_dlis, write_las, write_lis
+from wellbelog.synthetic import lis as synthetic_lis
+from wellbelog.synthetic.lis import HEADER_DATE, lis_f32
+from wellbelog.utils.nullvalues import replace_null_values
+
+spec = SyntheticLogSpec(
+    samples=500, curves=3, array_curves=1, array_shape=(4,), logical_files=2, null_density=0.1, decreasing=True,
+)
+
+
+def test_write_las(tmp_path):
+    path = write_las(tmp_path / 'synthetic.las', spec)
+    model = LasReader(columnar=True, mask_nulls=True).process_las_file(path)
+    assert not model.error
+    assert model.data.columns_names == ['DEPT', 'CURVE0', 'CURVE1', 'CURVE2'] + [f'ARRAY0[{i}]' for i in range(4)]
+    depth = model.data.arrays['DEPT']
+    assert len(depth) == 500 and depth[0] == spec.top and np.all(np.diff(depth) < 0)
+    assert 0.05 < np.isnan(model.data.arrays['CURVE0']).mean() < 0.15
+
+
+def test_write_dlis(tmp_path):
+    path = write_dlis(tmp_path / 'synthetic.dlis', spec.model_copy(update={'frames': 2, 'array_shape': (4, 2)}))
+    model = DlisReader(columnar=True, mask_nulls=True).process_physical_file(path)
+    assert not model.error
+    assert len(model.logical_files) == 2 and not model.error_files
+    first, second = model.logical_files[0].frames
+    assert first.data.arrays['ARRAY0'].shape == (500, 4, 2)
+    assert len(second.data.arrays['DEPT']) == 250
+    assert first.channels_metadata()['CURVE0']['units'] == 'GAPI'
+    assert 0.05 < np.isnan(first.data.arrays['CURVE0']).mean() < 0.15
+
+
+def test_write_dlis_large_rows(tmp_path):
+    # NOTE Rows larger than a visible record are split in segments
+    path = write_dlis(tmp_path / 'synthetic.dlis', samples=20, curves=1, array_curves=1, array_shape=(3000,))
+    frame = DlisReader(columnar=True).process_physical_file(path).logical_files[0].frames[0]
+    assert frame.data.arrays['ARRAY0'].shape == (20, 3000)
+
+
+def test_write_lis(tmp_path):
+    path = write_lis(tmp_path / 'synthetic.lis', spec)
+    model = LisReader(columnar=True, mask_nulls=True).process_physical_file(path)
+    assert not model.error
+    assert len(model.logical_files) == 2
+    logical_file = model.logical_files[0]
+    # NOTE The fast channels share the depth of the frame, as 2D arrays
+    frame, = logical_file.frames
+    assert frame.columns_names == ['DEPT', 'C0', 'C1', 'C2', 'A0']
+    assert len(frame.arrays['DEPT']) == 500 and frame.arrays['A0'].shape == (500, 4)
+    assert 0.05 < np.isnan(frame.arrays['C0']).mean() < 0.15
+    assert [(layout.sample_rate, layout.channels, layout.samples) for layout in logical_file.sample_rates] == [
+        (1, ['C0', 'C1', 'C2'], 500), (4, ['A0'], 2000),
+    ]
+
+    with lis.load(path) as files:
+        fast = lis.curves(files[0], files[0].data_format_specs()[0], sample_rate=4)
+    np.testing.assert_array_equal(frame.arrays['A0'].ravel(), replace_null_values(fast['A0  ']))
+
+    # NOTE The headers have a fixed date, the same spec writes the same bytes on any day
+    content = open(path, 'rb').read()
+    assert HEADER_DATE.encode('ascii') in content
+    assert open(write_lis(tmp_path / 'again.lis', spec), 'rb').read() == content
+
+
+def test_lis_f32(tmp_path, monkeypatch):
+    values = np.array([-999.25, -0.5, 0.5, -1.0, 3.14159, -1e-5, 1e6, 0.0], dtype=np.float32)
+    assert lis_f32(values[:1]).tobytes() == bytes.fromhex('ba831800')
+
+    # NOTE The values are written as the curve of a file, and decoded back by dlisio
+    depth = 1000.0 + 0.1524 * np.arange(len(values))
+    monkeypatch.setattr(synthetic_lis, 'iter_frame_chunks', lambda *args, **kwargs: iter([{'DEPT': depth, 'CURVE0': values}]))
+    path = write_lis(tmp_path / 'synthetic.lis', samples=len(values), curves=1, null_value=-1.0e30)
+    with lis.load(path) as files:
+        curves = lis.curves(files[0], files[0].data_format_specs()[0])
+    np.testing.assert_allclose(curves['DEPT'], depth, rtol=1e-6)
+    np.testing.assert_array_equal(curves['C0  '], values)
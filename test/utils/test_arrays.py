@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from wellbelog.utils.arrays import DepthIndex, arrays_to_df, iter_depth_windows, structured_to_arrays
+
+
+def test_structured_to_arrays():
+    values = np.zeros(3, dtype=[('INDEX', 'f8'), ('GR  ', 'f4'), ('IMG', 'f4', (2,))])
+    arrays = structured_to_arrays(values)
+    assert list(arrays.keys()) == ['DEPT', 'GR', 'IMG']
+    assert np.shares_memory(arrays['GR'], values)
+
+    df = arrays_to_df(arrays)
+    assert isinstance(df, pd.DataFrame)
+    assert list(df.columns) == ['DEPT', 'GR', 'IMG[0]', 'IMG[1]']
+
+
+def test_depth_windows():
+    values = np.zeros(10, dtype=[('DEPT', 'f8'), ('GR', 'f4')])
+    # NOTE A decreasing index, like an up log
+    values['DEPT'] = np.arange(100, 90, -1)
+    chunks = [values[i:i + 3] for i in range(0, 10, 3)]
+    windows = list(iter_depth_windows(chunks, 'DEPT', 4))
+    assert [len(window) for window in windows] == [4, 4, 2]
+    assert windows[1]['DEPT'][0] == 96
+    assert np.array_equal(np.concatenate(windows), values)
+
+
+def test_depth_index():
+    increasing = np.arange(10.0)
+    index = DepthIndex(increasing)
+    assert index.direction == 'INCREASING'
+    assert index.rows(2, 4.5) == slice(2, 5)
+
+    decreasing = increasing[::-1]
+    index = DepthIndex(decreasing)
+    assert index.direction == 'DECREASING'
+    assert list(decreasing[index.rows(4.5, 2)]) == [4, 3, 2]
+
+    # NOTE A repeated section, the rows are found through the sort order
+    repeated = np.array([1.0, 2.0, 3.0, 2.0, 3.0, 4.0])
+    index = DepthIndex(repeated)
+    assert index.direction is None
+    assert list(index.rows(2, 3)) == [1, 2, 3, 4]
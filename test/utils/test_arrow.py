@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from wellbelog.utils.arrow import arrays_to_table, table_channels, table_metadata, table_to_arrays  # noqa
+
+
+def test_arrays_table_round_trip():
+    arrays = {
+        'DEPT': np.arange(5, dtype='f8'),
+        'GR': np.arange(5, dtype='f4'),
+        'IMG': np.arange(30, dtype='i2').reshape(5, 3, 2),
+    }
+    table = arrays_to_table(arrays, channels={'GR': {'units': 'gAPI'}}, metadata={'file_name': 'test'})
+    assert table_metadata(table) == {'file_name': 'test'}
+    assert table_channels(table)['GR'] == {'units': 'gAPI'}
+    assert table_channels(table)['IMG'] == {}
+
+    loaded = table_to_arrays(table)
+    for name, values in arrays.items():
+        assert loaded[name].dtype == values.dtype
+        assert np.array_equal(loaded[name], values)
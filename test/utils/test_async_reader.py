@@ -0,0 +1,72 @@
+import asyncio
+from pathlib import Path
+import time
+
+import pytest
+
+from wellbelog.async_reader import AsyncMainReader
+from wellbelog.main_reader import MainReader
+
+files_path = Path(__file__).parent.parent / 'test_files'
+paths = [
+    files_path / '1-MPE-3-AL.lis',
+    files_path / '1PIR1AL_conv_ccl_canhoneio.dlis',
+    files_path / '1-MPE-3-AL_hals-dslt-tdd-hgns-gr_resistividade_repetida.las',
+    files_path / 'unsupported.txt',
+]
+
+
+class SlowReader(MainReader):
+    """
+    A reader that takes a while for the files named slow.
+    """
+
+    def load_file(self, path: str, choice=None):
+        if 'slow' in str(path):
+            time.sleep(1)
+        return super().load_file(path, choice)
+
+
+def test_async_load_file():
+    async def main():
+        async with AsyncMainReader() as reader:
+            model = await reader.load_file(paths[1])
+            assert model.file_name == '1PIR1AL_conv_ccl_canhoneio.dlis'
+            with pytest.raises(ValueError):
+                await reader.load_file(paths[3])
+
+    asyncio.run(main())
+
+
+def test_async_load_many():
+    async def source():
+        for path in paths:
+            yield path
+
+    async def main():
+        async with AsyncMainReader(max_concurrency=2) as reader:
+            return {Path(result.path).name: result async for result in reader.load_many(source())}
+
+    results = asyncio.run(main())
+    assert len(results) == 4
+    assert results['1-MPE-3-AL.lis'].model.file_name == '1-MPE-3-AL.lis'
+    assert results['unsupported.txt'].error
+
+
+def test_async_timeout_and_cancel():
+    async def main():
+        async with AsyncMainReader(reader=SlowReader(), max_concurrency=1, timeout=0.1) as reader:
+            with pytest.raises(asyncio.TimeoutError):
+                await reader.load_file('slow.las')
+
+            result = await reader.load_result('slow.las')
+            assert result.error
+            assert 'Timed out' in result.error_message
+
+            # NOTE Stopping the iteration cancels the files that are waiting
+            results = reader.load_many(['slow.las'] * 10 + [str(paths[2])], timeout=5)
+            first = await results.__anext__()
+            await results.aclose()
+            assert first.path == 'slow.las'
+
+    asyncio.run(main())
@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from wellbelog.belodlis.reader import DlisReader
+from wellbelog.belolas.reader import LasReader
+from wellbelog.belolis.reader import LisReader
+from wellbelog.utils import binary
+from wellbelog.utils.store import model_dataframes
+
+folder_path = Path(__file__).parent.parent / 'test_files'
+dlis_path = folder_path / '1PIR1AL_conv_ccl_canhoneio.dlis'
+lis_path = folder_path / '1-MPE-3-AL.lis'
+las_path = folder_path / '1-MPE-3-AL_hals-dslt-tdd-hgns-gr_resistividade_repetida.las'
+
+
+@pytest.mark.parametrize('read', [
+    lambda: DlisReader(columnar=True).process_physical_file(dlis_path),
+    lambda: LisReader().process_physical_file(str(lis_path)),
+    lambda: LasReader(columnar=True).process_las_file(las_path),
+])
+def test_binary_round_trip(read):
+    model = read()
+    data = binary.dumps(model)
+    loaded = binary.loads(data)
+    assert type(loaded) is type(model)
+    assert loaded.file_name == model.file_name
+    for original, frame in zip(model_dataframes(model), model_dataframes(loaded)):
+        assert frame.columns_names == original.columns_names
+        for name, values in frame.arrays.items():
+            np.testing.assert_array_equal(values, original.as_arrays()[name])
+
+
+def test_binary_file(tmp_path):
+    model = DlisReader(columnar=True).process_physical_file(dlis_path)
+    path = binary.dump(model, tmp_path / 'file.wblg')
+    loaded = binary.load(path, mmap=True)
+    frame = loaded.logical_files[0].get_frame()
+    assert frame.data.rows_count == model.logical_files[0].get_frame().data.rows_count
+    assert not frame.data.arrays['TDEP'].flags.writeable
+
+    with pytest.raises(ValueError):
+        binary.loads(b'not a model')
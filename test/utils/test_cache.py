@@ -0,0 +1,114 @@
+from pathlib import Path
+import pickle
+import tempfile
+
+from wellbelog.belodlis import reader as dlis_reader_module
+from wellbelog.belodlis.reader import DlisReader
+from wellbelog.belolas.reader import LasReader
+from wellbelog.main_reader import MainReader
+from wellbelog.utils.cache import ParseCache
+
+folder_path = Path(__file__).parent.parent / 'test_files'
+dlis_path = folder_path / '1PIR1AL_conv_ccl_canhoneio.dlis'
+las_path = folder_path / '1-MPE-3-AL_hals-dslt-tdd-hgns-gr_resistividade_repetida.las'
+
+
+def test_cache_hit_skips_dlisio(monkeypatch):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ParseCache(temp_dir)
+        reader = DlisReader(cache=cache)
+        physical_file = reader.process_physical_file(dlis_path)
+        assert cache.misses == 1
+        assert len(cache.entries()) == 1
+
+        # NOTE On a hit, the file is not opened again
+        def fail(*args, **kwargs):
+            raise AssertionError('dlisio should not be called')
+        monkeypatch.setattr(dlis_reader_module, 'open_dlis_file', fail)
+        cached = reader.process_physical_file(dlis_path)
+        assert cache.hits == 1
+        assert cached.curves_names == physical_file.curves_names
+        assert cached.logical_files[0].get_frame().data.as_df().equals(physical_file.logical_files[0].get_frame().data.as_df())
+
+
+def test_cache_key_options():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ParseCache(temp_dir)
+        LasReader(cache=cache).process_las_file(las_path)
+        columnar = LasReader(cache=cache, columnar=True).process_las_file(las_path)
+        assert cache.misses == 2
+        assert columnar.data.is_columnar
+
+        # NOTE The content hash gives the same key for the same file
+        hash_cache = ParseCache(temp_dir, use_hash=True)
+        assert hash_cache.key(las_path, 'LasReader') == hash_cache.key(str(las_path), 'LasReader')
+
+
+def test_cache_eviction():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ParseCache(temp_dir)
+        reader = MainReader(cache=cache)
+        reader.load_file(las_path)
+        las_size = cache.size
+        reader.load_file(dlis_path)
+        assert len(cache.entries()) == 2
+
+        # NOTE Reading the las file again makes it the most recently used
+        reader.load_file(las_path)
+        assert cache.hits == 1
+        cache.max_size = las_size
+        cache.evict()
+        entries = cache.entries()
+        assert len(entries) == 1
+        assert entries[0].stat().st_size == las_size
+
+        cache.clear()
+        assert cache.size == 0
+
+
+def test_lazy_files_are_not_cached():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ParseCache(temp_dir)
+        DlisReader(cache=cache, lazy=True).process_physical_file(dlis_path)
+        assert not cache.entries()
+
+
+def test_cache_set_does_not_scan(monkeypatch):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ParseCache(temp_dir)
+        scans = []
+        entries = cache.entries
+        monkeypatch.setattr(cache, 'entries', lambda: scans.append(1) or entries())
+
+        # NOTE The folder is scanned once, on the first write
+        for i in range(5):
+            cache.set(f'key{i}', list(range(1000)))
+        assert len(scans) == 1
+        size = cache.size
+        cache.set('key0', list(range(10)))
+        assert cache._size == cache.size < size
+
+        # NOTE Over max_size, the folder is scanned and the old entries are removed
+        cache.max_size = cache.size
+        scans.clear()
+        cache.set('key5', list(range(1000)))
+        assert len(scans) == 1
+        assert len(cache.entries()) == 5 and cache._size == cache.size <= cache.max_size
+
+
+def test_cache_counts_other_processes():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ParseCache(temp_dir)
+        cache.set('key0', list(range(1000)))
+        entry_size = cache.size
+        cache.max_size = 20 * entry_size
+        # NOTE A pickled copy, like the cache of a load_many worker, tracks only its own writes
+        other = pickle.loads(pickle.dumps(cache))
+        for i in range(1, 16):
+            other.set(f'key{i}', list(range(1000)))
+
+        # NOTE The folder is scanned again after writing a fraction of max_size, with the other entries
+        for i in range(16, 21):
+            cache.set(f'key{i}', list(range(1000)))
+        assert cache._size == cache.size <= cache.max_size
+        assert len(cache.entries()) == 20
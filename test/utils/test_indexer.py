@@ -0,0 +1,98 @@
+import os
+from pathlib import Path
+import shutil
+
+import pytest
+from sqlalchemy import func, select
+
+from wellbelog.db import SqlSink
+from wellbelog.indexer import DEFAULT_SUFFIXES, MANIFEST_NAME, ArchiveIndexer
+from wellbelog.utils.scanner import EXTENSIONS
+from wellbelog.utils.walk import walk_files
+
+folder_path = Path(__file__).parent.parent / 'test_files'
+dlis_name = '1PIR1AL_conv_ccl_canhoneio.dlis'
+lis_name = '1-MPE-3-AL.lis'
+las_name = '1-MPE-3-AL_hals-dslt-tdd-hgns-gr_resistividade_repetida.las'
+
+
+@pytest.fixture
+def archive(tmp_path):
+    root = tmp_path / 'archive'
+    (root / 'well_a' / 'run_1').mkdir(parents=True)
+    (root / 'well_b').mkdir()
+    shutil.copy(folder_path / dlis_name, root / 'well_a' / 'run_1' / dlis_name)
+    shutil.copy(folder_path / lis_name, root / 'well_b' / lis_name.upper())
+    shutil.copy(folder_path / las_name, root / 'well_b' / las_name)
+    (root / 'well_b' / 'notes.txt').write_text('not a log')
+    return root
+
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_walk_files(archive, workers):
+    files = sorted(walk_files(archive, suffixes=['.dlis', '.lis', '.las'], workers=workers))
+    assert [Path(stat.path).name for stat in files] == [dlis_name, lis_name.upper(), las_name]
+    assert files[0].size == (folder_path / dlis_name).stat().st_size
+    assert len(list(walk_files(archive, workers=workers))) == 4
+
+
+
+def test_default_suffixes(archive):
+    # NOTE The TIF files can wrap DLIS or LIS files, they are indexed like the scanner finds them
+    shutil.copy(folder_path / dlis_name, archive / 'well_a' / 'RUN_2.TIF')
+    indexer = ArchiveIndexer(archive, workers=1)
+    assert set(DEFAULT_SUFFIXES) == set(EXTENSIONS)
+    added = indexer.plan(indexer.load_manifest()).added
+    assert 'well_a/RUN_2.TIF' in [indexer.relative_path(stat.path) for stat in added]
+
+
+def test_incremental_runs(archive):
+    sink = SqlSink('sqlite://')
+    indexer = ArchiveIndexer(archive, sink=sink, workers=1)
+    report = indexer.run()
+    assert sorted(report.added) == sorted([f'well_a/run_1/{dlis_name}', f'well_b/{las_name}', f'well_b/{lis_name.upper()}'])
+    assert not report.errors
+    assert (archive / MANIFEST_NAME).is_file()
+    entries = indexer.load_manifest().entries
+    assert all(entry.status == 'ok' and entry.file_id is not None for entry in entries.values())
+
+    # NOTE Nothing changed, nothing is read
+    read = []
+    report = indexer.run(on_result=read.append)
+    assert not report.changed and report.unchanged == 3 and not read
+
+    # NOTE A modified file is read again, and its old record is replaced in the sink
+    las_path = archive / 'well_b' / las_name
+    las_path.write_text(las_path.read_text() + '\n')
+    (archive / 'well_a' / 'run_1' / dlis_name).unlink()
+    report = indexer.run(on_result=read.append)
+    assert report.modified == [f'well_b/{las_name}']
+    assert report.deleted == [f'well_a/run_1/{dlis_name}']
+    assert [Path(result.path).name for result in read] == [las_name]
+    entries = indexer.load_manifest().entries
+    assert sorted(entries) == [f'well_b/{lis_name.upper()}', f'well_b/{las_name}']
+    with sink.engine.connect() as connection:
+        assert connection.execute(select(func.count()).select_from(sink.tables['files'])).scalar() == 2
+    assert sink.read(entries[f'well_b/{las_name}'].file_id).file_name == las_name
+
+
+def test_touched_files_with_hash(archive):
+    indexer = ArchiveIndexer(archive, use_hash=True, workers=1)
+    indexer.run()
+    lis_path = archive / 'well_b' / lis_name.upper()
+    os.utime(lis_path, ns=(0, 0))
+    report = indexer.run()
+    assert not report.changed and report.unchanged == 3
+    assert indexer.load_manifest().entries[f'well_b/{lis_name.upper()}'].mtime_ns == 0
+
+
+def test_errors_are_retried(archive, tmp_path):
+    (archive / 'broken.dlis').write_bytes(b'not a dlis file')
+    manifest_path = tmp_path / 'manifest.json'
+    report = ArchiveIndexer(archive, manifest_path=manifest_path, workers=1).run()
+    assert report.errors == ['broken.dlis']
+    assert manifest_path.is_file() and not (archive / MANIFEST_NAME).exists()
+
+    assert ArchiveIndexer(archive, manifest_path=manifest_path, workers=1).run().unchanged == 4
+    report = ArchiveIndexer(archive, manifest_path=manifest_path, workers=1, retry_errors=True).run()
+    assert report.modified == ['broken.dlis'] and report.errors == ['broken.dlis']
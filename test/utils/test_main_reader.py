@@ -1,5 +1,9 @@
-from wellbelog.main_reader import MainReader
+from wellbelog.main_reader import MainReader, load_file_timed
+from wellbelog.schemas.batch import ReaderChoice
 from pathlib import Path
+import shutil
+
+import pytest
 
 folder_path = Path(__file__).parent / 'test_files'
 lis = f'{folder_path}/1-MPE-3-AL.lis'
@@ -18,3 +22,81 @@ def test_main_reader():
 
     las_file = reader.load_file(las)
     assert las_file.file_name == '1-MPE-3-AL.las'
+
+
+def test_load_many():
+    files_path = Path(__file__).parent.parent / 'test_files'
+    paths = [
+        files_path / '1-MPE-3-AL.lis',
+        files_path / '1PIR1AL_conv_ccl_canhoneio.dlis',
+        files_path / '1-MPE-3-AL_hals-dslt-tdd-hgns-gr_resistividade_repetida.las',
+        files_path / 'unsupported.txt',
+    ]
+    reader = MainReader()
+    results = {Path(result.path).name: result for result in reader.load_many(paths, workers=2)}
+    assert len(results) == 4
+
+    assert results['1-MPE-3-AL.lis'].model.file_name == '1-MPE-3-AL.lis'
+    assert results['1PIR1AL_conv_ccl_canhoneio.dlis'].model.logical_files_count > 0
+    assert results['1-MPE-3-AL_hals-dslt-tdd-hgns-gr_resistividade_repetida.las'].error is False
+    assert results['1-MPE-3-AL.lis'].elapsed > 0
+
+    # NOTE The error is isolated in its own result
+    assert results['unsupported.txt'].error
+    assert 'Unsupported file type' in results['unsupported.txt'].error_message
+    assert results['unsupported.txt'].model is None
+
+
+def test_scan():
+    files_path = Path(__file__).parent.parent / 'test_files'
+    reader = MainReader()
+
+    dlis_header = reader.scan(files_path / '1PIR1AL_conv_ccl_canhoneio.dlis')
+    assert dlis_header.file_type == 'dlis'
+    assert len(dlis_header.logical_files) == 3
+    frame = dlis_header.logical_files[0].frames[0]
+    assert frame.index_name == 'TDEP'
+    assert frame.samples == 765
+    assert frame.start > frame.stop
+    assert 'CCL' in dlis_header.curves_names
+
+    lis_header = reader.scan(files_path / '1-MPE-3-AL.lis')
+    assert lis_header.file_type == 'lis'
+    assert lis_header.logical_files[1].frames[-1].samples == 8953
+    assert 'GR' in lis_header.curves_names
+
+    las_header = reader.scan(files_path / '1-MPE-3-AL_hals-dslt-tdd-hgns-gr_resistividade_repetida.las')
+    assert las_header.file_type == 'las'
+    assert las_header.logical_files[0].frames[0].samples == 519
+    assert las_header.curves_names[0] == 'DEPT'
+
+
+def test_choose_reader(tmp_path):
+    files_path = Path(__file__).parent.parent / 'test_files'
+    las_path = files_path / '1-MPE-3-AL_hals-dslt-tdd-hgns-gr_resistividade_repetida.las'
+    shutil.copy(las_path, tmp_path / 'mislabeled.dlis')
+    shutil.copy(files_path / '1PIR1AL_conv_ccl_canhoneio.dlis', tmp_path / 'run.tiff')
+    shutil.copy(files_path / '1-MPE-3-AL.lis', tmp_path / 'run')
+
+    # NOTE The content sends the files straight to their readers, whatever the extension
+    reader = MainReader()
+    results = {Path(result.path).name: result for result in reader.load_many(sorted(tmp_path.iterdir()), workers=1)}
+    assert results['mislabeled.dlis'].model.file_name == 'mislabeled.dlis'
+    assert results['mislabeled.dlis'].choice == ReaderChoice(file_type='las', detected_by='content')
+    assert results['run.tiff'].choice.file_type == 'dlis'
+    assert results['run'].choice.file_type == 'lis'
+    assert results['run'].model.logical_files
+    assert not any(result.choice.used_fallback for result in results.values())
+
+    # NOTE Without sniffing, the extension is used, and the fallback reader is tried
+    choice = MainReader(sniff=False).choose_reader(files_path / '1PIR1AL_conv_ccl_canhoneio.dlis')
+    assert choice == ReaderChoice(file_type='dlis', detected_by='extension', fallback='lis')
+    # NOTE The storage unit label is missing, so the extension is used even with sniffing
+    result = load_file_timed(MainReader(), str(files_path / '1PIR1AL_conv_ccl_canhoneio-error.dlis'))
+    assert result.choice.detected_by == 'extension'
+    # NOTE The TIF files not recognized by their content are read as DLIS, then LIS, with both extensions
+    for name in ('unknown.tif', 'UNKNOWN.TIFF'):
+        (tmp_path / name).write_bytes(b'\x00' * 64)
+        assert MainReader().choose_reader(tmp_path / name) == ReaderChoice(file_type='dlis', detected_by='extension', fallback='lis')
+    with pytest.raises(ValueError, match='Unsupported file type'):
+        MainReader(sniff=False).choose_reader(tmp_path / 'run')
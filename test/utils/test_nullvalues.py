@@ -0,0 +1,26 @@
+import numpy as np
+import pandas as pd
+
+from wellbelog.utils.nullvalues import null_mask, replace_null_values
+
+
+def test_null_mask():
+    values = np.array([1.0, -999.25, -9999.999, -999.2500001, -999.5], dtype='f4')
+    assert list(null_mask(values)) == [False, True, True, True, False]
+    assert list(null_mask(values, null_values={-999.5})) == [False, False, False, False, True]
+    # NOTE The integer arrays can not hold NaN, they are never masked
+    assert not null_mask(np.array([-999, 1])).any()
+
+
+def test_replace_null_values_in_place():
+    structured = np.zeros(3, dtype=[('FRAMENO', 'i4'), ('DEPT', 'f8'), ('IMG', 'f4', (2,))])
+    structured['FRAMENO'] = -999
+    structured['IMG'][1] = -999.25
+    assert replace_null_values(structured) is structured
+    assert (structured['FRAMENO'] == -999).all()
+    assert np.isnan(structured['IMG'][1]).all()
+    assert not np.isnan(structured['IMG'][0]).any()
+
+    df = pd.DataFrame({'GR': [10.0, -999.25], 'NAME': ['a', 'b']})
+    replace_null_values(df)
+    assert df['GR'].isna().tolist() == [False, True]
@@ -0,0 +1,81 @@
+from pathlib import Path
+import tempfile
+
+import pytest
+
+from wellbelog.belodlis.reader import DlisReader
+from wellbelog.belolas.reader import LasReader
+from wellbelog.belolis.reader import LisReader
+from wellbelog.main_reader import MainReader
+from wellbelog.utils.cache import ParseCache
+from wellbelog.utils.profiling import NULL_PROFILE, ProfileCollector, Profiler
+
+folder_path = Path(__file__).parent.parent / 'test_files'
+dlis_path = folder_path / '1PIR1AL_conv_ccl_canhoneio.dlis'
+lis_path = folder_path / '1-MPE-3-AL.lis'
+las_path = folder_path / '1-MPE-3-AL_hals-dslt-tdd-hgns-gr_resistividade_repetida.las'
+
+
+def test_no_profiler():
+    physical_file = DlisReader().process_physical_file(dlis_path)
+    assert physical_file.profile is None
+    with NULL_PROFILE.stage('curves', 0, 0) as stage:
+        stage.bytes = 10
+    assert NULL_PROFILE.result() is None
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_dlis_profile(columnar):
+    physical_file = DlisReader(columnar=columnar, mask_nulls=True, profiler=Profiler()).process_physical_file(dlis_path)
+    profile = physical_file.profile
+    stages = profile.totals()
+    assert list(stages)[:2] == ['open', 'summary']
+    assert {'frame_metadata', 'curves', 'mask_nulls'} <= set(stages)
+    assert ('build' in stages) == columnar and ('json' in stages) != columnar
+
+    open_stage = profile.stages[0]
+    assert open_stage.bytes == dlis_path.stat().st_size and open_stage.logical_file is None
+    curves = [timing for timing in profile.stages if timing.stage == 'curves']
+    assert len(curves) == sum(len(logical_file.frames) for logical_file in physical_file.logical_files)
+    assert curves[0].samples == physical_file.logical_files[0].frames[0].data.rows_count
+    assert profile.total() >= profile.total('curves') > 0
+    assert len(profile.as_df()) == len(profile.stages)
+
+
+@pytest.mark.parametrize('pool', ['thread', 'process'])
+def test_dlis_profile_parallel(pool):
+    serial = DlisReader(profiler=Profiler()).process_physical_file(dlis_path).profile
+    parallel = DlisReader(workers=2, pool=pool, profiler=Profiler()).process_physical_file(dlis_path).profile
+    key = lambda timing: (timing.stage, timing.logical_file, timing.frame)  # noqa: E731
+    assert sorted(map(key, parallel.stages), key=str) == sorted(map(key, serial.stages), key=str)
+
+
+def test_lis_and_las_profile():
+    collector = ProfileCollector()
+    profiler = Profiler(collector, attach=False)
+    lis_file = LisReader(profiler=profiler).process_physical_file(str(lis_path))
+    las_file = LasReader(columnar=True, profiler=profiler).process_las_file(las_path)
+    assert lis_file.profile is None and las_file.profile is None
+
+    profile = collector.profile()
+    lis_stages = {timing.stage for timing in profile.stages if timing.file_name == lis_path.name}
+    las_stages = {timing.stage for timing in profile.stages if timing.file_name == las_path.name}
+    assert {'open', 'header', 'curves', 'dataframe', 'json'} <= lis_stages
+    assert las_stages == {'open', 'specs', 'build'}
+    samples = [timing.samples for timing in profile.stages if timing.stage == 'build']
+    assert samples == [las_file.data.rows_count]
+
+
+def test_main_reader_profile():
+    collector = ProfileCollector()
+    reader = MainReader(profiler=Profiler(collector))
+    results = list(reader.load_many([str(las_path), str(lis_path)], workers=2))
+    assert all(result.model.profile is not None for result in results)
+    assert {timing.file_name for timing in collector.stages} == {las_path.name, lis_path.name}
+
+
+def test_profile_not_cached():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        reader = LasReader(cache=ParseCache(temp_dir), profiler=Profiler())
+        assert reader.process_las_file(las_path).profile is not None
+        assert reader.process_las_file(las_path).profile is None
@@ -0,0 +1,36 @@
+import numpy as np
+
+from wellbelog.utils.resample import common_depth, depth_step, resample
+
+
+def test_common_depth():
+    # NOTE The axis goes through the samples of the first depth, and keeps its direction
+    assert np.allclose(common_depth([np.array([10., 9, 8]), np.array([10.5, 7.])]), [10, 9, 8, 7])
+    assert np.allclose(common_depth([np.array([1., 2, 3]), np.array([0.5, 4.])], step=0.5), np.arange(0.5, 4.1, 0.5))
+    assert depth_step(np.array([1., 1, 1.5, 2])) == 0.5
+    assert depth_step(np.array([1.])) is None
+
+
+def test_resample_linear():
+    depth = np.array([0., 1, 2, 3])
+    values = np.array([0., np.nan, 20, 30], dtype=np.float32)
+    result = resample(depth, values, np.array([-1, 0, 0.5, 2, 2.5, 3, 4]))
+    assert np.allclose(result, [np.nan, 0, np.nan, 20, 25, 30, np.nan], equal_nan=True)
+
+    # NOTE Decreasing depths, integer curves and null values
+    result = resample(depth[::-1], np.array([30, 20, -999, 0]), np.array([0.5, 1.5, 2.5]))
+    assert np.allclose(result, [np.nan, np.nan, 25], equal_nan=True)
+    assert np.isnan(resample(depth, np.arange(4.), np.array([1.5]), tolerance=0.25)).all()
+
+    # NOTE The array curves are resampled sample by sample
+    images = np.arange(8.).reshape(4, 2)
+    assert np.allclose(resample(depth, images, np.array([0.5, 3])), [[1, 2], [6, 7]])
+
+
+def test_resample_nearest():
+    depth = np.array([0., 1, 2, 3])
+    assert np.allclose(resample(depth, np.array([0, 10, 20, 30]), np.array([0.4, 0.6, 2.9]), 'nearest'), [0, 10, 30])
+    # NOTE The text curves always take the nearest sample
+    assert resample(depth, np.array(['a', 'b', 'c', 'd']), np.array([0.4, 0.6, 9])).tolist() == ['a', 'b', None]
+    # NOTE A repeated section is searched through its sort order
+    assert np.allclose(resample(np.array([0., 1, 2, 1.5, 2.5]), np.arange(5.), np.array([1.5, 2.5]), 'nearest'), [3, 4])
@@ -0,0 +1,66 @@
+from pathlib import Path
+import shutil
+import struct
+
+import pytest
+
+from wellbelog.belodlis.reader import DlisReader
+from wellbelog.belolas.reader import LasReader
+from wellbelog.main_reader import MainReader
+from wellbelog.utils.scanner import classify_file, scan_log_files
+from wellbelog.utils.sniff import sniff_bytes, sniff_file
+
+folder_path = Path(__file__).parent.parent / 'test_files'
+dlis_path = folder_path / '1PIR1AL_conv_ccl_canhoneio.dlis'
+lis_path = folder_path / '1-MPE-3-AL.lis'
+las_path = folder_path / '1-MPE-3-AL_hals-dslt-tdd-hgns-gr_resistividade_repetida.las'
+
+
+def test_sniff():
+    assert sniff_file(dlis_path) == 'dlis'
+    assert sniff_file(lis_path) == 'lis'
+    assert sniff_file(las_path) == 'las'
+    assert sniff_file(folder_path / '1PIR1AL_conv_ccl_canhoneio-error.dlis') is None
+    assert sniff_file(folder_path / 'missing.dlis') is None
+
+    assert sniff_bytes(b'\xef\xbb\xbf# comment\n\n  ~Version information\n') == 'las'
+    assert sniff_bytes(b'~WELL INFORMATION\n') is None
+    # NOTE A LIS file wrapped in TIF markers
+    lis_head = lis_path.read_bytes()[:200]
+    assert sniff_bytes(struct.pack('<III', 0, 0, 12 + 0x8C) + lis_head) == 'lis'
+    assert sniff_bytes(b'\x00' * 64) is None
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / 'a' / 'b').mkdir(parents=True)
+    shutil.copy(dlis_path, tmp_path / 'a' / 'RUN1.DLIS')
+    shutil.copy(dlis_path, tmp_path / 'a' / 'b' / 'run2.tiff')
+    shutil.copy(lis_path, tmp_path / 'a' / 'b' / 'run3')
+    shutil.copy(las_path, tmp_path / 'run4.Las')
+    shutil.copy(las_path, tmp_path / 'mislabeled.dlis')
+    (tmp_path / 'notes.txt').write_text('not a log')
+    return tmp_path
+
+
+def found(root, **kwargs) -> dict[str, str]:
+    return {Path(stat.path).name: stat.file_type for stat in scan_log_files(root, **kwargs)}
+
+
+def test_scan_log_files(tree):
+    assert found(tree) == {
+        'RUN1.DLIS': 'dlis', 'run2.tiff': 'dlis', 'run3': 'lis', 'run4.Las': 'las', 'mislabeled.dlis': 'dlis',
+    }
+    assert found(tree, sniff='all')['mislabeled.dlis'] == 'las'
+    assert found(tree, sniff='never', workers=1) == {
+        'RUN1.DLIS': 'dlis', 'run2.tiff': 'tiff', 'run4.Las': 'las', 'mislabeled.dlis': 'dlis',
+    }
+    assert found(tree, file_types=['las'], sniff='all') == {'run4.Las': 'las', 'mislabeled.dlis': 'las'}
+    assert classify_file(str(tree / 'notes.txt')) is None
+
+
+def test_readers_search_files(tree):
+    assert sorted(path.name for path in DlisReader().search_files(tree)) == ['RUN1.DLIS', 'mislabeled.dlis']
+    assert [path.name for path in LasReader().search_files(tree)] == ['run4.Las']
+    assert DlisReader().search_files(tree / 'missing') == []
+    assert len(list(MainReader().search_files(tree, file_types=['dlis', 'lis']))) == 4
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from wellbelog.belodlis.reader import DlisReader
+from wellbelog.belolas.reader import LasReader
+from wellbelog.belolis.reader import LisReader
+from wellbelog.schemas.dlis import PhysicalFileModel
+from wellbelog.schemas.las import LasFileModel
+from wellbelog.schemas.lis import PhysicalLisFileModel
+from wellbelog.utils.store import ColumnarStore, model_dataframes
+
+folder_path = Path(__file__).parent.parent / 'test_files'
+dlis_path = folder_path / '1PIR1AL_conv_ccl_canhoneio.dlis'
+lis_path = folder_path / '1-MPE-3-AL.lis'
+las_path = folder_path / '1-MPE-3-AL_hals-dslt-tdd-hgns-gr_resistividade_repetida.las'
+
+
+@pytest.mark.parametrize('read, model_class', [
+    (lambda: DlisReader().process_physical_file(dlis_path), PhysicalFileModel),
+    (lambda: LisReader(columnar=True).process_physical_file(str(lis_path)), PhysicalLisFileModel),
+    (lambda: LasReader(columnar=True).process_las_file(las_path), LasFileModel),
+])
+def test_store_round_trip(tmp_path, read, model_class):
+    model = read()
+    store = ColumnarStore(tmp_path)
+    key = store.write(model)
+    assert key in store
+    assert store.keys() == [key]
+
+    stored = store.open(key)
+    assert isinstance(stored, model_class)
+    assert stored.file_name == model.file_name
+    original_frames, stored_frames = model_dataframes(model), model_dataframes(stored)
+    assert len(stored_frames) == len(original_frames) > 0
+    for original, frame in zip(original_frames, stored_frames):
+        assert frame.columns_names == original.columns_names
+        for name, values in frame.arrays.items():
+            assert isinstance(values, np.memmap)
+            np.testing.assert_array_equal(values, original.as_arrays()[name])
+
+
+def test_store_replace_and_remove(tmp_path):
+    store = ColumnarStore(tmp_path)
+    model = LasReader().process_las_file(las_path)
+    key = store.write(model, key='well')
+    assert store.write(model, key='well') == key
+    assert store.keys() == ['well']
+
+    store.remove(key)
+    assert key not in store
+    with pytest.raises(KeyError):
+        store.open(key)
+
+
+def test_store_same_file_names(tmp_path):
+    store = ColumnarStore(tmp_path / 'store')
+    first = LasReader(columnar=True).process_las_file(las_path)
+    second = LasReader(columnar=True).process_las_file(las_path)
+    second.data.arrays = {name: values + 1 for name, values in second.data.arrays.items()}
+
+    # NOTE The same file name, read from two folders
+    keys = [
+        store.write(first, source=tmp_path / 'a' / 'run1.las'),
+        store.write(second, source=tmp_path / 'b' / 'run1.las'),
+    ]
+    assert keys[0] != keys[1]
+    assert store.write(first, source=tmp_path / 'a' / 'run1.las') == keys[0]
+    # NOTE Without the origin, the second file gets a new key instead of replacing the first
+    keys += [store.write(first), store.write(second)]
+    assert len(set(keys)) == 4 and sorted(store.keys()) == sorted(keys)
+    for key, model in zip(keys, [first, second, first, second]):
+        np.testing.assert_array_equal(store.open(key).data.arrays['GR'], model.data.arrays['GR'])
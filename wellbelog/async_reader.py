@@ -0,0 +1,201 @@
+import asyncio
+from collections import abc
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import AsyncIterable, AsyncIterator, Iterable, Optional, Union
+
+from . import main_reader
+from .main_reader import MainReader, ReaderReturnType, _init_worker, _worker_load_file, load_file_timed
+from .schemas.batch import FileLoadResult
+from .utils.logging import setup_logger
+
+PathsSource = Union[Iterable[str], AsyncIterable[str]]
+"""The paths given to AsyncMainReader.load_many, a sync or an async iterable."""
+
+
+def _worker_read_file(path: str) -> ReaderReturnType:
+    """
+    Reads a file inside a worker process, raising the reader errors.
+    """
+    return main_reader._worker_reader.load_file(path)
+
+
+class AsyncMainReader:
+    """
+    An asyncio front-end for the MainReader.
+    The files are read in an executor, so the event loop is never blocked by dlisio or lasio.
+
+    At most `max_concurrency` files are read at once. The other calls wait for a free slot,
+    and `load_many` only takes the next path from its source when a slot is free.
+
+    NOTE A running thread or process can not be stopped. When a file times out, or its task is cancelled,
+    the caller gets the result at once and the slot is released, but the executor keeps reading the file
+    in the background. The executors created by this class have room for that.
+
+    Attributes:
+        reader (MainReader): The reader used in the threads.
+        max_concurrency (int): The max number of files read at once.
+        timeout (float): The default timeout of each file, in seconds. None means no timeout.
+        processes (bool): If True, the files are read in a pool of processes instead of threads.
+
+    Example:
+        async with AsyncMainReader(max_concurrency=4, timeout=60) as reader:
+            async for result in reader.load_many(paths):
+                print(result.path, result.error)
+    """
+
+    def __init__(
+        self,
+        reader: Optional[MainReader] = None,
+        executor: Optional[Executor] = None,
+        max_concurrency: int = 4,
+        timeout: Optional[float] = None,
+        processes: bool = False,
+    ) -> None:
+        assert max_concurrency > 0, 'The max concurrency must be positive.'
+        self.logger = setup_logger(__class__.__name__)
+        self.reader = reader or MainReader()
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.processes = processes
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def executor(self) -> Executor:
+        """
+        The executor of the readings, created on the first use when it was not given.
+        """
+        if self._executor is None:
+            # NOTE Twice the concurrency, so the files that timed out do not take all the workers
+            workers = 2 * self.max_concurrency
+            if self.processes:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=workers, initializer=_init_worker, initargs=(self.reader.reader_options(),)
+                )
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='wellbelog')
+        return self._executor
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # NOTE Created lazily, inside the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def __aenter__(self) -> 'AsyncMainReader':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shutdown the executor, if it was created by this reader.
+        The files waiting to start are cancelled, the running ones are not waited.
+        """
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _submit(self, path: str, keep_errors: bool) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        if self.processes and self._owns_executor:
+            function = _worker_load_file if keep_errors else _worker_read_file
+            return loop.run_in_executor(self.executor, function, path)
+        if keep_errors:
+            return loop.run_in_executor(self.executor, load_file_timed, self.reader, path)
+        return loop.run_in_executor(self.executor, self.reader.load_file, path)
+
+    async def _run(self, path: str, timeout: Optional[float], keep_errors: bool):
+        timeout = timeout if timeout is not None else self.timeout
+        async with self.semaphore:
+            return await asyncio.wait_for(self._submit(path, keep_errors), timeout)
+
+    async def load_file(self, path: str, timeout: Optional[float] = None) -> ReaderReturnType:
+        """
+        Load a file, like MainReader.load_file, without blocking the event loop.
+
+        Args:
+            path (str): Path to the file.
+            timeout (float, optional): The timeout in seconds, defaults to the reader timeout.
+
+        Returns:
+            ReaderReturnType: The model of the file.
+
+        Raises:
+            asyncio.TimeoutError: If the file is not read in time.
+            asyncio.CancelledError: If the task is cancelled.
+            Exception: Any error raised by the reader.
+        """
+        return await self._run(str(path), timeout, keep_errors=False)
+
+    async def load_result(self, path: str, timeout: Optional[float] = None) -> FileLoadResult:
+        """
+        Load a file, keeping any error in the result, like MainReader.load_many.
+
+        Args:
+            path (str): Path to the file.
+            timeout (float, optional): The timeout in seconds, defaults to the reader timeout.
+
+        Returns:
+            FileLoadResult: The result of the reading. A timeout is reported as an error.
+
+        Raises:
+            asyncio.CancelledError: If the task is cancelled.
+        """
+        path = str(path)
+        timeout = timeout if timeout is not None else self.timeout
+        try:
+            return await self._run(path, timeout, keep_errors=True)
+        except asyncio.TimeoutError:
+            self.logger.error(f'Timed out after {timeout}s while reading {path}')
+            return FileLoadResult(path=path, error=True, error_message=f'Timed out after {timeout}s.', elapsed=timeout)
+        except Exception as e:
+            # NOTE Like a broken process pool
+            return FileLoadResult(path=path, error=True, error_message=str(e))
+
+    async def load_many(self, paths: PathsSource, timeout: Optional[float] = None) -> AsyncIterator[FileLoadResult]:
+        """
+        Load many files, yielding the results as soon as each file is read.
+        The paths are taken from the source only when there is a free slot, so a slow consumer
+        or a long source do not pile up work. When the consumer stops the iteration, or it is
+        cancelled, the files that are still waiting are cancelled.
+
+        Args:
+            paths (PathsSource): The paths, a sync or an async iterable.
+            timeout (float, optional): The timeout of each file, defaults to the reader timeout.
+
+        Yields:
+            FileLoadResult: The result of each file.
+        """
+        is_async = isinstance(paths, abc.AsyncIterable)
+        source = paths.__aiter__() if is_async else iter(paths)
+        exhausted = False
+        running: set[asyncio.Task] = set()
+
+        async def next_path() -> Optional[str]:
+            try:
+                return await source.__anext__() if is_async else next(source)
+            except (StopIteration, StopAsyncIteration):
+                return None
+
+        try:
+            while True:
+                while not exhausted and len(running) < self.max_concurrency:
+                    path = await next_path()
+                    if path is None:
+                        exhausted = True
+                        break
+                    running.add(asyncio.create_task(self.load_result(path, timeout)))
+                if not running:
+                    return
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
@@ -1,4 +1,7 @@
-from dlisio import dlis
+from typing import Iterator, Sequence
+
+from dlisio import core, dlis
+import numpy as np
 
 
 def open_dlis_file(file_path: str) -> dlis.PhysicalFile:
@@ -20,9 +23,87 @@ def open_dlis_file(file_path: str) -> dlis.PhysicalFile:
         return e
 
 
+DLIS_NULL_PARAMETERS = {'NULL', 'ABSENT_VALUE', 'ABSV'}
+"""The names of the parameters that some producers use to declare the absent value."""
+
+
+def get_absent_values(logical_file: dlis.LogicalFile) -> set[float]:
+    """
+    Get the absent values declared in the parameters of a logical file.
+    dlisio does not expose the absent value of the channels, so the parameters are the only source.
+
+    Args:
+        logical_file (dlis.LogicalFile): The logical file.
+
+    Returns:
+        set[float]: The declared absent values, usually empty.
+    """
+    values = set()
+    for parameter in logical_file.parameters:
+        if str(parameter.name).upper() not in DLIS_NULL_PARAMETERS:
+            continue
+        try:
+            values.update(float(value) for value in parameter.values)
+        except (TypeError, ValueError):
+            continue
+    return values
+
+
 def unpack_physical_dlis(ph_file: dlis.PhysicalFile) -> list[dlis.LogicalFile]:
     """
     Unpacks the physical file and returns a list of logical files
     """
     *logical_files, = ph_file
     return logical_files
+
+
+def frame_records_count(frame: dlis.Frame) -> int:
+    """
+    The number of samples of a frame, counted from its data records, without decoding them.
+    """
+    return len(frame.logicalfile.fdata_index.get(frame.fingerprint, []))
+
+
+def read_frame_rows(frame: dlis.Frame, rows: Sequence[int]) -> np.ndarray:
+    """
+    Decode only some rows of a frame, like Frame.curves but for a subset of the data records.
+
+    NOTE It uses the same dlisio core reader as Frame.curves, with only the selected records.
+
+    Args:
+        frame (dlis.Frame): The dlis frame.
+        rows (Sequence[int]): The positions of the rows to read.
+
+    Returns:
+        np.ndarray: A structured array with the frame dtype.
+    """
+    logical_file = frame.logicalfile
+    indices = logical_file.fdata_index.get(frame.fingerprint, [])
+    dtype = frame.dtype()
+    return core.read_fdata(
+        '',
+        frame.fmtstr(),
+        '',
+        logical_file.file,
+        [indices[row] for row in rows],
+        dtype.itemsize,
+        lambda size: np.empty(shape=size, dtype=dtype),
+        logical_file.error_handler,
+    )
+
+
+def iter_frame_chunks(frame: dlis.Frame, chunk_size: int = 10000) -> Iterator[np.ndarray]:
+    """
+    Decode a frame in chunks of rows, so only one chunk is in memory at a time.
+
+    Args:
+        frame (dlis.Frame): The dlis frame.
+        chunk_size (int): The number of rows of each chunk.
+
+    Yields:
+        np.ndarray: A structured array for each chunk, with the frame dtype.
+    """
+    assert chunk_size > 0, 'The chunk size must be positive.'
+    total = frame_records_count(frame)
+    for start in range(0, total, chunk_size):
+        yield read_frame_rows(frame, range(start, min(start + chunk_size, total)))
@@ -1,4 +1,5 @@
 from .logical_file_parser import (
+    DEFAULT_SUMMARY_SECTIONS, SUMMARY_SECTIONS, SummaryBuilder,
     file_params_to_dict, file_tools_to_dict, get_logical_file_summary
 )
 from .physical_file_parser import get_physical_file_summary
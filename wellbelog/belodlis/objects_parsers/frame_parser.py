@@ -2,10 +2,13 @@
 from typing import Union
 
 from dlisio import dlis
+import numpy as np
 import pandas as pd
 
-from wellbelog.schemas.dlis import FrameModel, FrameChannel, ChannelsList
+from wellbelog.schemas.dlis import FrameModel, FrameChannelTable
+from wellbelog.schemas.scan import ChannelHeader, FrameHeader
 from wellbelog.utils.mnemonicfix import MnemonicFix
+from ..functions import read_frame_rows
 
 
 class FrameProcessor:
@@ -31,9 +34,10 @@ class FrameProcessor:
         return model
 
     @ staticmethod
-    def processs_frame_channels(frame: dlis.Frame, filter_dumm: bool = True) -> Union[ChannelsList, None]:
+    def processs_frame_channels(frame: dlis.Frame, filter_dumm: bool = True) -> Union[FrameChannelTable, None]:
         """
-        Tries to create a list of FrameChannelData from the Frame.channels
+        Tries to create a FrameChannelTable from the Frame.channels
+        The channels are stored by field, no model is built per channel.
         """
 
         channels: list[dlis.Channel] = frame.channels
@@ -44,30 +48,20 @@ class FrameProcessor:
         if not channels:
             return None
 
-        channel_main_dict = [
-            FrameChannel(
-                long_name=str(channel.long_name),
-                name=MnemonicFix.replace_index(str(channel.name)).strip(),
-                units=str(channel.units),
-                repr=str(channel.reprc),
-                properties=str(channel.properties),
-
-            )
-            for channel in channels
-        ]
-        return channel_main_dict
+        return FrameChannelTable({
+            'long_name': [str(channel.long_name) for channel in channels],
+            'name': [MnemonicFix.replace_index(str(channel.name)).strip() for channel in channels],
+            'units': [str(channel.units) for channel in channels],
+            'repr': [str(channel.reprc) for channel in channels],
+            'properties': [str(channel.properties) for channel in channels],
+        })
 
     @ staticmethod
     def dlis_curves_to_dataframe(frame: dlis.Frame):
         """Tries to create a dataframe from the Frame.curves"""
         # Creating the main dataframe for the curve data
         try:
-            df = pd.DataFrame(frame.curves())
-            # - Fixing mnemonics and wrong indexes
-            df = MnemonicFix.index_to_depth(df)
-            df.columns = df.columns.str.strip()
-            # Setting the column Well to the origin
-            return df
+            return FrameProcessor.curves_to_dataframe(frame.curves())
 
         except ValueError as v:
             raise v
@@ -76,3 +70,76 @@ class FrameProcessor:
             # NOTE It returns the Exception object
             # NOTE It will be setted to the Error in the BeloFrame
             return e
+
+    @staticmethod
+    def curves_to_dataframe(curves: np.ndarray) -> pd.DataFrame:
+        """
+        Create a dataframe from the curves read by Frame.curves, with the mnemonics fixed.
+        """
+        df = pd.DataFrame(curves)
+        # - Fixing mnemonics and wrong indexes
+        df = MnemonicFix.index_to_depth(df)
+        df.columns = df.columns.str.strip()
+        return df
+
+    @staticmethod
+    def dlis_curves_to_arrays(frame: dlis.Frame) -> Union[np.ndarray, Exception]:
+        """
+        Tries to read the Frame.curves as a NumPy structured array.
+        No dataframe is created, so the curves keep their original types.
+        """
+        try:
+            return frame.curves()
+
+        except ValueError as v:
+            raise v
+
+        except Exception as e:
+            # NOTE It returns the Exception object, like dlis_curves_to_dataframe
+            return e
+
+    @staticmethod
+    def frame_index_name(frame: dlis.Frame) -> Union[str, None]:
+        """
+        Get the name of the index channel of the frame, with the mnemonics fixed.
+        """
+        if not frame.index:
+            return None
+        return MnemonicFix.replace_index(str(frame.index)).strip()
+
+    @staticmethod
+    def frame_header(frame: dlis.Frame, read_index: bool = True) -> FrameHeader:
+        """
+        Create a FrameHeader from the frame metadata, without decoding the curves.
+        The samples are counted from the frame data records.
+        If the frame does not declare the index range and read_index is True,
+        only the first and last rows are decoded to get it.
+        """
+        channels = [
+            ChannelHeader(
+                name=MnemonicFix.replace_index(str(channel.name)).strip(),
+                units=str(channel.units) if channel.units else None,
+                long_name=str(channel.long_name) if channel.long_name else None,
+                dimension=list(channel.dimension) if channel.dimension else None,
+            )
+            for channel in frame.channels
+        ]
+        indices = frame.logicalfile.fdata_index.get(frame.fingerprint, [])
+        header = FrameHeader(
+            name=str(frame.name),
+            index_name=FrameProcessor.frame_index_name(frame),
+            index_units=channels[0].units if frame.index_type and channels else None,
+            channels=channels,
+            start=frame.index_min,
+            stop=frame.index_max,
+            spacing=frame.spacing,
+            direction=frame.direction,
+            samples=len(indices),
+        )
+        if read_index and frame.index_type and frame.channels and indices and header.start is None:
+            # NOTE Only the first and the last rows are decoded
+            rows = read_frame_rows(frame, [0, len(indices) - 1])
+            index = rows[rows.dtype.names[1]]
+            header.start = float(index[0])
+            header.stop = float(index[-1])
+        return header
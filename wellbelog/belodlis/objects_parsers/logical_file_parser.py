@@ -1,4 +1,7 @@
-from typing import Union
+import re
+import threading
+from typing import Iterable, Optional, Union
+import weakref
 
 from dlisio.dlis import (
     Measurement, Parameter, Channel, LogicalFile,
@@ -13,6 +16,15 @@ MetadataObject = Union[Measurement, Parameter, Channel]
 
 console = Console()
 
+SUMMARY_SECTIONS = ('parameters', 'tools', 'comments', 'remarks', 'header')
+"""The sections of a LogicalFileSummary."""
+
+DEFAULT_SUMMARY_SECTIONS = ('parameters', 'tools', 'comments', 'remarks')
+"""The sections built by default. The header is rendered with Fileheader.describe, which is slow on large files."""
+
+# NOTE The same pattern of logical_file.find('PARAMETER', '^R[0-9]{1,2}'), case insensitive like dlisio
+REMARK_PATTERN = re.compile('^R[0-9]{1,2}', re.IGNORECASE)
+
 
 def file_params_to_dict(objs: list[MetadataObject], **kwargs) -> list[dict]:
     """
@@ -48,9 +60,10 @@ def file_params_to_dict(objs: list[MetadataObject], **kwargs) -> list[dict]:
         obj_dict['long_name'] = getattr(obj, 'long_name')
 
         try:
-            # NOTE Main attribute acees method
-            if getattr(obj, 'values').ndim == 1 and getattr(obj, 'values') is not None:  # noqa
-                obj_dict['values'] = str(getattr(obj, 'values')[0])
+            # NOTE Main attribute acees method, the values are parsed on each access, so they are read once
+            values = getattr(obj, 'values')
+            if values is not None and values.ndim == 1:
+                obj_dict['values'] = str(values[0])
 
         except IndexError:
             obj_dict['values'] = 'No values were found on this parameter'
@@ -90,26 +103,32 @@ def file_tools_to_dict(objs: list[MetadataObject], **kwargs):
     return dicts_summary
 
 
-def file_remarks(logical_file: LogicalFile) -> dict:
+def file_remarks(logical_file: LogicalFile, parameters: Optional[list[Parameter]] = None) -> dict:
     """
     Gets the remarks on a given logical file
 
     Args:
         logical_file (LogicalFile): The logical file to be searched
+        parameters (list[Parameter], optional): The parameters of the file, if they were already listed.
+            The remarks are taken from them, instead of searching the file again.
 
     Returns:
         list[dict]: a list of the remarks
     """
     remars_dict_list = {}
     try:
-        remarks = logical_file.find('PARAMETER', '^R[0-9]{1,2}')
+        if parameters is None:
+            remarks = logical_file.find('PARAMETER', REMARK_PATTERN.pattern)
+        else:
+            remarks = [parameter for parameter in parameters if REMARK_PATTERN.match(parameter.name)]
         remarks = sorted(remarks, key=lambda x: int(x.name[1:]))
         for remark in remarks:
             if remark.name == 'R8':
                 continue
             remark_dict = {}
-            if remark.values.ndim == 1 and remark.values is not None:
-                remark_dict[remark.name] = " ".join(remark.values
+            values = remark.values
+            if values is not None and values.ndim == 1:
+                remark_dict[remark.name] = " ".join(values
                                                     ).encode('utf-8'
                                                              ).decode('utf-8')
                 remars_dict_list.update(remark_dict)
@@ -120,42 +139,138 @@ def file_remarks(logical_file: LogicalFile) -> dict:
     return remars_dict_list
 
 
-def get_logical_file_summary(logical_file: LogicalFile) -> LogicalFileSummary:
+class SummaryBuilder:
+    """
+    Builds the summaries of logical files, one section at a time.
+    Each section is built once per logical file, and kept while the logical file is alive,
+    so asking again for a section, or for a summary with more sections, does not walk the object pool again.
+
+    Example:
+        >>> builder = SummaryBuilder()
+        >>> summary = builder.build(logical_file, sections=['parameters'], parameters=MAIN_PARAMETERS)
+    """
+
+    def __init__(self) -> None:
+        self._sections: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _memo(self, logical_file: LogicalFile) -> dict:
+        with self._lock:
+            return self._sections.setdefault(logical_file, {})
+
+    def section(self, logical_file: LogicalFile, name: str, objects: Optional[list[Parameter]] = None):
+        """
+        Build a section of the summary of a logical file, or get it if it was already built.
+
+        Args:
+            logical_file (LogicalFile): The logical file.
+            name (str): One of SUMMARY_SECTIONS.
+            objects (list[Parameter], optional): The parameters of the file, if they were already listed.
+
+        Returns:
+            The value of the section in LogicalFileSummary.
+        """
+        assert name in SUMMARY_SECTIONS, f'Unknown summary section: {name}'
+        memo = self._memo(logical_file)
+        if name in memo:
+            return memo[name]
+
+        if name == 'parameters':
+            value = file_params_to_dict(objects if objects is not None else logical_file.parameters)
+        elif name == 'tools':
+            value = file_tools_to_dict(logical_file.tools)
+        elif name == 'comments':
+            value = {'comment': co.text for co in logical_file.comments}
+        elif name == 'remarks':
+            value = file_remarks(logical_file, objects)
+        else:
+            header: Fileheader = logical_file.fileheader
+            value = header.describe().__str__()
+        memo[name] = value
+        return value
+
+    def build(
+        self,
+        logical_file: LogicalFile,
+        sections: Optional[Iterable[str]] = None,
+        parameters: Optional[Iterable[str]] = None,
+    ) -> LogicalFileSummary:
+        """
+        Build the summary of a logical file, with only the sections asked for.
+
+        Args:
+            logical_file (LogicalFile): The logical file.
+            sections (Iterable[str], optional): The sections of SUMMARY_SECTIONS, DEFAULT_SUMMARY_SECTIONS by default.
+            parameters (Iterable[str], optional): The names of the parameters kept, like MAIN_PARAMETERS. All by default.
+                Only the values of these parameters are read.
+
+        Returns:
+            LogicalFileSummary: The summary, the sections not asked for are None.
+        """
+        sections = DEFAULT_SUMMARY_SECTIONS if sections is None else tuple(sections)
+        memo = self._memo(logical_file)
+        # NOTE The parameters and the remarks share one listing of the object pool.
+        # The objects are not memoized, they keep the logical file alive.
+        objects = None
+        if any(name in ('parameters', 'remarks') and name not in memo for name in sections):
+            objects = logical_file.parameters
+
+        values = {}
+        for name in sections:
+            if name == 'parameters' and parameters is not None:
+                values[name] = self._selected_parameters(logical_file, tuple(parameters), objects)
+            else:
+                values[name] = self.section(logical_file, name, objects)
+        return LogicalFileSummary(**values)
+
+    def _selected_parameters(self, logical_file: LogicalFile, names: tuple[str, ...], objects: Optional[list]) -> list[dict]:
+        memo = self._memo(logical_file)
+        if 'parameters' in memo:
+            by_name = {parameter['name']: parameter for parameter in memo['parameters']}
+        else:
+            # NOTE Only the values of the parameters asked for are read, and they are kept for the next calls
+            by_name = memo.setdefault('selected_parameters', {})
+            wanted = set(names) - by_name.keys()
+            if wanted:
+                objects = objects if objects is not None else logical_file.parameters
+                for parameter in file_params_to_dict([obj for obj in objects if obj.name in wanted]):
+                    by_name.setdefault(parameter['name'], parameter)
+        return [by_name[name] for name in names if name in by_name]
+
+    def clear(self) -> None:
+        """
+        Forget the sections built.
+        """
+        with self._lock:
+            self._sections.clear()
+
+
+# NOTE The builder shared by get_logical_file_summary
+summary_builder = SummaryBuilder()
+
+
+def get_logical_file_summary(
+    logical_file: LogicalFile,
+    sections: Optional[Iterable[str]] = None,
+    parameters: Optional[Iterable[str]] = None,
+) -> LogicalFileSummary:
     """
     ## Master function
     It combines the previous functions, into a pipeline.\n
     This function creates various lists of dictionaries,
     that  reflects the objects that it contains.
+    The sections are memoized per logical file, by the shared summary_builder.
 
     Args:
         logical_file (dlis.LogicalFile): A dlisio.dlis.LogicalFile.
 
-        main_parameters (list[str]): A list of the main parameters
-        that should be displayed
+        sections (Iterable[str], optional): The sections built, DEFAULT_SUMMARY_SECTIONS by default.
+        The header is only rendered if it is asked for.
+
+        parameters (Iterable[str], optional): The names of the main parameters
+        that should be displayed, like MAIN_PARAMETERS. All by default.
 
     Returns:
         LogicalFileSummary: A LogicalFile Summary object.
     """
-
-    parameters_dict_list = file_params_to_dict(logical_file.parameters)
-
-    # NOTE Creating the tools dict.
-    tools_dict_list = file_tools_to_dict(logical_file.tools)
-
-    # NOTE Getting the header
-    header: Fileheader = logical_file.fileheader
-    header = header.describe().__str__()
-
-    # NOTE Creating the comments dict.
-    comments = {'comment': co.text for co in logical_file.comments}
-
-    # NOTE Creating the remarks dict.
-    remars_dict_list = file_remarks(logical_file)
-
-    return LogicalFileSummary(
-        parameters=parameters_dict_list,
-        tools=tools_dict_list,
-        remarks=remars_dict_list,
-        comments=comments,
-        header=header
-    )
+    return summary_builder.build(logical_file, sections, parameters)
@@ -1,23 +1,132 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 import json
+import os
 import pathlib
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Union
 
+import numpy as np
+import pandas as pd
+
+from dlisio import dlis
 from dlisio.dlis import Frame
 
+from wellbelog.utils.arrays import format_chunks
+from wellbelog.utils.cache import ParseCache, cached_reading
+from wellbelog.utils.nullvalues import NULL_VALUES, replace_null_values
 from wellbelog.utils.logging import setup_logger
-from ..schemas.dlis import FrameDataframe, LogicalFileModel, PhysicalFileModel
-from .objects_parsers.logical_file_parser import get_logical_file_summary
+from wellbelog.utils.profiling import NULL_PROFILE, AnyProfile, FileProfile, Profiler, attach_profile, file_profile
+from wellbelog.utils.scanner import scan_log_files
+from ..schemas.dlis import FrameDataframe, LazyFrameDataframe, LogicalFileModel, PhysicalFileModel
+from ..schemas.profiling import StageTiming
+from ..schemas.scan import LogicalFileHeader, PhysicalFileHeader
+from .objects_parsers.logical_file_parser import DEFAULT_SUMMARY_SECTIONS, get_logical_file_summary
 from .objects_parsers.frame_parser import FrameProcessor
-from .functions import open_dlis_file, unpack_physical_dlis
+from .functions import open_dlis_file, unpack_physical_dlis, iter_frame_chunks, get_absent_values
+
+
+LogicalFileResult = tuple[LogicalFileModel, list[str]]
+"""A processed logical file, and the lists of the PhysicalFileModel it is appended to."""
+
+
+def _process_logical_files_worker(
+    options: dict, path: str, positions: range, file_name: str, profile: bool = False
+) -> tuple[list[LogicalFileResult], list[StageTiming]]:
+    """
+    Process a block of logical files of a DLIS file, inside a worker process.
+    The file is opened, and its logical files indexed, once per block.
+    The timings of the stages are returned with the results, when profile is True.
+    """
+    file = open_dlis_file(path)
+    if isinstance(file, Exception):
+        raise file
+    worker_profile = FileProfile(file_name) if profile else NULL_PROFILE
+    try:
+        reader = DlisReader(**options)
+        logical_files = unpack_physical_dlis(file)
+        results = [
+            reader.process_logical_file(logical_files[position], file_name, profile=worker_profile, position=position)
+            for position in positions
+        ]
+        return results, list(getattr(worker_profile, 'stages', []))
+    finally:
+        file.close()
+
+
+def _split_positions(count: int, blocks: int) -> list[range]:
+    """
+    Split the positions of count items in contiguous blocks of about the same size.
+    """
+    size, extra = divmod(count, blocks)
+    bounds = [0]
+    for block in range(blocks):
+        bounds.append(bounds[-1] + size + (block < extra))
+    return [range(start, stop) for start, stop in zip(bounds, bounds[1:])]
 
 
 class DlisReader:
     """
     This class is responsible for processing the dlis.PhysicalFile object
+
+    Attributes:
+        columnar (bool): If True, the frames data is stored as NumPy columns instead of records.
+        lazy (bool): If True, the frames data is only decoded when it is accessed.
+            The dlis file is kept open, until PhysicalFileModel.close is called.
+        cache (ParseCache): Optional cache of the processed files. Lazy files are not cached.
+        mask_nulls (bool): If True, the null values of the curves are replaced with NaN.
+        null_values (set[float]): The null values, NULL_VALUES by default. The values declared in the file are added.
+        workers (int): The number of logical files processed at once. Lazy files are always processed one at a time.
+        pool (str): The pool used when workers > 1, 'thread' or 'process'.
+        profiler (Profiler): Optional timing hooks, of the open, summary, frame_metadata, curves,
+            mask_nulls, dataframe, json and build stages. None disables them.
+        summary_sections (tuple[str]): The sections of the logical files summaries, DEFAULT_SUMMARY_SECTIONS by default.
+            The header is rendered only if it is asked for, and an empty tuple skips the summaries.
+        summary_parameters (tuple[str]): The names of the parameters kept in the summaries, like MAIN_PARAMETERS.
+            All by default.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        columnar: bool = False,
+        lazy: bool = False,
+        cache: Optional[ParseCache] = None,
+        mask_nulls: bool = False,
+        null_values: Optional[Iterable[float]] = None,
+        workers: int = 1,
+        pool: str = 'thread',
+        profiler: Optional[Profiler] = None,
+        summary_sections: Optional[Iterable[str]] = None,
+        summary_parameters: Optional[Iterable[str]] = None,
+    ) -> None:
+        assert pool in ('thread', 'process'), f'Unknown pool: {pool}'
         self. logger = setup_logger(__class__.__name__)
+        self.columnar = columnar
+        self.lazy = lazy
+        self.cache = cache
+        self.mask_nulls = mask_nulls
+        self.null_values = set(null_values) if null_values is not None else set(NULL_VALUES)
+        self.workers = workers
+        self.pool = pool
+        self.profiler = profiler
+        self.summary_sections = tuple(summary_sections) if summary_sections is not None else DEFAULT_SUMMARY_SECTIONS
+        self.summary_parameters = tuple(summary_parameters) if summary_parameters is not None else None
+
+    def reader_options(self) -> dict:
+        """
+        The options that change the result of the reader.
+        """
+        return {
+            'columnar': self.columnar, 'lazy': self.lazy,
+            'mask_nulls': self.mask_nulls, 'null_values': sorted(self.null_values),
+            'summary_sections': list(self.summary_sections),
+            'summary_parameters': list(self.summary_parameters) if self.summary_parameters is not None else None,
+        }
+
+    def frame_null_values(self, frame: Frame) -> set[float]:
+        """
+        The null values of a frame, the reader ones and the absent values declared in the logical file.
+        """
+        return self.null_values | get_absent_values(frame.logicalfile)
 
     def load_raw(self, path_to_file: str, unpack=False) -> PhysicalFileModel:
         """
@@ -37,6 +146,104 @@ class DlisReader:
             return unpack_physical_dlis(file)
         return file
 
+    def decode_frame(
+        self,
+        frame: Frame,
+        file_name: str,
+        logical_file_id: str,
+        profile: AnyProfile = NULL_PROFILE,
+        position: tuple[Optional[int], Optional[int]] = (None, None),
+    ) -> Union[FrameDataframe, Exception]:
+        """
+        Decode the curves of a frame into a FrameDataframe.
+
+        Parameters:
+            frame (Frame): The dlis frame.
+            file_name (str): The name of the file.
+            logical_file_id (str): The id of the logical file.
+            profile (FileProfile): The profile of the read, the stages are not timed by default.
+            position (tuple[int, int]): The positions of the logical file and of the frame, for the profile.
+
+        Returns:
+            Union[FrameDataframe, Exception]: The frame data, or the exception raised while decoding.
+        """
+        with profile.stage('curves', *position) as stage:
+            data = FrameProcessor.dlis_curves_to_arrays(frame)
+            if not isinstance(data, Exception):
+                stage.bytes, stage.samples = data.nbytes, len(data)
+        if isinstance(data, Exception):
+            return data
+        if not self.columnar:
+            try:
+                with profile.stage('dataframe', *position, samples=len(data)):
+                    data = FrameProcessor.curves_to_dataframe(data)
+            # NOTE The ValueError, like repeated channel names, is raised like in dlis_curves_to_dataframe,
+            # and process_logical_file marks the whole logical file as an error. The other errors mark only the frame.
+            except ValueError:
+                raise
+            except Exception as e:
+                return e
+        if self.mask_nulls:
+            with profile.stage('mask_nulls', *position, samples=len(data)):
+                replace_null_values(data, self.frame_null_values(frame))
+
+        if self.columnar:
+            with profile.stage('build', *position, samples=len(data)):
+                return FrameDataframe.from_structured(
+                    data,
+                    file_name=file_name,
+                    logical_file_id=logical_file_id,
+                    index_name=FrameProcessor.frame_index_name(frame),
+                )
+        with profile.stage('json', *position, samples=len(data)):
+            return FrameDataframe(
+                file_name=file_name,
+                logical_file_id=logical_file_id,
+                data=json.loads(data.to_json(orient='records')),
+                index_name=FrameProcessor.frame_index_name(frame),
+            )
+
+    def iter_frame_chunks(
+        self,
+        path: str,
+        logical_file: int = 0,
+        frame: int = 0,
+        chunk_size: int = 10000,
+        depth_step: Optional[float] = None,
+        as_dataframe: bool = False,
+    ) -> Iterator[Union[np.ndarray, pd.DataFrame]]:
+        """
+        Iterate over the curves of a frame in chunks, keeping only one chunk in memory.
+        The file is closed when the iteration ends.
+
+        Parameters:
+            path (str): The path to the DLIS file.
+            logical_file (int): The position of the logical file.
+            frame (int): The position of the frame in the logical file.
+            chunk_size (int): The number of rows read at a time.
+            depth_step (float, optional): If given, the chunks are regrouped in windows of this depth.
+            as_dataframe (bool): If True, yields dataframes instead of NumPy structured arrays.
+
+        Yields:
+            Union[np.ndarray, pd.DataFrame]: The chunks of the frame.
+        """
+        file = self.load_raw(path)
+        try:
+            dlis_frame = unpack_physical_dlis(file)[logical_file].frames[frame]
+            # NOTE The first field is FRAMENO, the index channel is the next one
+            names = dlis_frame.dtype().names
+            index_name = names[1] if dlis_frame.index_type and len(names) > 1 else None
+            chunks = iter_frame_chunks(dlis_frame, chunk_size=chunk_size)
+            if self.mask_nulls:
+                null_values = self.frame_null_values(dlis_frame)
+                chunks = (replace_null_values(chunk, null_values) for chunk in chunks)
+            yield from format_chunks(chunks, index_name=index_name, depth_step=depth_step, as_dataframe=as_dataframe)
+        finally:
+            file.close()
+
+    def _walk_error(self, error: OSError) -> None:
+        self.logger.error(f'Error while searching for DLIS files: {error}')
+
     def search_files(self, path: str) -> Optional[list[pathlib.Path]]:
         """
         Search for DLIS files in the given path and returns a list with the file paths.
@@ -46,13 +253,54 @@ class DlisReader:
         """
         dlis_files = []
         try:
-            for file in pathlib.Path(path).rglob('*.dlis'):
-                dlis_files.append(file)
+            # NOTE The extensions are matched in any case, the tree is walked in threads
+            for file in scan_log_files(path, file_types=['dlis'], sniff='never', on_error=self._walk_error):
+                dlis_files.append(pathlib.Path(file.path))
             return dlis_files
         except Exception as e:
             self.logger.error(f'Error while searching for DLIS files: {e}')
             return None
 
+    def scan(self, path: str, read_index: bool = True) -> PhysicalFileHeader:
+        """
+        Scan a DLIS file and return only its metadata: the logical files, channels, index range and samples count.
+        The curves are not decoded. If a frame does not declare its index range, and read_index is True,
+        only the index channel is decoded.
+
+        Parameters:
+            path (str): The path to the DLIS file.
+            read_index (bool): If the index channel can be read to get the index range.
+
+        Returns:
+            PhysicalFileHeader: The metadata of the file.
+        """
+        file_name = pathlib.Path(path).name
+        header = PhysicalFileHeader(file_name=file_name, file_type='dlis')
+        file = open_dlis_file(pathlib.Path(path).absolute())
+        if isinstance(file, Exception):
+            self.logger.error(f'Error while opening the DLIS file: {file}')
+            header.error = True
+            header.error_message = file.__str__()
+            return header
+
+        try:
+            for logical_file in unpack_physical_dlis(file):
+                logical_header = LogicalFileHeader()
+                try:
+                    logical_header.logical_id = logical_file.fileheader.id
+                    logical_header.frames = [
+                        FrameProcessor.frame_header(frame, read_index=read_index) for frame in logical_file.frames
+                    ]
+                except Exception as e:
+                    self.logger.error(f'Error while scanning the logical file: {e}')
+                    logical_header.error = True
+                    logical_header.error_message = e.__str__()
+                header.logical_files.append(logical_header)
+        finally:
+            file.close()
+        return header
+
+    @cached_reading
     def process_physical_file(self, path: str, folder_name: str = None) -> PhysicalFileModel:
         """
         Process the PhysicalFile object and returns a PhysicalFileModel with the main data.
@@ -66,77 +314,167 @@ class DlisReader:
         self.logger.info(f'Processing the file: {file_name}')
         # XXX Create a PhysicalFileModel object
         physical = PhysicalFileModel(file_name=file_name, logical_files=[], folder_name=folder_name)
+        profile = file_profile(self.profiler, file_name)
         # Open the DLIS file or raise an exception
-        file = open_dlis_file(pathlib.Path(path).absolute())
+        with profile.stage('open') as stage:
+            file = open_dlis_file(pathlib.Path(path).absolute())
+            if not isinstance(file, Exception):
+                stage.bytes = os.path.getsize(path)
+                logical_files = unpack_physical_dlis(file)
         if isinstance(file, Exception):
             self.logger.error(f'Error while opening the DLIS file: {file}')
             physical.error = True
             physical.error_message = file.__str__()
+            attach_profile(self.profiler, physical, profile)
             return physical
 
-        logical_files = unpack_physical_dlis(file)
-        # Process each logical file
-        for file in logical_files:
-            logical_file = LogicalFileModel(file_name=file_name, frames=[])
-            try:
-                logical_file.logical_id = file.fileheader.id
-                logical_file.summary = get_logical_file_summary(file)
-                frames: list[Frame] = file.find('FRAME')
+        if self.lazy:
+            physical.set_source(file)
 
-                # If there are no frames, set the error flag and the error message
-                if not frames:
-                    logical_file.error = True
-                    logical_file.error_message = 'No frames found in the logical file'
-                    physical.error_files.append(logical_file)
-                    continue
+        # NOTE Lazy models keep the frames of the opened file, so they are always processed here
+        if self.workers > 1 and len(logical_files) > 1 and not self.lazy:
+            results = self._process_logical_files_parallel(path, file_name, logical_files, profile)
+        else:
+            results = (
+                self.process_logical_file(logical, file_name, profile=profile, position=position)
+                for position, logical in enumerate(logical_files)
+            )
+
+        # NOTE The results are merged in the order of the logical files
+        for logical_file, placements in results:
+            for placement in placements:
+                getattr(physical, placement).append(logical_file)
 
-                # NOTE Process each frame
-                # iterate over the frames and process each one
-                for frame in frames:
+        if not self.lazy:
+            file.close()
+        attach_profile(self.profiler, physical, profile)
+        return physical
 
-                    # Create a frame model and process the frame,
-                    # NOTE it will return None if the frame has a DUMM channel
+    def _process_logical_files_parallel(
+        self,
+        path: str,
+        file_name: str,
+        logical_files: list[dlis.LogicalFile],
+        profile: AnyProfile = NULL_PROFILE,
+    ) -> list[LogicalFileResult]:
+        """
+        Process the logical files of a file in a pool, returning the results in the order of the logical files.
+        In a process pool the logical files are split in one contiguous block per worker,
+        and each worker opens the file again, since the dlisio objects can not be pickled.
+        """
+        count = len(logical_files)
+        workers = min(self.workers, count)
+        if self.pool == 'process':
+            options = self.reader_options()
+            options.pop('lazy')
+            blocks = _split_positions(count, workers)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                outputs = list(executor.map(
+                    _process_logical_files_worker,
+                    [options] * workers, [str(pathlib.Path(path).absolute())] * workers, blocks, [file_name] * workers,
+                    [profile.enabled] * workers,
+                ))
+            # NOTE The timings of the workers are recorded after the pool, in the order of the logical files
+            for _, timings in outputs:
+                profile.extend(timings)
+            return [result for results, _ in outputs for result in results]
+
+        # NOTE In a thread pool the logical files of the opened file are shared
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda logical, position: self.process_logical_file(logical, file_name, position, profile),
+                logical_files, range(count),
+            ))
+
+    def process_logical_file(
+        self,
+        file: dlis.LogicalFile,
+        file_name: str,
+        position: Optional[int] = None,
+        profile: AnyProfile = NULL_PROFILE,
+    ) -> LogicalFileResult:
+        """
+        Process a logical file into a LogicalFileModel.
+
+        Parameters:
+            file (dlis.LogicalFile): The logical file.
+            file_name (str): The name of the physical file.
+            position (int, optional): The position of the logical file in the physical file, for the profile.
+            profile (FileProfile): The profile of the read, the stages are not timed by default.
+
+        Returns:
+            LogicalFileResult: The model, and the lists of the PhysicalFileModel it is appended to, in order.
+            A logical file with errors goes to the error_files, and it can also be in the logical_files.
+        """
+        logical_file = LogicalFileModel(file_name=file_name, frames=[])
+        placements = []
+        try:
+            logical_file.logical_id = file.fileheader.id
+            if self.summary_sections:
+                with profile.stage('summary', position):
+                    logical_file.summary = get_logical_file_summary(file, self.summary_sections, self.summary_parameters)
+            frames: list[Frame] = file.find('FRAME')
+
+            # If there are no frames, set the error flag and the error message
+            if not frames:
+                logical_file.error = True
+                logical_file.error_message = 'No frames found in the logical file'
+                placements.append('error_files')
+                return logical_file, placements
+
+            # NOTE Process each frame
+            # iterate over the frames and process each one
+            for frame_position, frame in enumerate(frames):
+                stage_position = (position, frame_position)
+
+                # Create a frame model and process the frame,
+                # NOTE it will return None if the frame has a DUMM channel
+                with profile.stage('frame_metadata', *stage_position):
                     frame_model = FrameProcessor.process_frame(frame, file_name=file_name, logical_id=file.fileheader.id)
 
-                    # If 'DUMM' channel is found, set the error flag and the error message
-                    if frame_model is None:
-                        logical_file.error = True
-                        logical_file.error_message = 'DUMM channel found in the frame'
-                        physical.error_files.append(logical_file)
-                        continue
-
-                    # Process the frame and check for DUMM channels
-                    data = FrameProcessor.dlis_curves_to_dataframe(frame)
-                    # Check if the data is an exception
-                    # If it is, set the error flag and the error message
-                    if data is Exception:
-                        self.logger.error(f'Error while processing the frame: {data}')
-                        frame_model.error = True
-                        frame_model.error_message = data.__str__()
-                        logical_file.error = True
-                        logical_file.error_message = data.__str__()
-                        logical_file.frames.append(frame_model)
-                        physical.error_files.append(logical_file)
-                        continue
-
-                    # Create a frame data model
-                    frame_data = FrameDataframe(
+                # If 'DUMM' channel is found, set the error flag and the error message
+                if frame_model is None:
+                    logical_file.error = True
+                    logical_file.error_message = 'DUMM channel found in the frame'
+                    placements.append('error_files')
+                    continue
+
+                # NOTE In lazy mode, the frame is only decoded when the data is accessed
+                if self.lazy:
+                    frame_data = LazyFrameDataframe(
                         file_name=file_name,
                         logical_file_id=file.fileheader.id,
-                        data=json.loads(data.to_json(orient='records')),
+                        index_name=FrameProcessor.frame_index_name(frame),
                     )
-                    # Set the frame data to the frame model
-                    frame_model.data = frame_data
+                    frame_data.set_loader(
+                        partial(self.decode_frame, frame, file_name, file.fileheader.id, profile, stage_position)
+                    )
+                else:
+                    frame_data = self.decode_frame(frame, file_name, file.fileheader.id, profile, stage_position)
+
+                # Check if the data is an exception
+                # If it is, set the error flag and the error message
+                if isinstance(frame_data, Exception):
+                    self.logger.error(f'Error while processing the frame: {frame_data}')
+                    frame_model.error = True
+                    frame_model.error_message = frame_data.__str__()
+                    logical_file.error = True
+                    logical_file.error_message = frame_data.__str__()
                     logical_file.frames.append(frame_model)
+                    placements.append('error_files')
+                    continue
 
-                # Append the logical file to the physical file
-                physical.logical_files.append(logical_file)
+                # Set the frame data to the frame model
+                frame_model.data = frame_data
+                logical_file.frames.append(frame_model)
 
-                return physical
+            # Append the logical file to the physical file
+            placements.append('logical_files')
+            return logical_file, placements
 
-            except Exception as e:
-                self.logger.error(f'Error while processing the logical file: {e}')
-                logical_file.error = True
-                logical_file.error_message = e.__str__()
-                physical.error_files.append(logical_file)
-                continue
+        except Exception as e:
+            self.logger.error(f'Error while processing the logical file: {e}')
+            logical_file.error = True
+            logical_file.error_message = e.__str__()
+            placements.append('error_files')
+            return logical_file, placements
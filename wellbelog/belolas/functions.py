@@ -1,6 +1,10 @@
+from typing import Optional
+
 import lasio
+import numpy as np
 
-from wellbelog.schemas.las import LasCurvesSpecs
+from wellbelog.schemas.las import LasCurvesTable
+from wellbelog.schemas.scan import ChannelHeader, FrameHeader
 
 
 def open_las_file(path: str) -> lasio.las.LASFile:
@@ -14,15 +18,77 @@ def open_las_file(path: str) -> lasio.las.LASFile:
         return e
 
 
-def process_curves_items(las_file: lasio.las.LASFile) -> LasCurvesSpecs:
+def open_las_header(path: str) -> lasio.las.LASFile:
+    """
+    Opens only the header sections of a LAS file, the data section is not parsed.
+    """
+    try:
+        return lasio.read(path, ignore_data=True)
+    except Exception as e:
+        return e
+
+
+def header_value(las_file: lasio.las.LASFile, mnemonic: str) -> Optional[float]:
+    """
+    Get a numeric value from the ~Well section, or None if it is missing or not a number.
     """
-    Processes the curves items in a LAS file and returns a LasCurvesSpecs object.
+    try:
+        return float(las_file.well[mnemonic].value)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def get_las_frame_header(las_file: lasio.las.LASFile) -> FrameHeader:
+    """
+    Create a FrameHeader from the ~Curve and ~Well sections of a LAS file.
+    The samples count is computed from STRT, STOP and STEP.
+    """
+    channels = [
+        ChannelHeader(name=curve.mnemonic, units=curve.unit or None, long_name=curve.descr or None)
+        for curve in las_file.curves
+    ]
+    start = header_value(las_file, 'STRT')
+    stop = header_value(las_file, 'STOP')
+    step = header_value(las_file, 'STEP')
+    samples = None
+    if start is not None and stop is not None and step:
+        samples = int(round((stop - start) / step)) + 1
+
+    direction = None
+    if start is not None and stop is not None and start != stop:
+        direction = 'INCREASING' if stop > start else 'DECREASING'
+
+    return FrameHeader(
+        index_name=channels[0].name if channels else None,
+        index_units=channels[0].units if channels else None,
+        channels=channels,
+        start=start,
+        stop=stop,
+        spacing=step,
+        direction=direction,
+        samples=samples,
+    )
+
+
+def process_curves_items(las_file: lasio.las.LASFile) -> LasCurvesTable:
+    """
+    Processes the curves items in a LAS file and returns a LasCurvesTable object.
+    The curves are stored by field, no model is built per curve.
     """
     curves = las_file.curves
-    specs = []
-    for curve in curves:
-        curve_dict = curve.__dict__
-        data = curve_dict.pop('data')
-        spec = LasCurvesSpecs(**curve_dict, shape=data.shape)
-        specs.append(spec)
-    return specs
+    return LasCurvesTable({
+        'mnemonic': [curve.mnemonic for curve in curves],
+        'unit': [curve.unit for curve in curves],
+        'descr': [curve.descr for curve in curves],
+        'value': [curve.value for curve in curves],
+        'original_mnemonic': [curve.original_mnemonic for curve in curves],
+        'shape': [curve.data.shape for curve in curves],
+    })
+
+
+def get_curves_arrays(las_file: lasio.las.LASFile) -> dict[str, np.ndarray]:
+    """
+    Get the curves data of a LAS file as a dict of NumPy arrays.
+    The arrays are the ones held by lasio, no copy is made.
+    """
+    return {curve.mnemonic: curve.data for curve in las_file.curves}
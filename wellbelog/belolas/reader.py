@@ -1,18 +1,53 @@
 import json
+import os
 import pathlib
+from typing import Iterable, Optional
 
+from wellbelog.utils.cache import ParseCache, cached_reading
+from wellbelog.utils.nullvalues import NULL_VALUES, replace_null_values
 from wellbelog.utils.logging import setup_logger
+from wellbelog.utils.profiling import Profiler, attach_profile, file_profile
+from wellbelog.utils.scanner import scan_log_files
 from ..schemas.las import LasFileModel, LasDataframe
-from .functions import open_las_file, process_curves_items
+from ..schemas.scan import LogicalFileHeader, PhysicalFileHeader
+from .functions import (
+    open_las_file, open_las_header, process_curves_items, get_curves_arrays, get_las_frame_header, header_value
+)
 
 
 class LasReader:
     """
     Class responsible for creating a LasFileModel object from a physical file.
+
+    Attributes:
+        columnar (bool): If True, the curves data is stored as NumPy columns instead of records.
+        cache (ParseCache): Optional cache of the processed files.
+        mask_nulls (bool): If True, the null values of the curves are replaced with NaN.
+        null_values (set[float]): The null values, NULL_VALUES by default. The values declared in the file are added.
+        profiler (Profiler): Optional timing hooks, of the open, specs, mask_nulls, dataframe, json and build stages.
+            None disables them.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        columnar: bool = False,
+        cache: Optional[ParseCache] = None,
+        mask_nulls: bool = False,
+        null_values: Optional[Iterable[float]] = None,
+        profiler: Optional[Profiler] = None,
+    ) -> None:
         self.logger = setup_logger(__class__.__name__)
+        self.columnar = columnar
+        self.cache = cache
+        self.mask_nulls = mask_nulls
+        self.null_values = set(null_values) if null_values is not None else set(NULL_VALUES)
+        self.profiler = profiler
+
+    def reader_options(self) -> dict:
+        """
+        The options that change the result of the reader.
+        """
+        return {'columnar': self.columnar, 'mask_nulls': self.mask_nulls, 'null_values': sorted(self.null_values)}
 
     def load_raw(self, path_to_file: str) -> LasFileModel:
         """
@@ -26,6 +61,9 @@ class LasReader:
         """
         return open_las_file(path_to_file)
 
+    def _walk_error(self, error: OSError) -> None:
+        self.logger.error(f'Error while searching for LAS files: {error}')
+
     def search_files(self, path: str) -> list[pathlib.Path]:
         """
         Search for LAS files in the given path and returns a list with the file paths.
@@ -41,13 +79,45 @@ class LasReader:
         """
         las_files = []
         try:
-            for file in pathlib.Path(path).rglob('*.las'):
-                las_files.append(file)
+            # NOTE The extensions are matched in any case, the tree is walked in threads
+            for file in scan_log_files(path, file_types=['las'], sniff='never', on_error=self._walk_error):
+                las_files.append(pathlib.Path(file.path))
             return las_files
         except Exception as e:
             self.logger.error(f'Error while searching for LAS files: {e}')
             return las_files
 
+    def scan(self, path: str) -> PhysicalFileHeader:
+        """
+        Scan a LAS file and return only its metadata: the curves, the depth range and the samples count.
+        Only the header sections are parsed, the data section is skipped.
+
+        Args:
+            path (str): The path to the file.
+
+        Returns:
+            PhysicalFileHeader: The metadata of the file, with a single logical file.
+        """
+        file_name = pathlib.Path(path).name
+        header = PhysicalFileHeader(file_name=file_name, file_type='las')
+        file = open_las_header(path)
+        if isinstance(file, Exception):
+            self.logger.error(f'Error while scanning LAS file: {file}')
+            header.error = True
+            header.error_message = str(file)
+            return header
+
+        logical_header = LogicalFileHeader(logical_id=0)
+        try:
+            logical_header.frames = [get_las_frame_header(file)]
+        except Exception as e:
+            self.logger.error(f'Error while scanning LAS file: {e}')
+            logical_header.error = True
+            logical_header.error_message = str(e)
+        header.logical_files.append(logical_header)
+        return header
+
+    @cached_reading
     def process_las_file(self, path: str) -> LasFileModel:
         """
         Processes a physical file and returns a LasFileModel object.
@@ -64,28 +134,59 @@ class LasReader:
         # Create a LasFileModel object with the file name
         file_name = pathlib.Path(path).name
         las_file_model = LasFileModel(file_name=file_name)
+        profile = file_profile(self.profiler, file_name)
 
         # Open the LAS file
-        file = open_las_file(path)
+        # NOTE lasio parses the data section while opening, so the open stage includes the curves
+        with profile.stage('open') as stage:
+            file = open_las_file(path)
+            if not isinstance(file, Exception):
+                stage.bytes = os.path.getsize(path)
+                stage.samples = len(file.index)
 
         # NOTE If the file has any error, return the error message
         if isinstance(file, Exception):
             las_file_model.error = True
             las_file_model.error_message = file
+            attach_profile(self.profiler, las_file_model, profile)
             return las_file_model
 
         try:
-            las_data = file.df()
-            shape_data = las_data.shape
-            las_curves_specs = process_curves_items(file)
+            samples = len(file.index)
+            with profile.stage('specs', 0):
+                las_curves_specs = process_curves_items(file)
             las_file_model.specs = las_curves_specs
-
-            las_dataframe = LasDataframe(
-                data=json.loads(las_data.to_json(orient='records')),
-                file_name=file_name,
-                columns=file.keys(),
-                shape=shape_data
-            )
+            index_name = file.curves[0].mnemonic if file.curves else None
+            if self.mask_nulls:
+                with profile.stage('mask_nulls', 0, 0, samples=samples):
+                    # NOTE lasio already replaces the ~Well NULL, the other null values are replaced in the curves arrays
+                    declared = header_value(file, 'NULL')
+                    null_values = self.null_values | ({declared} if declared is not None else set())
+                    replace_null_values(get_curves_arrays(file), null_values)
+
+            if self.columnar:
+                with profile.stage('build', 0, 0, samples=samples):
+                    # NOTE The curves data arrays are used as they are, the index is kept as a column
+                    arrays = get_curves_arrays(file)
+                    las_dataframe = LasDataframe.from_arrays(
+                        arrays,
+                        file_name=file_name,
+                        columns=file.keys(),
+                        shape=(len(file.index), len(arrays)),
+                        index_name=index_name,
+                    )
+            else:
+                with profile.stage('dataframe', 0, 0, samples=samples):
+                    # NOTE lasio uses the first curve as the index, it is kept as a column like in the columnar mode
+                    las_data = file.df().reset_index()
+                with profile.stage('json', 0, 0, samples=samples):
+                    las_dataframe = LasDataframe(
+                        data=json.loads(las_data.to_json(orient='records')),
+                        file_name=file_name,
+                        columns=file.keys(),
+                        shape=las_data.shape,
+                        index_name=index_name,
+                    )
             las_file_model.data = las_dataframe
             return las_file_model
 
@@ -94,3 +195,6 @@ class LasReader:
             las_file_model.error = True
             las_file_model.error_message = str(e)
             return las_file_model
+
+        finally:
+            attach_profile(self.profiler, las_file_model, profile)
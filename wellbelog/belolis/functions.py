@@ -1,8 +1,27 @@
-from typing import Union
+from typing import Iterator, Optional, Union
 
-from dlisio import lis
+from dlisio import core, lis
+import numpy as np
 import pandas as pd
 
+from wellbelog.schemas.lis import LisSampleRateLayout
+from wellbelog.schemas.scan import ChannelHeader, FrameHeader
+from wellbelog.utils.nullvalues import replace_null_values
+
+# NOTE The one pass reading uses dlisio internals, not part of its public API.
+# Without them, the format specs are read with lis.curves, once per sample rate.
+try:
+    from dlisio.lis.curves import is_index, nptype, reprc2fmt, spec_dtype, validate_dfsr
+    ONE_PASS_READING = all(hasattr(core, name) for name in ('frameconfig', 'read_data_records', 'lis_fmt'))
+except ImportError:
+    ONE_PASS_READING = False
+
+    def is_index(i: int, mode: int) -> bool:
+        return mode == 0 and i == 0
+
+# NOTE LIS up/down flag, up logging means the depth is decreasing
+LIS_DIRECTIONS = {1: 'DECREASING', 255: 'INCREASING'}
+
 
 def read_lis_file(path_to_file: str) -> Union[lis.PhysicalFile, Exception]:
     """
@@ -28,6 +47,31 @@ def parse_lis_physical_file(file: lis.PhysicalFile) -> list[lis.LogicalFile]:
     return f
 
 
+def get_lis_header(logical_file: lis.LogicalFile) -> Union[str, None]:
+    """
+    Get the file header of a LIS logical file as a string.
+    One line for each attribute of the header.
+
+    Args:
+        logical_file (lis.LogicalFile): A LIS file.
+
+    Returns:
+        str: The header of the file, or None if the file has no header.
+    """
+    header = logical_file.header()
+    if header is None:
+        return None
+    attrs = [
+        'file_name', 'service_sublvl_name', 'version_number', 'date_of_generation',
+        'max_pr_length', 'file_type', 'prev_file_name'
+    ]
+    lines = []
+    for attr in attrs:
+        value = getattr(header, attr, None)
+        lines.append(f'{attr}: {value.strip() if isinstance(value, str) else value}')
+    return '\n'.join(lines)
+
+
 def get_lis_data_spec(file: lis.LogicalFile) -> Union[lis.DataFormatSpec, list[lis.DataFormatSpec]]:
     """
     Get the data specification of a LIS file.
@@ -114,37 +158,255 @@ def get_lis_wellsite_components(logical_file: lis.LogicalFile) -> list[dict]:
     return file_records
 
 
-def get_curves(logical_file: lis.LogicalFile) -> list[pd.DataFrame]:
+def iter_curves_chunks(
+    logical_file: lis.LogicalFile,
+    format_spec: lis.DataFormatSpec,
+    sample_rate: int = None,
+    chunk_size: int = 10000,
+) -> Iterator[np.ndarray]:
     """
-    Get the curves of a LIS file.
+    Iterate over the curves of a format spec in chunks of rows.
+
+    NOTE dlisio can only read a whole format spec, so the chunks are views over the decoded curves.
+    The dataframes and the records are never created, so the memory is bounded by the raw curves.
 
     Args:
         logical_file (lis.LogicalFile): A LIS file.
+        format_spec (lis.DataFormatSpec): The format spec to read.
+        sample_rate (int): The sample rate to read, required if the format spec has more than one.
+        chunk_size (int): The number of rows of each chunk.
+
+    Yields:
+        np.ndarray: A structured array for each chunk.
+    """
+    assert chunk_size > 0, 'The chunk size must be positive.'
+    data = lis.curves(logical_file, format_spec, sample_rate)
+    for start in range(0, len(data), chunk_size):
+        yield data[start:start + chunk_size]
+
+
+def curves_to_dataframe(curves: np.ndarray) -> pd.DataFrame:
+    """
+    Create a dataframe from the curves read by dlisio, with the mnemonics stripped.
+    The fast channels, 2D arrays, are kept as one column with the samples of each frame.
+
+    Args:
+        curves (np.ndarray): The structured array of a format spec.
 
     Returns:
         pd.DataFrame: A DataFrame containing the curves.
     """
-    try:
-        format_specs = logical_file.data_format_specs()
-
-        if len(format_specs) == 1:
-            format_spec = format_specs[0]
-            sample_rates = format_spec.sample_rates()
-            if len(sample_rates) == 1:
-                sample_rate = sample_rates
-                data = lis.curves(logical_file, format_spec)
-                df = pd.DataFrame(data)
-                df.columns = df.columns.str.strip()
-                return [df]
-        else:
-            dfs = []
-            for format_spec in format_specs:
-                sample_rates = format_spec.sample_rates()
-                for sample_rate in sample_rates:
-                    data = lis.curves(logical_file, format_spec, sample_rate)
-                    df = pd.DataFrame(data)
-                    df.columns = df.columns.str.strip()
-                    dfs.append(df)
-            return dfs
-    except Exception as e:
-        print(e)
+    if any(curves.dtype[name].ndim for name in curves.dtype.names or []):
+        df = pd.DataFrame({name: curves[name] if curves[name].ndim == 1 else list(curves[name]) for name in curves.dtype.names})
+    else:
+        df = pd.DataFrame(curves)
+    df.columns = df.columns.str.strip()
+    return df
+
+
+def get_curves(logical_file: lis.LogicalFile, null_values: Optional[set[float]] = None) -> list[pd.DataFrame]:
+    """
+    Get the curves of a LIS file, one DataFrame per format spec.
+    The fast channels are kept as one column with the samples of each frame, see `read_format_spec`.
+
+    Args:
+        logical_file (lis.LogicalFile): A LIS file.
+        null_values (set[float], optional): If given, these values and the absent values are replaced with NaN.
+
+    Returns:
+        list[pd.DataFrame]: The curves of each format spec.
+    """
+    return [
+        curves_to_dataframe(read_format_spec(logical_file, format_spec, null_values))
+        for format_spec in logical_file.data_format_specs()
+    ]
+
+
+def format_spec_dtype(format_spec: lis.DataFormatSpec) -> np.dtype:
+    """
+    The dtype of the frames of a format spec, with all the sample rates.
+    The fast channels, sampled n times per frame, are subarrays of n samples, like a (frames, n) array.
+    The names are the mnemonics, like the ones of lis.curves.
+    It needs the dlisio internals, see ONE_PASS_READING.
+    """
+    types = []
+    if format_spec.depth_mode == 1:
+        types.append((format_spec.default_index_mnem, nptype[core.lis_reprc(format_spec.depth_reprc)]))
+    for i, spec in enumerate(format_spec.specs):
+        if spec.reserved_size < 0:
+            continue
+        dtype = spec_dtype(spec)
+        if spec.samples > 1 and not is_index(i, format_spec.depth_mode):
+            dtype = np.dtype((dtype.base, (spec.samples,) + dtype.shape))
+        types.append((spec.mnemonic, dtype))
+    return np.dtype(types)
+
+
+def _has_fast_strings(format_spec: lis.DataFormatSpec) -> bool:
+    """
+    If the format spec has a string channel sampled more than once per frame.
+    Their samples can not be read as the entries of one sample, so the format spec is read per sample rate.
+    """
+    return any(
+        spec.samples > 1 and spec.reserved_size >= 0 and core.lis_reprc(spec.reprc) == core.lis_reprc.string
+        for i, spec in enumerate(format_spec.specs) if not is_index(i, format_spec.depth_mode)
+    )
+
+
+def _format_spec_fmtstr(format_spec: lis.DataFormatSpec) -> tuple[str, str]:
+    """
+    The dlisio format strings of the index and of the other channels, reading all the sample rates at once.
+    The format spec can not have fast string channels, see `_has_fast_strings`.
+    NOTE The samples of a fast channel are consecutive in the frame, so they are read as the entries of one sample.
+    """
+    if format_spec.depth_mode == 1:
+        index_reprc = core.lis_reprc(format_spec.depth_reprc)
+    else:
+        index_reprc = core.lis_reprc(format_spec.specs[0].reprc)
+    fmt = []
+    for i, spec in enumerate(format_spec.specs):
+        if is_index(i, format_spec.depth_mode):
+            continue
+        if spec.reserved_size < 0:
+            fmt.append(chr(core.lis_fmt.suppress) + str(abs(spec.reserved_size)))
+            continue
+        reprc = core.lis_reprc(spec.reprc)
+        if reprc == core.lis_reprc.string:
+            fmt.append(reprc2fmt(reprc) + str(spec.reserved_size))
+            continue
+        fmt.append(reprc2fmt(reprc) + str(spec.reserved_size // core.lis_sizeof_type(reprc)))
+    return reprc2fmt(index_reprc) + '1', ''.join(fmt)
+
+
+def _read_format_spec_per_rate(logical_file: lis.LogicalFile, format_spec: lis.DataFormatSpec) -> np.ndarray:
+    """
+    Read a format spec with one lis.curves call per sample rate, and regroup the fast samples by frame.
+    The fields keep the order of the format spec, like `format_spec_dtype`.
+    """
+    frames = lis.curves(logical_file, format_spec, sample_rate=1)
+    columns = {name: frames[name] for name in frames.dtype.names}
+    for sample_rate in sorted(format_spec.sample_rates() - {1}):
+        fast = lis.curves(logical_file, format_spec, sample_rate=sample_rate)
+        # NOTE The first field is the index, interpolated by dlisio for the fast samples
+        for name in fast.dtype.names[1:]:
+            columns[name] = fast[name].reshape((len(frames), sample_rate) + fast[name].shape[1:])
+    order = {spec.mnemonic: i for i, spec in reversed(list(enumerate(format_spec.specs)))}
+    # NOTE The index comes first, it is not a spec in depth mode 1
+    names = [frames.dtype.names[0]] + sorted(set(columns) - {frames.dtype.names[0]}, key=order.get)
+    data = np.empty(len(frames), dtype=[(name, columns[name].dtype, columns[name].shape[1:]) for name in names])
+    for name in names:
+        data[name] = columns[name]
+    return data
+
+
+def read_format_spec(
+    logical_file: lis.LogicalFile,
+    format_spec: lis.DataFormatSpec,
+    null_values: Optional[set[float]] = None,
+) -> np.ndarray:
+    """
+    Read the curves of all the sample rates of a format spec in one pass over its data records.
+    The frames share one depth, the index recorded in the file, and the fast channels are kept as 2D arrays,
+    with one row per frame and one column per sample, instead of one array per sample rate.
+    Without the dlisio internals, see ONE_PASS_READING, or with fast string channels, it is read once per sample rate.
+
+    Args:
+        logical_file (lis.LogicalFile): A LIS file.
+        format_spec (lis.DataFormatSpec): The format spec to read.
+        null_values (set[float], optional): If given, these values and the absent value
+            of the format spec are replaced with NaN.
+
+    Returns:
+        np.ndarray: A structured array, with one row per frame.
+    """
+    if ONE_PASS_READING:
+        validate_dfsr(format_spec)
+    if not ONE_PASS_READING or _has_fast_strings(format_spec):
+        data = _read_format_spec_per_rate(logical_file, format_spec)
+    else:
+        dtype = format_spec_dtype(format_spec)
+        index_fmt, fmt = _format_spec_fmtstr(format_spec)
+        spacing = format_spec.directional_spacing() if format_spec.depth_mode == 1 else 0
+        config = core.frameconfig(index_fmt, fmt, 1, format_spec.depth_mode, spacing, dtype.itemsize)
+        data = core.read_data_records(
+            logical_file.io, logical_file.index, format_spec.info, config, lambda size: np.empty(size, dtype=dtype),
+        )
+    if null_values is not None:
+        absent = {format_spec.absent_value} if format_spec.absent_value is not None else set()
+        replace_null_values(data, null_values | absent)
+    return data
+
+
+def sample_rates_layout(format_spec: lis.DataFormatSpec, frame: int, frames_count: int) -> list[LisSampleRateLayout]:
+    """
+    The channels of each sample rate of a format spec.
+
+    Args:
+        format_spec (lis.DataFormatSpec): The format spec.
+        frame (int): The position of the frame of the format spec in the logical file.
+        frames_count (int): The number of frames read, the samples of a rate are frames_count * sample_rate.
+
+    Returns:
+        list[LisSampleRateLayout]: One layout per sample rate, from the slowest.
+    """
+    rates: dict[int, list[str]] = {}
+    for i, spec in enumerate(format_spec.specs):
+        if spec.reserved_size < 0 or is_index(i, format_spec.depth_mode):
+            continue
+        rates.setdefault(spec.samples, []).append(spec.mnemonic.strip())
+    spacing = format_spec.spacing
+    spacing = float(spacing) if isinstance(spacing, (int, float)) else None
+    return [
+        LisSampleRateLayout(
+            frame=frame,
+            sample_rate=sample_rate,
+            channels=channels,
+            samples=frames_count * sample_rate,
+            spacing=spacing / sample_rate if spacing else None,
+        )
+        for sample_rate, channels in sorted(rates.items())
+    ]
+
+
+def get_format_spec_header(logical_file: lis.LogicalFile, format_spec: lis.DataFormatSpec) -> FrameHeader:
+    """
+    Create a FrameHeader from a data format spec, without reading the curves.
+    The samples are estimated from the sizes of the data records that follow the format spec.
+
+    Args:
+        logical_file (lis.LogicalFile): The LIS logical file.
+        format_spec (lis.DataFormatSpec): The data format spec.
+
+    Returns:
+        FrameHeader: The metadata of the format spec.
+    """
+    channels = [
+        ChannelHeader(
+            name=spec.mnemonic.strip(),
+            units=(spec.units.strip() or None) if isinstance(spec.units, str) else None,
+            dimension=[spec.samples] if getattr(spec, 'samples', None) else None,
+        )
+        for spec in format_spec.specs
+    ]
+
+    # NOTE The data records belong to the last format spec before them
+    start = format_spec.info.ltell
+    next_specs = [spec.info.ltell for spec in logical_file.data_format_specs() if spec.info.ltell > start]
+    stop = min(next_specs) if next_specs else float('inf')
+    records = [
+        info for info in logical_file.index.implicits()
+        if info.type.name in ('normal_data', 'alternate_data') and start < info.ltell < stop
+    ]
+    # NOTE Each data record holds whole frames, plus the record headers
+    samples = sum(info.size // format_spec.frame_size for info in records) if format_spec.frame_size else None
+
+    spacing = format_spec.spacing
+    index_name = format_spec.index_mnem.strip() if isinstance(format_spec.index_mnem, str) else None
+    return FrameHeader(
+        index_name=index_name or (channels[0].name if channels else None),
+        index_units=format_spec.index_units.strip() if isinstance(format_spec.index_units, str) else None,
+        channels=channels,
+        spacing=float(spacing) if isinstance(spacing, (int, float)) else None,
+        direction=LIS_DIRECTIONS.get(format_spec.direction),
+        samples=samples,
+    )
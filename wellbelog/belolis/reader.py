@@ -1,16 +1,29 @@
 import json
+import os
 import pathlib
-from typing import Union
+from typing import Iterable, Iterator, Optional, Union
 
 from dlisio import lis
+import numpy as np
+import pandas as pd
 
+from wellbelog.utils.arrays import format_chunks
+from wellbelog.utils.cache import ParseCache, cached_reading
+from wellbelog.utils.nullvalues import NULL_VALUES, replace_null_values
 from wellbelog.utils.logging import setup_logger
-from .functions import read_lis_file, parse_lis_physical_file, get_curves, get_physical_lis_specs, get_lis_wellsite_components
+from wellbelog.utils.profiling import Profiler, attach_profile, file_profile
+from wellbelog.utils.scanner import scan_log_files
+from .functions import (
+    read_lis_file, parse_lis_physical_file, curves_to_dataframe, read_format_spec, get_lis_header,
+    get_physical_lis_specs, get_lis_wellsite_components, get_format_spec_header, iter_curves_chunks,
+    sample_rates_layout
+)
 from ..schemas.lis import (
-    FrameLisCurves, LisLogicalFileSpecsDict, LisLogicalFileWellSiteSpecDict,
+    FrameLisCurves, LisSpecsTable, LisLogicalFileWellSiteSpecDict,
     PhysicalLisFileModel, LisLogicalWellSiteSpec, LOGICAL_FILE_ATTR,
     LogicalLisFileModel, LisLogicalSpecs
 )
+from ..schemas.scan import LogicalFileHeader, PhysicalFileHeader
 
 
 class LisReader:
@@ -19,13 +32,40 @@ class LisReader:
 
     Attributes:
         logger: The logger instance for logging messages.
+        columnar (bool): If True, the curves data is stored as NumPy columns instead of records.
+        cache (ParseCache): Optional cache of the processed files.
+        mask_nulls (bool): If True, the null values of the curves are replaced with NaN.
+        null_values (set[float]): The null values, NULL_VALUES by default. The values declared in the file are added.
+        profiler (Profiler): Optional timing hooks, of the open, header, curves, dataframe, json and build stages.
+            None disables them.
 
     Methods:
         process_physical_file: Reads a LIS file and returns a list of LogicalFile objects.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        columnar: bool = False,
+        cache: Optional[ParseCache] = None,
+        mask_nulls: bool = False,
+        null_values: Optional[Iterable[float]] = None,
+        profiler: Optional[Profiler] = None,
+    ) -> None:
         self.logger = setup_logger(__class__.__name__)
+        self.columnar = columnar
+        self.cache = cache
+        self.mask_nulls = mask_nulls
+        self.null_values = set(null_values) if null_values is not None else set(NULL_VALUES)
+        self.profiler = profiler
+
+    def reader_options(self) -> dict:
+        """
+        The options that change the result of the reader.
+        """
+        return {'columnar': self.columnar, 'mask_nulls': self.mask_nulls, 'null_values': sorted(self.null_values)}
+
+    def _walk_error(self, error: OSError) -> None:
+        self.logger.error(f'Error while searching for LIS files: {error}')
 
     def search_files(self, path: str) -> list[pathlib.Path]:
         """
@@ -39,13 +79,52 @@ class LisReader:
         """
         lis_files = []
         try:
-            for file in pathlib.Path(path).rglob('*.lis'):
-                lis_files.append(file)
+            # NOTE The extensions are matched in any case, the tree is walked in threads
+            for file in scan_log_files(path, file_types=['lis'], sniff='never', on_error=self._walk_error):
+                lis_files.append(pathlib.Path(file.path))
             return lis_files
         except Exception as e:
             self.logger.error(f'Error while searching for LIS files: {e}')
             return lis_files
 
+    def iter_curves_chunks(
+        self,
+        path_to_file: str,
+        logical_file: int = 0,
+        format_spec: int = 0,
+        sample_rate: Optional[int] = None,
+        chunk_size: int = 10000,
+        depth_step: Optional[float] = None,
+        as_dataframe: bool = False,
+    ) -> Iterator[Union[np.ndarray, pd.DataFrame]]:
+        """
+        Iterate over the curves of a format spec in chunks.
+        The file is closed when the iteration ends.
+
+        Args:
+            path_to_file (str): Path to the LIS file.
+            logical_file (int): The position of the logical file.
+            format_spec (int): The position of the format spec in the logical file.
+            sample_rate (int, optional): The sample rate to read, required if the format spec has more than one.
+            chunk_size (int): The number of rows of each chunk.
+            depth_step (float, optional): If given, the chunks are regrouped in windows of this depth.
+            as_dataframe (bool): If True, yields dataframes instead of NumPy structured arrays.
+
+        Yields:
+            Union[np.ndarray, pd.DataFrame]: The chunks of the curves.
+        """
+        physical = self.load_raw(str(path_to_file))
+        try:
+            lis_file = parse_lis_physical_file(physical)[logical_file]
+            spec = lis_file.data_format_specs()[format_spec]
+            chunks = iter_curves_chunks(lis_file, spec, sample_rate=sample_rate, chunk_size=chunk_size)
+            if self.mask_nulls:
+                null_values = self.null_values | ({spec.absent_value} if spec.absent_value is not None else set())
+                chunks = (replace_null_values(chunk, null_values) for chunk in chunks)
+            yield from format_chunks(chunks, depth_step=depth_step, as_dataframe=as_dataframe)
+        finally:
+            physical.close()
+
     def load_raw(self, path_to_file: str, unpack=False) -> Union[lis.PhysicalFile, list[lis.LogicalFile]]:
         """
         Load a LIS file and return the raw data.
@@ -65,6 +144,44 @@ class LisReader:
             return parse_lis_physical_file(file)
         return file
 
+    def scan(self, path_to_file: str) -> PhysicalFileHeader:
+        """
+        Scan a LIS file and return only its metadata: the logical files, channels and samples count.
+        The curves are not read, the samples are estimated from the data records sizes.
+
+        Args:
+            path_to_file (str): Path to the LIS file.
+
+        Returns:
+            PhysicalFileHeader: The metadata of the file.
+        """
+        file_name = pathlib.Path(path_to_file).name
+        header = PhysicalFileHeader(file_name=file_name, file_type='lis')
+        physical = read_lis_file(str(path_to_file))
+        if isinstance(physical, Exception):
+            self.logger.error(f"Error reading file: {physical}")
+            header.error = True
+            header.error_message = str(physical)
+            return header
+
+        try:
+            for logical_id, logical_file in enumerate(parse_lis_physical_file(physical)):
+                logical_header = LogicalFileHeader(logical_id=logical_id)
+                try:
+                    logical_header.frames = [
+                        get_format_spec_header(logical_file, format_spec)
+                        for format_spec in logical_file.data_format_specs()
+                    ]
+                except Exception as e:
+                    self.logger.error(f"Error scanning file: {e}")
+                    logical_header.error = True
+                    logical_header.error_message = str(e)
+                header.logical_files.append(logical_header)
+        finally:
+            physical.close()
+        return header
+
+    @cached_reading
     def process_physical_file(self, path_to_file: str, folder_name: str = None) -> PhysicalLisFileModel:
         """
         Read a LIS file and return a list of LogicalFile objects.
@@ -78,20 +195,24 @@ class LisReader:
         file_name = pathlib.Path(path_to_file)
         assert file_name.is_file(), f"File {file_name} not found."
         file = PhysicalLisFileModel(file_name=file_name.name, logical_files=[], folder_name=folder_name)
+        profile = file_profile(self.profiler, file_name.name)
 
         # Reading the LIS file
-        physical = read_lis_file(path_to_file)
+        with profile.stage('open') as stage:
+            physical = read_lis_file(path_to_file)
+            if not isinstance(physical, Exception):
+                stage.bytes = os.path.getsize(path_to_file)
+                # NOTE Unpacking the physical file
+                logical_files = parse_lis_physical_file(physical)
         # NOTE Handling exceptions, if any, mark the file as errored and return it
         if isinstance(physical, Exception):
             self.logger.error(f"Error reading file: {physical}")
             self.logger.error(physical)
             file.error = True
             file.error_message = "Error reading file"
+            attach_profile(self.profiler, file, profile)
             return file
 
-        # NOTE Unpacking the physical file
-        logical_files = parse_lis_physical_file(physical)
-
         # XXX Creating LogicalFile objects
         for logical_file in logical_files:
             logical_file_id = logical_files.index(logical_file)
@@ -100,31 +221,54 @@ class LisReader:
                 file_name=file_name.name,
                 logical_id=logical_file_id,
             )
-            logical_file_model.header = logical_file.header()
+            with profile.stage('header', logical_file_id):
+                logical_file_model.header = get_lis_header(logical_file)
 
-            # NOTE Getting well site specifications
-            well_specs = [d for d in get_lis_wellsite_components(logical_file)]
-            _specs_dicts = [LisLogicalFileWellSiteSpecDict(**spec) for spec in well_specs]
-            well_site_specs = LisLogicalWellSiteSpec(file_name=file_name.name, logical_id=logical_file_id, specs_dicts=_specs_dicts)  # noqa
+                # NOTE Getting well site specifications
+                well_specs = [d for d in get_lis_wellsite_components(logical_file)]
+                _specs_dicts = [LisLogicalFileWellSiteSpecDict(**spec) for spec in well_specs]
+                well_site_specs = LisLogicalWellSiteSpec(file_name=file_name.name, logical_id=logical_file_id, specs_dicts=_specs_dicts)  # noqa
 
             logical_file_model.well_site_specs = well_site_specs
             # NOTE Getting the curves
             try:
                 # NOTE Getting the physical file specifications
-                physical_specs = [LisLogicalFileSpecsDict(**spec) for spec in get_physical_lis_specs(logical_file, LOGICAL_FILE_ATTR)]  # noqa
+                physical_specs = LisSpecsTable.from_rows(get_physical_lis_specs(logical_file, LOGICAL_FILE_ATTR))
                 lis_logical_specs = LisLogicalSpecs(file_name=file_name.name, logical_id=logical_file_id, specs_dicts=physical_specs)  # noqa
                 logical_file_model.specs = lis_logical_specs
-                curves = get_curves(logical_file)
                 curves_set_names = set()
-                for curve in curves:
-                    curve_model = FrameLisCurves(
-                        file_name=file_name.name,
-                        logical_file_id=logical_file_id,
-                        data=json.loads(curve.to_json(orient="records")),
-                    )
+                null_values = self.null_values if self.mask_nulls else None
+                # NOTE The null values are replaced while reading, so the curves stage includes them.
+                # Each format spec is one frame, with all its sample rates, the fast channels are 2D arrays.
+                with profile.stage('curves', logical_file_id) as stage:
+                    format_specs = logical_file.data_format_specs()
+                    raw_curves = [read_format_spec(logical_file, spec, null_values) for spec in format_specs]
+                    stage.bytes = sum(curve.nbytes for curve in raw_curves)
+                    stage.samples = sum(len(curve) for curve in raw_curves)
+                for frame_id, (format_spec, curve) in enumerate(zip(format_specs, raw_curves)):
+                    logical_file_model.sample_rates.extend(sample_rates_layout(format_spec, frame_id, len(curve)))
+                    if self.columnar:
+                        with profile.stage('build', logical_file_id, frame_id, samples=len(curve)):
+                            curve_model = FrameLisCurves.from_structured(
+                                curve,
+                                file_name=file_name.name,
+                                logical_file_id=logical_file_id,
+                                index_name=curve.dtype.names[0].strip() if curve.dtype.names else None,
+                            )
+                        names = curve_model.columns_names
+                    else:
+                        with profile.stage('dataframe', logical_file_id, frame_id, samples=len(curve)):
+                            curve = curves_to_dataframe(curve)
+                        with profile.stage('json', logical_file_id, frame_id, samples=len(curve)):
+                            curve_model = FrameLisCurves(
+                                file_name=file_name.name,
+                                logical_file_id=logical_file_id,
+                                data=json.loads(curve.to_json(orient="records")),
+                                index_name=curve.columns[0] if len(curve.columns) else None,
+                            )
+                        names = curve.columns
                     logical_file_model.frames.append(curve_model)
-                    for curve_name in curve.columns:
-                        curves_set_names.add(curve_name)
+                    curves_set_names.update(names)
                 logical_file_model.curves_names = list(curves_set_names)
                 file.logical_files.append(logical_file_model)
 
@@ -136,4 +280,5 @@ class LisReader:
                 self.logger.error(f"Error processing file: {e}")
                 continue
 
+        attach_profile(self.profiler, file, profile)
         return file
@@ -0,0 +1,2 @@
+from .mongo import MongoSink, get_client
+from .sql import SqlSink
@@ -0,0 +1,17 @@
+"""
+Helpers shared by the database backends.
+"""
+from typing import Any, Optional
+
+from wellbelog.schemas.base_schema import DataframeSchema
+
+LOGICAL_LISTS = ('logical_files', 'error_files')
+"""The lists of logical files of the physical file models."""
+
+
+def frame_dataframe(kind: str, frame: Any) -> Optional[DataframeSchema]:
+    """
+    Get the dataframe of a frame. The dlis frames hold a dataframe, the lis frames are the dataframes.
+    """
+    data = frame.data if kind == 'dlis' else frame
+    return data if isinstance(data, DataframeSchema) else None
@@ -0,0 +1,266 @@
+"""
+A MongoDB sink for the read files.
+
+The models are normalized in four collections:
+    - files: The physical file, without its logical files and data.
+    - logical_files: The logical files, with the id of the file and their position.
+    - frames: The frames, without their data, with the names, types and shapes of the columns.
+    - curve_chunks: The columns data, as raw typed bytes, split in chunks of rows below the document size limit.
+
+The documents are written with insert_many, in batches, and the clients are shared by URI,
+so all the sinks of a process use the same connection pool.
+"""
+import threading
+from typing import Iterable, Optional, Union
+
+from bson import Binary, ObjectId
+import numpy as np
+from pymongo import ASCENDING, MongoClient
+from pymongo.database import Database
+
+from wellbelog.db.common import LOGICAL_LISTS, frame_dataframe
+from wellbelog.schemas.base_schema import DataframeSchema
+from wellbelog.schemas.las import LasFileModel
+from wellbelog.utils.logging import setup_logger
+from wellbelog.utils.store import StoredModel, dump_model, load_model, model_type, storable_array
+
+MAX_CHUNK_BYTES = 4 * 1024 ** 2
+"""The max size of the data of a curve chunk, well below the 16MB limit of the documents."""
+MAX_BATCH_BYTES = 32 * 1024 ** 2
+"""The max size of the chunks buffered before an insert_many."""
+
+_clients: dict[str, MongoClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(uri: str, **kwargs) -> MongoClient:
+    """
+    Get the client of a URI, created once per process.
+    The MongoClient is thread safe and keeps a pool of connections, so it is shared by all the sinks.
+
+    Args:
+        uri (str): The MongoDB URI.
+        **kwargs: Options of the MongoClient, like maxPoolSize. Only used when the client is created.
+    """
+    with _clients_lock:
+        if uri not in _clients:
+            _clients[uri] = MongoClient(uri, **kwargs)
+        return _clients[uri]
+
+
+class MongoSink:
+    """
+    Writes the read files to MongoDB, in normalized collections.
+
+    Attributes:
+        database (Database): The database.
+        batch_size (int): The max number of documents of each insert_many.
+        max_chunk_bytes (int): The max size of the data of each curve chunk.
+        prefix (str): A prefix for the collections names.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        batch_size: int = 1000,
+        max_chunk_bytes: int = MAX_CHUNK_BYTES,
+        prefix: str = '',
+        create_indexes: bool = True,
+    ) -> None:
+        self.logger = setup_logger(__class__.__name__)
+        self.database = database
+        self.batch_size = batch_size
+        self.max_chunk_bytes = max_chunk_bytes
+        self.prefix = prefix
+        self.files = database[f'{prefix}files']
+        self.logical_files = database[f'{prefix}logical_files']
+        self.frames = database[f'{prefix}frames']
+        self.curve_chunks = database[f'{prefix}curve_chunks']
+        self._buffers: dict[str, list[dict]] = {}
+        self._buffered_bytes = 0
+        if create_indexes:
+            self.create_indexes()
+
+    @classmethod
+    def from_uri(cls, uri: str, database: str, client_options: Optional[dict] = None, **kwargs) -> 'MongoSink':
+        """
+        Create a sink over the shared client of a URI.
+
+        Args:
+            uri (str): The MongoDB URI.
+            database (str): The name of the database.
+            client_options (dict, optional): Options of the MongoClient, like maxPoolSize.
+            **kwargs: The other options of the sink.
+        """
+        return cls(get_client(uri, **(client_options or {}))[database], **kwargs)
+
+    def create_indexes(self) -> None:
+        """
+        Create the indexes used to read the files back.
+        """
+        self.logical_files.create_index([('file_id', ASCENDING), ('list', ASCENDING), ('position', ASCENDING)])
+        self.frames.create_index([('file_id', ASCENDING), ('logical_file_id', ASCENDING), ('position', ASCENDING)])
+        self.curve_chunks.create_index([('frame_id', ASCENDING), ('column', ASCENDING), ('chunk', ASCENDING)])
+
+    def _add(self, collection: str, document: dict, size: int = 0) -> None:
+        buffer = self._buffers.setdefault(collection, [])
+        buffer.append(document)
+        self._buffered_bytes += size
+        if len(buffer) >= self.batch_size or self._buffered_bytes >= MAX_BATCH_BYTES:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Insert the buffered documents.
+        The parents are inserted before the children, so a reader never finds an orphan chunk.
+        """
+        for collection in ('files', 'logical_files', 'frames', 'curve_chunks'):
+            documents = self._buffers.pop(collection, None)
+            if documents:
+                getattr(self, collection).insert_many(documents, ordered=False)
+        self._buffered_bytes = 0
+
+    def _add_chunks(self, file_id: ObjectId, frame_id: ObjectId, dataframe: DataframeSchema) -> list[dict]:
+        """
+        Split the columns of a dataframe in chunks, returning the description of the columns.
+        """
+        columns = []
+        for name, values in dataframe.as_arrays().items():
+            values = np.ascontiguousarray(storable_array(values))
+            row_bytes = max(values[:1].nbytes, 1)
+            rows_per_chunk = max(self.max_chunk_bytes // row_bytes, 1)
+            chunks = 0
+            for chunk, start in enumerate(range(0, len(values), rows_per_chunk)):
+                data = values[start:start + rows_per_chunk].tobytes()
+                self._add('curve_chunks', {
+                    'file_id': file_id,
+                    'frame_id': frame_id,
+                    'column': name,
+                    'chunk': chunk,
+                    'start': start,
+                    'data': Binary(data),
+                }, size=len(data))
+                chunks += 1
+            columns.append({'name': name, 'dtype': values.dtype.str, 'shape': list(values.shape), 'chunks': chunks})
+        return columns
+
+    def _add_frame(self, kind: str, file_id: ObjectId, logical_file_id: Optional[ObjectId], position: int, frame_dump: dict, dataframe) -> None:
+        frame_id = ObjectId()
+        document = {'_id': frame_id, 'file_id': file_id, 'logical_file_id': logical_file_id, 'position': position}
+        document['model'] = frame_dump
+        if dataframe is not None:
+            document['columns'] = self._add_chunks(file_id, frame_id, dataframe)
+        self._add('frames', document)
+
+    def write(self, model: StoredModel, flush: bool = True) -> ObjectId:
+        """
+        Write a model to the collections.
+        The id of the file is set in the model, if it has none.
+
+        Args:
+            model (StoredModel): A PhysicalFileModel, PhysicalLisFileModel or LasFileModel.
+            flush (bool): If False, the documents stay buffered until the next batch or flush.
+
+        Returns:
+            ObjectId: The id of the file document.
+        """
+        kind = model_type(model)
+        file_id = model.id if isinstance(model.id, ObjectId) else ObjectId()
+        # NOTE A shallow copy without the id, the ObjectId can not be dumped to JSON
+        dump = dump_model(model.model_copy(update={'id': None}))
+        model.id = file_id
+
+        if isinstance(model, LasFileModel):
+            data_dump = dump.pop('data', None)
+            self._add('files', {'_id': file_id, 'type': kind, 'model': dump})
+            if model.data is not None:
+                self._add_frame(kind, file_id, None, 0, data_dump, model.data)
+        else:
+            logical_dumps = {name: dump.pop(name, None) or [] for name in LOGICAL_LISTS}
+            self._add('files', {'_id': file_id, 'type': kind, 'model': dump})
+            for name in LOGICAL_LISTS:
+                for position, (logical_file, logical_dump) in enumerate(zip(getattr(model, name), logical_dumps[name])):
+                    logical_file_id = ObjectId()
+                    frames_dumps = logical_dump.pop('frames', None) or []
+                    self._add('logical_files', {
+                        '_id': logical_file_id, 'file_id': file_id, 'list': name, 'position': position, 'model': logical_dump,
+                    })
+                    for frame_position, (frame, frame_dump) in enumerate(zip(logical_file.frames or [], frames_dumps)):
+                        self._add_frame(kind, file_id, logical_file_id, frame_position, frame_dump, frame_dataframe(kind, frame))
+        if flush:
+            self.flush()
+        self.logger.info(f'Wrote {model.file_name} as {file_id}')
+        return file_id
+
+    def write_many(self, models: Iterable[StoredModel]) -> list[ObjectId]:
+        """
+        Write many models, sharing the insert_many batches between them.
+
+        Returns:
+            list[ObjectId]: The ids of the files documents.
+        """
+        ids = [self.write(model, flush=False) for model in models]
+        self.flush()
+        return ids
+
+    def _read_columns(self, frame: dict) -> dict[str, np.ndarray]:
+        chunks: dict[str, list[bytes]] = {column['name']: [] for column in frame['columns']}
+        for chunk in self.curve_chunks.find({'frame_id': frame['_id']}, sort=[('column', ASCENDING), ('chunk', ASCENDING)]):
+            chunks[chunk['column']].append(bytes(chunk['data']))
+        arrays = {}
+        for column in frame['columns']:
+            values = np.frombuffer(b''.join(chunks[column['name']]), dtype=np.dtype(column['dtype']))
+            arrays[column['name']] = values.reshape(column['shape'])
+        return arrays
+
+    def read(self, file_id: Union[ObjectId, str]) -> StoredModel:
+        """
+        Read a file written by `write`, with columnar dataframes.
+
+        Raises:
+            KeyError: If the file is not found.
+        """
+        file_id = ObjectId(file_id)
+        file = self.files.find_one({'_id': file_id})
+        if file is None:
+            raise KeyError(file_id)
+        kind = file['type']
+        dump = dict(file['model'], _id=file_id)
+        frames = list(self.frames.find({'file_id': file_id}, sort=[('position', ASCENDING)]))
+
+        if kind == 'las':
+            if frames:
+                dump['data'] = frames[0]['model']
+            model = load_model(kind, dump)
+            if frames and 'columns' in frames[0]:
+                model.data.arrays = self._read_columns(frames[0])
+            return model
+
+        frames_by_logical: dict[ObjectId, list[dict]] = {}
+        for frame in frames:
+            frames_by_logical.setdefault(frame['logical_file_id'], []).append(frame)
+        logical_files = list(self.logical_files.find({'file_id': file_id}, sort=[('position', ASCENDING)]))
+        for name in LOGICAL_LISTS:
+            dump[name] = []
+        for logical_file in logical_files:
+            logical_dump = dict(logical_file['model'])
+            logical_dump['frames'] = [frame['model'] for frame in frames_by_logical.get(logical_file['_id'], [])]
+            dump[logical_file['list']].append(logical_dump)
+        model = load_model(kind, dump)
+
+        for logical_file in logical_files:
+            logical_model = getattr(model, logical_file['list'])[logical_file['position']]
+            for frame, frame_model in zip(frames_by_logical.get(logical_file['_id'], []), logical_model.frames or []):
+                dataframe = frame_dataframe(kind, frame_model)
+                if dataframe is not None and 'columns' in frame:
+                    dataframe.arrays = self._read_columns(frame)
+        return model
+
+    def delete(self, file_id: Union[ObjectId, str]) -> None:
+        """
+        Delete a file and all its documents.
+        """
+        file_id = ObjectId(file_id)
+        for collection in (self.curve_chunks, self.frames, self.logical_files):
+            collection.delete_many({'file_id': file_id})
+        self.files.delete_one({'_id': file_id})
@@ -0,0 +1,496 @@
+"""
+A relational backend for the read files, built on SQLAlchemy Core.
+
+The models are mapped to the tables:
+    - files: The physical files, the rest of the model is kept as JSON.
+    - logical_files: The logical files of the dlis and lis files.
+    - frames: The dlis frames, the lis frames or the las data.
+    - channels: The channels of each frame (FrameChannel, LasCurvesSpecs or the lis specs), with their units and types.
+    - samples: The curves samples in the long layout, one row per sample of each channel.
+
+In the wide layout, the samples of each frame go to their own table, with one column per channel.
+The array channels of a frame wider than `max_columns` are kept in the long samples table instead.
+The samples are inserted with executemany, in batches, never as ORM objects, and committed every `commit_size` samples.
+"""
+from typing import Any, Iterable, Iterator, Optional
+
+import numpy as np
+from sqlalchemy import (
+    JSON, Boolean, Column, Engine, Float, ForeignKey, Integer, MetaData, String, Table, Text, create_engine, delete, select,
+)
+from sqlalchemy.engine import Connection
+
+from wellbelog.db.common import LOGICAL_LISTS, frame_dataframe
+from wellbelog.schemas.las import LasFileModel
+from wellbelog.utils.logging import setup_logger
+from wellbelog.utils.store import StoredModel, dump_model, load_model, model_type, storable_array
+
+LAYOUTS = ('long', 'wide')
+"""The layouts of the samples: one row per sample, or one table per frame with one column per channel."""
+
+ROW_COLUMN = '_row'
+"""The column with the row of each sample, in the wide tables."""
+
+MAX_COLUMNS = 1000
+"""The max columns of a wide table, below the limits of SQLite (2000) and PostgreSQL (1600)."""
+
+
+def create_tables(metadata: MetaData, prefix: str = '') -> dict[str, Table]:
+    """
+    Define the tables of the backend.
+
+    Args:
+        metadata (MetaData): The metadata the tables are added to.
+        prefix (str): A prefix for the tables names.
+
+    Returns:
+        dict[str, Table]: The tables, by their names without the prefix.
+    """
+    files = Table(
+        f'{prefix}files', metadata,
+        Column('id', Integer, primary_key=True),
+        Column('type', String(8), nullable=False),
+        Column('file_name', String(255), nullable=False, index=True),
+        Column('folder_name', String(255)),
+        Column('error', Boolean, nullable=False, default=False),
+        Column('error_message', Text),
+        Column('model', JSON),
+    )
+    logical_files = Table(
+        f'{prefix}logical_files', metadata,
+        Column('id', Integer, primary_key=True),
+        Column('file_id', ForeignKey(files.c.id, ondelete='CASCADE'), nullable=False, index=True),
+        Column('list', String(16), nullable=False),
+        Column('position', Integer, nullable=False),
+        Column('logical_id', String(255)),
+        Column('error', Boolean, nullable=False, default=False),
+        Column('error_message', Text),
+        Column('model', JSON),
+    )
+    frames = Table(
+        f'{prefix}frames', metadata,
+        Column('id', Integer, primary_key=True),
+        Column('file_id', ForeignKey(files.c.id, ondelete='CASCADE'), nullable=False, index=True),
+        Column('logical_file_id', ForeignKey(logical_files.c.id, ondelete='CASCADE'), index=True),
+        Column('position', Integer, nullable=False),
+        Column('index_name', String(255)),
+        Column('rows', Integer),
+        Column('layout', String(8)),
+        Column('samples_table', String(255)),
+        Column('model', JSON),
+    )
+    channels = Table(
+        f'{prefix}channels', metadata,
+        Column('id', Integer, primary_key=True),
+        Column('file_id', ForeignKey(files.c.id, ondelete='CASCADE'), nullable=False, index=True),
+        Column('frame_id', ForeignKey(frames.c.id, ondelete='CASCADE'), nullable=False, index=True),
+        Column('position', Integer, nullable=False),
+        Column('name', String(255), nullable=False),
+        Column('unit', String(64)),
+        Column('description', Text),
+        Column('dtype', String(16)),
+        Column('shape', JSON),
+        Column('attributes', JSON),
+    )
+    samples = Table(
+        f'{prefix}samples', metadata,
+        Column('channel_id', ForeignKey(channels.c.id, ondelete='CASCADE'), primary_key=True),
+        Column('row', Integer, primary_key=True),
+        Column('element', Integer, primary_key=True, default=0),
+        Column('depth', Float),
+        Column('value', Float),
+        Column('text', Text),
+    )
+    return {
+        'files': files, 'logical_files': logical_files, 'frames': frames, 'channels': channels, 'samples': samples,
+    }
+
+
+def element_names(name: str, shape: tuple) -> list[str]:
+    """
+    The names of the elements of a channel, split like `arrays_to_df`: CURVE[0], CURVE[1].
+    """
+    elements = int(np.prod(shape[1:], dtype=int))
+    if len(shape) <= 1:
+        return [name]
+    return [f'{name}[{i}]' for i in range(elements)]
+
+
+def sql_values(values: np.ndarray) -> list:
+    """
+    Convert a column to python values, the NaN are converted to None.
+    """
+    if values.dtype.kind == 'f':
+        objects = values.astype(object)
+        objects[np.isnan(values)] = None
+        return objects.tolist()
+    return values.tolist()
+
+
+def _is_numeric(dtype: np.dtype) -> bool:
+    return dtype.kind in 'biuf'
+
+
+def frame_channels(kind: str, model: StoredModel, logical_file: Any, frame: Any) -> dict[str, dict[str, Any]]:
+    """
+    Get the metadata of the channels of a frame, by their names.
+    """
+    if kind == 'dlis':
+        return frame.channels_metadata()
+    if kind == 'lis':
+        return logical_file.channels_metadata()
+    return model.channels_metadata()
+
+
+class SqlSink:
+    """
+    Writes the read files to a SQL database, with SQLAlchemy Core.
+
+    Attributes:
+        engine (Engine): The SQLAlchemy engine.
+        layout (str): The layout of the samples, 'long' or 'wide'.
+        batch_size (int): The number of rows of each executemany.
+        commit_size (int): The number of samples between commits. None commits once per file.
+        prefix (str): A prefix for the tables names.
+        max_columns (int): The max columns of a wide table. When the elements of the array channels
+            do not fit, the array channels of the frame are saved in the long layout.
+
+    Example:
+        sink = SqlSink('sqlite:///wells.db', layout='long')
+        file_id = sink.write(physical_file)
+        arrays = sink.read_frame(frame_id)
+    """
+
+    def __init__(
+        self,
+        engine: Any,
+        layout: str = 'long',
+        batch_size: int = 10_000,
+        commit_size: Optional[int] = None,
+        prefix: str = '',
+        create: bool = True,
+        max_columns: int = MAX_COLUMNS,
+    ) -> None:
+        assert layout in LAYOUTS, f'The layout must be one of {LAYOUTS}.'
+        self.logger = setup_logger(__class__.__name__)
+        self.engine: Engine = create_engine(engine) if isinstance(engine, str) else engine
+        self.layout = layout
+        self.batch_size = batch_size
+        self.commit_size = commit_size
+        self.prefix = prefix
+        self.max_columns = max_columns
+        self.metadata = MetaData()
+        self.tables = create_tables(self.metadata, prefix)
+        self._uncommitted = 0
+        if create:
+            self.create_tables()
+
+    def create_tables(self) -> None:
+        """
+        Create the tables that do not exist.
+        """
+        self.metadata.create_all(self.engine)
+
+    def _bulk_insert(self, connection: Connection, table: Table, rows: Iterable[dict]) -> None:
+        """
+        Insert the rows with executemany, in batches, committing every `commit_size` rows.
+        """
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                self._execute_batch(connection, table, batch)
+                batch = []
+        if batch:
+            self._execute_batch(connection, table, batch)
+
+    def _execute_batch(self, connection: Connection, table: Table, batch: list[dict]) -> None:
+        connection.execute(table.insert(), batch)
+        self._uncommitted += len(batch)
+        if self.commit_size and self._uncommitted >= self.commit_size:
+            connection.commit()
+            self._uncommitted = 0
+
+    def _long_rows(self, channel_id: int, values: np.ndarray, depth: Optional[np.ndarray]) -> Iterator[dict]:
+        elements = int(np.prod(values.shape[1:], dtype=int))
+        flat = values.reshape(-1)
+        numeric = _is_numeric(values.dtype)
+        key = 'value' if numeric else 'text'
+        for start in range(0, flat.size, self.batch_size):
+            stop = min(start + self.batch_size, flat.size)
+            chunk = sql_values(flat[start:stop].astype(float) if numeric else flat[start:stop].astype(str))
+            # NOTE The rows, elements and depths of the flattened samples in the batch
+            rows, element_index = np.divmod(np.arange(start, stop), elements)
+            depths = sql_values(depth[rows]) if depth is not None else [None] * len(chunk)
+            yield from (
+                {'channel_id': channel_id, 'row': row, 'element': element, 'depth': d, 'value': None, 'text': None, key: value}
+                for row, element, d, value in zip(rows.tolist(), element_index.tolist(), depths, chunk)
+            )
+
+    def _split_wide(self, arrays: dict[str, np.ndarray]) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray]]:
+        """
+        Split the channels of a frame between its wide table and the long samples table.
+        All the channels go to the wide table when their elements fit in `max_columns`,
+        otherwise the array channels go to the long table.
+
+        Raises:
+            ValueError: If the one element channels alone do not fit in a wide table.
+        """
+        columns = 1 + sum(int(np.prod(values.shape[1:], dtype=int)) for values in arrays.values())
+        if columns <= self.max_columns:
+            return arrays, {}
+        wide = {name: values for name, values in arrays.items() if values.ndim <= 1}
+        if 1 + len(wide) > self.max_columns:
+            raise ValueError(
+                f'The frame has {len(wide)} channels, more than the {self.max_columns} columns of a wide table. '
+                'Use the long layout.'
+            )
+        return wide, {name: values for name, values in arrays.items() if name not in wide}
+
+    def _write_wide(self, connection: Connection, frame_id: int, arrays: dict[str, np.ndarray]) -> str:
+        name = f'{self.prefix}frame_{frame_id}_samples'
+        columns, values = [Column(ROW_COLUMN, Integer, primary_key=True)], []
+        for channel, array in arrays.items():
+            flat = array.reshape(len(array), int(np.prod(array.shape[1:], dtype=int)))
+            numeric = _is_numeric(array.dtype)
+            for i, element in enumerate(element_names(channel, array.shape)):
+                columns.append(Column(element, Float if numeric else Text))
+                values.append(sql_values(flat[:, i].astype(float) if numeric else flat[:, i].astype(str)))
+        table = Table(name, MetaData(), *columns)
+        table.create(connection)
+        keys = [column.name for column in columns]
+        rows = len(next(iter(arrays.values()))) if arrays else 0
+        self._bulk_insert(connection, table, (dict(zip(keys, row)) for row in zip(range(rows), *values)))
+        return name
+
+    def _write_frame(
+        self,
+        connection: Connection,
+        file_id: int,
+        logical_file_id: Optional[int],
+        position: int,
+        frame_dump: dict,
+        dataframe: Any,
+        channels_metadata: dict[str, dict[str, Any]],
+    ) -> int:
+        frames, channels = self.tables['frames'], self.tables['channels']
+        arrays = {name: storable_array(values) for name, values in dataframe.as_arrays().items()} if dataframe is not None else {}
+        depth_name = dataframe.depth_name if dataframe is not None else None
+        wide, long = self._split_wide(arrays) if self.layout == 'wide' else ({}, arrays)
+        frame_id = connection.execute(frames.insert().values(
+            file_id=file_id,
+            logical_file_id=logical_file_id,
+            position=position,
+            index_name=depth_name,
+            rows=len(next(iter(arrays.values()))) if arrays else None,
+            layout=('wide' if wide else 'long') if arrays else None,
+            model=frame_dump,
+        )).inserted_primary_key[0]
+
+        names = list(arrays) + [name for name in channels_metadata if name not in arrays]
+        channel_rows = []
+        for channel_position, name in enumerate(names):
+            metadata = channels_metadata.get(name, {})
+            values = arrays.get(name)
+            channel_rows.append({
+                'file_id': file_id,
+                'frame_id': frame_id,
+                'position': channel_position,
+                'name': name,
+                'unit': metadata.get('units', metadata.get('unit')),
+                'description': metadata.get('long_name', metadata.get('descr')),
+                'dtype': values.dtype.str if values is not None else None,
+                'shape': list(values.shape) if values is not None else None,
+                'attributes': metadata or None,
+            })
+        if not channel_rows:
+            return frame_id
+        channel_ids = connection.execute(
+            channels.insert().returning(channels.c.id, sort_by_parameter_order=True), channel_rows
+        ).scalars().all()
+
+        if not arrays:
+            return frame_id
+        if wide:
+            table = self._write_wide(connection, frame_id, wide)
+            connection.execute(frames.update().where(frames.c.id == frame_id).values(samples_table=table))
+        depth = arrays[depth_name].astype(float) if depth_name and _is_numeric(arrays[depth_name].dtype) else None
+        ids = dict(zip(names, channel_ids))
+        for name, values in long.items():
+            self._bulk_insert(connection, self.tables['samples'], self._long_rows(ids[name], values, depth))
+        return frame_id
+
+    def write(self, model: StoredModel) -> int:
+        """
+        Write a model to the tables.
+
+        Args:
+            model (StoredModel): A PhysicalFileModel, PhysicalLisFileModel or LasFileModel.
+
+        Returns:
+            int: The id of the file row.
+        """
+        kind = model_type(model)
+        # NOTE A shallow copy without the id, the ObjectId can not be dumped to JSON
+        dump = dump_model(model.model_copy(update={'id': None}))
+        logical_dumps = {name: dump.pop(name, None) or [] for name in LOGICAL_LISTS}
+        data_dump = dump.pop('data', None)
+
+        with self.engine.connect() as connection:
+            self._uncommitted = 0
+            file_id = connection.execute(self.tables['files'].insert().values(
+                type=kind,
+                file_name=model.file_name,
+                folder_name=getattr(model, 'folder_name', None),
+                error=bool(model.error),
+                error_message=model.error_message,
+                model=dump,
+            )).inserted_primary_key[0]
+
+            if isinstance(model, LasFileModel):
+                if model.data is not None:
+                    self._write_frame(connection, file_id, None, 0, data_dump, model.data, model.channels_metadata())
+            else:
+                for name in LOGICAL_LISTS:
+                    for position, (logical_file, logical_dump) in enumerate(zip(getattr(model, name), logical_dumps[name])):
+                        frames_dumps = logical_dump.pop('frames', None) or []
+                        logical_file_id = connection.execute(self.tables['logical_files'].insert().values(
+                            file_id=file_id,
+                            list=name,
+                            position=position,
+                            logical_id=str(logical_file.logical_id) if logical_file.logical_id is not None else None,
+                            error=bool(logical_file.error),
+                            error_message=logical_file.error_message,
+                            model=logical_dump,
+                        )).inserted_primary_key[0]
+                        for frame_position, (frame, frame_dump) in enumerate(zip(logical_file.frames or [], frames_dumps)):
+                            self._write_frame(
+                                connection, file_id, logical_file_id, frame_position, frame_dump,
+                                frame_dataframe(kind, frame), frame_channels(kind, model, logical_file, frame),
+                            )
+            connection.commit()
+        self.logger.info(f'Wrote {model.file_name} as {file_id}')
+        return file_id
+
+    def write_many(self, models: Iterable[StoredModel]) -> list[int]:
+        """
+        Write many models, each one in its own transaction.
+
+        Returns:
+            list[int]: The ids of the files rows.
+        """
+        return [self.write(model) for model in models]
+
+    def _read_frame(self, connection: Connection, frame: Any) -> dict[str, np.ndarray]:
+        channels, samples = self.tables['channels'], self.tables['samples']
+        channel_rows = connection.execute(
+            select(channels).where(channels.c.frame_id == frame.id, channels.c.dtype.is_not(None)).order_by(channels.c.position)
+        ).all()
+
+        arrays, long_rows = {}, channel_rows
+        if frame.layout == 'wide':
+            table = Table(frame.samples_table, MetaData(), autoload_with=connection)
+            rows = connection.execute(select(table).order_by(table.c[ROW_COLUMN])).all()
+            columns = dict(zip(table.c.keys(), zip(*rows))) if rows else {}
+            long_rows = []
+            for channel in channel_rows:
+                names = element_names(channel.name, tuple(channel.shape))
+                # NOTE The array channels of the frames too wide for a table are in the long samples table
+                if names[0] not in table.c:
+                    long_rows.append(channel)
+                    continue
+                dtype = np.dtype(channel.dtype)
+                elements = [columns.get(name, ()) for name in names]
+                values = np.array(elements, dtype=float if _is_numeric(dtype) else object).T
+                arrays[channel.name] = values.astype(dtype).reshape(channel.shape)
+
+        for channel in long_rows:
+            dtype = np.dtype(channel.dtype)
+            column = samples.c.value if _is_numeric(dtype) else samples.c.text
+            values = connection.execute(
+                select(column).where(samples.c.channel_id == channel.id).order_by(samples.c.row, samples.c.element)
+            ).scalars().all()
+            values = np.array(values, dtype=float if _is_numeric(dtype) else object)
+            arrays[channel.name] = values.astype(dtype).reshape(channel.shape)
+        # NOTE The channels are returned in the order of the frame
+        return {channel.name: arrays[channel.name] for channel in channel_rows}
+
+    def read_frame(self, frame_id: int) -> dict[str, np.ndarray]:
+        """
+        Read the samples of a frame, as a dict of arrays with their original types and shapes.
+
+        Raises:
+            KeyError: If the frame is not found.
+        """
+        frames = self.tables['frames']
+        with self.engine.connect() as connection:
+            frame = connection.execute(select(frames).where(frames.c.id == frame_id)).first()
+            if frame is None:
+                raise KeyError(frame_id)
+            return self._read_frame(connection, frame)
+
+    def read(self, file_id: int) -> StoredModel:
+        """
+        Read a file written by `write`, with columnar dataframes.
+
+        Raises:
+            KeyError: If the file is not found.
+        """
+        files, logical_files, frames = self.tables['files'], self.tables['logical_files'], self.tables['frames']
+        with self.engine.connect() as connection:
+            file = connection.execute(select(files).where(files.c.id == file_id)).first()
+            if file is None:
+                raise KeyError(file_id)
+            kind, dump = file.type, dict(file.model)
+            frame_rows = connection.execute(
+                select(frames).where(frames.c.file_id == file_id).order_by(frames.c.position)
+            ).all()
+
+            if kind == 'las':
+                if frame_rows:
+                    dump['data'] = frame_rows[0].model
+                model = load_model(kind, dump)
+                if frame_rows and frame_rows[0].layout:
+                    model.data.arrays = self._read_frame(connection, frame_rows[0])
+                return model
+
+            frames_by_logical: dict[int, list] = {}
+            for frame in frame_rows:
+                frames_by_logical.setdefault(frame.logical_file_id, []).append(frame)
+            logical_rows = connection.execute(
+                select(logical_files).where(logical_files.c.file_id == file_id).order_by(logical_files.c.position)
+            ).all()
+            for name in LOGICAL_LISTS:
+                dump[name] = []
+            for logical_file in logical_rows:
+                logical_dump = dict(logical_file.model)
+                logical_dump['frames'] = [frame.model for frame in frames_by_logical.get(logical_file.id, [])]
+                dump[logical_file.list].append(logical_dump)
+            model = load_model(kind, dump)
+
+            for logical_file in logical_rows:
+                logical_model = getattr(model, logical_file.list)[logical_file.position]
+                for frame, frame_model in zip(frames_by_logical.get(logical_file.id, []), logical_model.frames or []):
+                    dataframe = frame_dataframe(kind, frame_model)
+                    if dataframe is not None and frame.layout:
+                        dataframe.arrays = self._read_frame(connection, frame)
+            return model
+
+    def delete(self, file_id: int) -> None:
+        """
+        Delete a file and all its rows.
+        The children are deleted explicitly, SQLite does not enforce the foreign keys by default.
+        """
+        tables = self.tables
+        with self.engine.begin() as connection:
+            frames = connection.execute(
+                select(tables['frames'].c.id, tables['frames'].c.samples_table).where(tables['frames'].c.file_id == file_id)
+            ).all()
+            for frame in frames:
+                if frame.samples_table:
+                    Table(frame.samples_table, MetaData()).drop(connection, checkfirst=True)
+            channel_ids = select(tables['channels'].c.id).where(tables['channels'].c.file_id == file_id)
+            connection.execute(delete(tables['samples']).where(tables['samples'].c.channel_id.in_(channel_ids)))
+            for name in ('channels', 'frames', 'logical_files'):
+                connection.execute(delete(tables[name]).where(tables[name].c.file_id == file_id))
+            connection.execute(delete(tables['files']).where(tables['files'].c.id == file_id))
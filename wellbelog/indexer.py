@@ -0,0 +1,270 @@
+"""
+Incremental indexing of an archive of log files.
+
+The ArchiveIndexer keeps a manifest of the files it read, with their size, modification time,
+optionally their content hash, and the result of the reading. Each run walks the archive in parallel,
+and reads only the files that are new or changed since the last run. The deleted files are dropped.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import os
+import pathlib
+import tempfile
+import time
+from typing import Any, Callable, Iterable, NamedTuple, Optional, Union
+
+from wellbelog import __version__
+from .main_reader import MainReader
+from .schemas.batch import FileLoadResult
+from .schemas.manifest import IndexReport, Manifest, ManifestEntry
+from .utils.cache import file_hash
+from .utils.logging import setup_logger
+from .utils.scanner import EXTENSIONS
+from .utils.walk import FileStat, walk_files
+
+DEFAULT_SUFFIXES = tuple(sorted(EXTENSIONS))
+"""The suffixes of the files indexed by default, in any case. The ones of the scanner."""
+
+MANIFEST_NAME = '.wellbelog-manifest.json'
+
+
+class IndexPlan(NamedTuple):
+    """
+    The changes found by the walk of the archive, before any file is read.
+
+    Attributes:
+        added (list[FileStat]): The new files.
+        modified (list[FileStat]): The files changed since the last run.
+        deleted (list[str]): The relative paths of the removed files.
+        unchanged (int): The number of files not read again.
+        hashes (dict[str, str]): The hashes of the added and modified files, when the indexer uses hashes.
+    """
+    added: list[FileStat]
+    modified: list[FileStat]
+    deleted: list[str]
+    unchanged: int
+    hashes: dict[str, str]
+
+
+class ArchiveIndexer:
+    """
+    Reads only the new and changed files of an archive, keeping a manifest between the runs.
+
+    A file is changed when its size or modification time changed. With `use_hash`, the content of the
+    changed files is hashed too, and the files that were only touched are not read again.
+    The manifest is saved every `checkpoint_every` files, so a stopped run goes on from where it was.
+
+    The models can be written to a sink, like MongoSink or SqlSink, or any object with `write(model)`,
+    returning the id of the file, and `delete(file_id)`. The records of the changed and deleted files
+    are deleted from the sink.
+
+    Attributes:
+        root (pathlib.Path): The folder of the archive.
+        manifest_path (pathlib.Path): The JSON file of the manifest, `.wellbelog-manifest.json` in the root by default.
+        reader (MainReader): The reader of the files.
+        sink (Any): Optional sink of the models.
+        use_hash (bool): If True, the changed files are hashed, and the hash is saved in the manifest.
+        workers (int): The number of processes reading the files. Defaults to the number of CPUs.
+        walk_workers (int): The number of threads walking the folders, and hashing the files.
+        suffixes (tuple[str, ...]): The suffixes of the indexed files, in any case.
+        retry_errors (bool): If True, the files read with errors in the last runs are read again.
+        checkpoint_every (int): The number of files read between the saves of the manifest.
+
+    Example:
+        indexer = ArchiveIndexer('/archive', sink=SqlSink('sqlite:///wells.db'))
+        report = indexer.run()
+        print(report.added, report.modified, report.deleted)
+    """
+
+    def __init__(
+        self,
+        root: Union[str, pathlib.Path],
+        manifest_path: Optional[Union[str, pathlib.Path]] = None,
+        reader: Optional[MainReader] = None,
+        sink: Optional[Any] = None,
+        use_hash: bool = False,
+        workers: Optional[int] = None,
+        walk_workers: int = 8,
+        suffixes: Iterable[str] = DEFAULT_SUFFIXES,
+        retry_errors: bool = False,
+        checkpoint_every: int = 1000,
+    ) -> None:
+        self.logger = setup_logger(__class__.__name__)
+        self.root = pathlib.Path(root).absolute()
+        self.manifest_path = pathlib.Path(manifest_path) if manifest_path else self.root / MANIFEST_NAME
+        self.reader = reader or MainReader()
+        self.sink = sink
+        self.use_hash = use_hash
+        self.workers = workers
+        self.walk_workers = walk_workers
+        self.suffixes = tuple(suffixes)
+        self.retry_errors = retry_errors
+        self.checkpoint_every = checkpoint_every
+
+    def load_manifest(self) -> Manifest:
+        """
+        Load the manifest of the last run. An empty manifest is returned if there is none, or it is broken.
+        """
+        if not self.manifest_path.is_file():
+            return Manifest(root=str(self.root))
+        try:
+            return Manifest.model_validate_json(self.manifest_path.read_bytes())
+        except Exception as e:
+            # NOTE A broken manifest means that all the files are read again
+            self.logger.error(f'Error while loading the manifest {self.manifest_path}: {e}')
+            return Manifest(root=str(self.root))
+
+    def save_manifest(self, manifest: Manifest) -> None:
+        """
+        Save the manifest. It is written to a temporary file that replaces the old one, so it is never left half written.
+        """
+        manifest.version = __version__
+        manifest.updated_at = datetime.now()
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.manifest_path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(manifest.model_dump_json())
+            os.replace(temp_path, self.manifest_path)
+        except BaseException:
+            pathlib.Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    def relative_path(self, path: str) -> str:
+        return pathlib.Path(path).relative_to(self.root).as_posix()
+
+    def _hashes(self, stats: list[FileStat]) -> dict[str, str]:
+        """
+        Hash the files in threads. The files that can not be read are left out.
+        """
+        def hash_file(stat: FileStat) -> Optional[str]:
+            try:
+                return file_hash(stat.path)
+            except OSError as e:
+                self.logger.error(f'Error while hashing {stat.path}: {e}')
+                return None
+
+        with ThreadPoolExecutor(max_workers=max(self.walk_workers, 1)) as executor:
+            hashes = executor.map(hash_file, stats)
+            return {
+                self.relative_path(stat.path): digest for stat, digest in zip(stats, hashes) if digest is not None
+            }
+
+    def plan(self, manifest: Manifest) -> IndexPlan:
+        """
+        Walk the archive, and compare the files with the manifest.
+        The entries of the files that were only touched are updated in the manifest.
+
+        Args:
+            manifest (Manifest): The manifest of the last run.
+
+        Returns:
+            IndexPlan: The added, modified and deleted files.
+        """
+        added, candidates, unchanged = [], [], 0
+        seen = set()
+        manifest_path = str(self.manifest_path.absolute())
+        on_error = lambda error: self.logger.error(f'Error while walking the archive: {error}')  # noqa: E731
+        for stat in walk_files(self.root, self.suffixes, self.walk_workers, on_error=on_error):
+            if stat.path == manifest_path:
+                continue
+            key = self.relative_path(stat.path)
+            seen.add(key)
+            entry = manifest.entries.get(key)
+            if entry is None:
+                added.append(stat)
+            elif entry.size == stat.size and entry.mtime_ns == stat.mtime_ns and not (self.retry_errors and entry.error):
+                unchanged += 1
+            else:
+                candidates.append(stat)
+        deleted = [key for key in manifest.entries if key not in seen]
+        if not self.use_hash:
+            return IndexPlan(added, candidates, deleted, unchanged, {})
+
+        hashes = self._hashes(added + candidates)
+        modified = []
+        for stat in candidates:
+            key = self.relative_path(stat.path)
+            entry = manifest.entries[key]
+            # NOTE A file with the same content was only touched, or copied back
+            if entry.hash is not None and hashes.get(key) == entry.hash and not (self.retry_errors and entry.error):
+                entry.size, entry.mtime_ns = stat.size, stat.mtime_ns
+                unchanged += 1
+            else:
+                modified.append(stat)
+        return IndexPlan(added, modified, deleted, unchanged, hashes)
+
+    def _delete_from_sink(self, entry: ManifestEntry) -> None:
+        if self.sink is None or entry.file_id is None:
+            return
+        try:
+            self.sink.delete(entry.file_id)
+        except Exception as e:
+            self.logger.error(f'Error while deleting {entry.path} from the sink: {e}')
+
+    def _entry(self, key: str, stat: FileStat, result: FileLoadResult, digest: Optional[str]) -> ManifestEntry:
+        """
+        Create the manifest entry of a file read in this run, and write its model to the sink.
+        """
+        entry = ManifestEntry(path=key, size=stat.size, mtime_ns=stat.mtime_ns, hash=digest, elapsed=result.elapsed)
+        model = result.model
+        if result.error or getattr(model, 'error', False):
+            entry.status = 'error'
+            entry.error_message = str(result.error_message if result.error else model.error_message)
+            return entry
+        if self.sink is not None:
+            try:
+                file_id = self.sink.write(model)
+                entry.file_id = file_id if isinstance(file_id, int) else str(file_id)
+            except Exception as e:
+                self.logger.error(f'Error while writing {key} to the sink: {e}')
+                entry.status = 'error'
+                entry.error_message = f'Error while writing to the sink: {e}'
+        return entry
+
+    def run(self, on_result: Optional[Callable[[FileLoadResult], None]] = None) -> IndexReport:
+        """
+        Index the archive: read the new and changed files, and drop the deleted ones.
+
+        Args:
+            on_result (Callable, optional): Called with the result of each file read, in the order they are read.
+
+        Returns:
+            IndexReport: The changes found, and the files read with errors.
+        """
+        start = time.perf_counter()
+        manifest = self.load_manifest()
+        plan = self.plan(manifest)
+        report = IndexReport(
+            added=[self.relative_path(stat.path) for stat in plan.added],
+            modified=[self.relative_path(stat.path) for stat in plan.modified],
+            deleted=plan.deleted,
+            unchanged=plan.unchanged,
+        )
+        self.logger.info(
+            f'{len(report.added)} added, {len(report.modified)} modified, '
+            f'{len(report.deleted)} deleted and {report.unchanged} unchanged files in {self.root}'
+        )
+
+        for key in plan.deleted:
+            self._delete_from_sink(manifest.entries.pop(key))
+
+        stats = {stat.path: stat for stat in plan.added + plan.modified}
+        for count, result in enumerate(self.reader.load_many(list(stats), workers=self.workers), 1):
+            stat = stats[result.path]
+            key = self.relative_path(stat.path)
+            old_entry = manifest.entries.get(key)
+            if old_entry is not None:
+                self._delete_from_sink(old_entry)
+            entry = self._entry(key, stat, result, plan.hashes.get(key))
+            manifest.entries[key] = entry
+            if entry.error:
+                report.errors.append(key)
+            if on_result is not None:
+                on_result(result)
+            if count % self.checkpoint_every == 0:
+                self.save_manifest(manifest)
+
+        self.save_manifest(manifest)
+        report.elapsed = time.perf_counter() - start
+        return report
@@ -1,5 +1,10 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+import os
 import pathlib
-from typing import Callable, Union
+import time
+from typing import Callable, Iterable, Iterator, Optional, Union
 
 
 from .belodlis.reader import DlisReader
@@ -8,48 +13,231 @@ from .schemas.dlis import PhysicalFileModel
 from .schemas.las import LasFileModel
 from .belolis.reader import LisReader
 from .schemas.lis import PhysicalLisFileModel
+from .schemas.batch import FileLoadResult, ReaderChoice
+from .schemas.scan import PhysicalFileHeader
+from .utils.cache import ParseCache
 from .utils.logging import setup_logger
+from .utils.profiling import Profiler
+from .utils.scanner import scan_log_files
+from .utils.sniff import sniff_file
+from .utils.walk import FileStat
 
 ReaderReturnType = Union[PhysicalFileModel, LasFileModel, PhysicalLisFileModel]
 ReaderMethod = Callable[[str], ReaderReturnType]
 
+# NOTE The format tried first, and the one tried if it fails, of each extension, used when the content is not recognized
+EXTENSION_READERS = {
+    '.lis': ('lis', 'dlis'),
+    '.las': ('las', None),
+    '.dlis': ('dlis', 'lis'),
+    '.tif': ('dlis', 'lis'),
+    '.tiff': ('dlis', 'lis'),
+}
+
+# NOTE The reader used by each worker process of MainReader.load_many
+_worker_reader: Optional['MainReader'] = None
+
+
+def _init_worker(reader_options: dict) -> None:
+    """
+    Creates the MainReader of a worker process, once per process.
+    """
+    global _worker_reader
+    _worker_reader = MainReader(**reader_options)
+
+
+def _worker_load_file(path: str) -> FileLoadResult:
+    """
+    Loads a file inside a worker process.
+    """
+    return load_file_timed(_worker_reader, path)
+
+
+def load_file_timed(reader: 'MainReader', path: str) -> FileLoadResult:
+    """
+    Load a file with the given reader, measuring the time spent.
+    Any exception is caught and set in the result, so one file can not break a batch.
+
+    Args:
+        reader (MainReader): The reader to use.
+        path (str): Path to the file.
+
+    Returns:
+        FileLoadResult: The result of the reading.
+    """
+    start = time.perf_counter()
+    choice = None
+    try:
+        choice = reader.choose_reader(path)
+        model = reader.load_file(path, choice)
+        return FileLoadResult(
+            path=str(path), model=model, elapsed=time.perf_counter() - start, worker_pid=os.getpid(), choice=choice
+        )
+    except Exception as e:
+        return FileLoadResult(
+            path=str(path), error=True, error_message=str(e),
+            elapsed=time.perf_counter() - start, worker_pid=os.getpid(), choice=choice
+        )
+
 
 class MainReader:
     """
     Class responsible for managing LIS, LAS, DLIS, and TIFF files.
+
+    Attributes:
+        columnar (bool): If True, the readers store the curves data as NumPy columns instead of records.
+        cache (ParseCache): Optional cache of the processed files, shared by all the readers.
+        mask_nulls (bool): If True, the readers replace the null values of the curves with NaN.
+        null_values (set[float]): The null values, NULL_VALUES by default.
+        profiler (Profiler): Optional timing hooks, shared by all the readers.
+        sniff (bool): If True, the format of each file is detected from its first bytes before its extension.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        columnar: bool = False,
+        cache: Optional[ParseCache] = None,
+        mask_nulls: bool = False,
+        null_values: Optional[Iterable[float]] = None,
+        profiler: Optional[Profiler] = None,
+        sniff: bool = True,
+    ) -> None:
         self.logger = setup_logger(__class__.__name__)
-        self.dlis_reader = DlisReader()
-        self.las_reader = LasReader()
-        self.lis_reader = LisReader()
+        self.columnar = columnar
+        self.cache = cache
+        self.mask_nulls = mask_nulls
+        self.null_values = null_values
+        self.profiler = profiler
+        self.sniff = sniff
+        options = {
+            'columnar': columnar, 'cache': cache, 'mask_nulls': mask_nulls, 'null_values': null_values, 'profiler': profiler,
+        }
+        self.dlis_reader = DlisReader(**options)
+        self.las_reader = LasReader(**options)
+        self.lis_reader = LisReader(**options)
+
+    def reader_options(self) -> dict:
+        """
+        The options used to create this reader.
+        They are used to create the readers of the worker processes.
+        NOTE The collectors can not be sent to the workers,
+        the workers attach the timings to the models and they are collected here.
+        """
+        return {
+            'columnar': self.columnar, 'cache': self.cache,
+            'mask_nulls': self.mask_nulls, 'null_values': self.null_values,
+            'profiler': Profiler() if self.profiler is not None else None,
+            'sniff': self.sniff,
+        }
 
-    def load_file(self, path: str) -> ReaderReturnType:
+    def _collect_worker_profile(self, result: FileLoadResult) -> FileLoadResult:
         """
-        Load a file and return a list of LogicalFile objects based on its extension.
+        Send the timings of a file read in a worker process to the collectors of the profiler.
+        """
+        profile = getattr(result.model, 'profile', None)
+        if self.profiler is None or profile is None:
+            return result
+        for timing in profile.stages:
+            for collector in self.profiler.collectors:
+                collector(timing)
+        if not self.profiler.attach:
+            result.model.profile = None
+        return result
+
+    def choose_reader(self, path: str) -> ReaderChoice:
+        """
+        Choose the reader of a file.
+        The first bytes of the file are read, and a recognized DLIS storage unit label, LIS reel or tape header,
+        or LAS ~V section sends the file straight to its reader, without a fallback.
+        Otherwise, or without sniffing, the extension gives the reader and its fallback.
 
         Args:
             path (str): Path to the file.
 
+        Raises:
+            ValueError: If the format is not recognized and the extension is not supported.
+
         Returns:
-            list[LogicalFile]: List of LogicalFile objects.
+            ReaderChoice: The format the file is read as, and how it was detected.
         """
-        file_extension = pathlib.Path(path).suffix.lower()
+        file_type = sniff_file(path) if self.sniff else None
+        if file_type is not None:
+            return ReaderChoice(file_type=file_type, detected_by='content')
 
-        if file_extension == '.lis':
-            return self._attempt_reading(path, self.lis_reader.process_physical_file, self.dlis_reader.process_physical_file)
-        elif file_extension == '.las':
-            return self._attempt_reading(path, self.las_reader.process_las_file)
-        elif file_extension == '.dlis':
-            return self._attempt_reading(path, self.dlis_reader.process_physical_file, self.lis_reader.process_physical_file)
-        elif file_extension == '.tiff':
-            return self._attempt_reading(path, self.dlis_reader.process_physical_file, self.lis_reader.process_physical_file)
-        else:
+        file_extension = pathlib.Path(path).suffix.lower()
+        if file_extension not in EXTENSION_READERS:
             self.logger.error(f"Unsupported file type: {file_extension}")
             raise ValueError(f"Unsupported file type: {file_extension}")
+        file_type, fallback = EXTENSION_READERS[file_extension]
+        return ReaderChoice(file_type=file_type, detected_by='extension', fallback=fallback)
+
+    def load_file(self, path: str, choice: Optional[ReaderChoice] = None) -> ReaderReturnType:
+        """
+        Load a file and return a list of LogicalFile objects based on its content, or its extension.
+
+        Args:
+            path (str): Path to the file.
+            choice (ReaderChoice, optional): The reader of the file, given by choose_reader by default.
+                It is updated if the fallback reader is used.
+
+        Returns:
+            list[LogicalFile]: List of LogicalFile objects.
+        """
+        choice = choice or self.choose_reader(path)
+        readers = {
+            'dlis': self.dlis_reader.process_physical_file,
+            'lis': self.lis_reader.process_physical_file,
+            'las': self.las_reader.process_las_file,
+        }
+        self.logger.debug(f"Reading {path} as {choice.file_type}, detected by {choice.detected_by}")
+        return self._attempt_reading(path, readers[choice.file_type], readers.get(choice.fallback), choice)
+
+    def search_files(
+        self,
+        path: str,
+        file_types: Optional[Iterable[str]] = None,
+        sniff: str = 'unknown',
+        workers: int = 8,
+    ) -> Iterator[FileStat]:
+        """
+        Find the DLIS, LIS, LAS and TIF files of a folder tree, walking it once.
+        The extensions are matched in any case, and the files without a log extension are recognized by their content.
+        The files are yielded as the walk goes, so they can be read before it ends.
+
+        Args:
+            path (str): The folder to search.
+            file_types (Iterable[str], optional): The types of the files, like ['dlis', 'las']. All by default.
+            sniff (str): When the first bytes of the files are read: 'never', 'unknown' or 'all'.
+            workers (int): The number of threads walking the folders.
+
+        Yields:
+            FileStat: The path, size, modification time and type of each file.
+        """
+        on_error = lambda error: self.logger.error(f"Error while searching for files: {error}")  # noqa: E731
+        yield from scan_log_files(path, file_types=file_types, sniff=sniff, workers=workers, on_error=on_error)
 
-    def _attempt_reading(self, path: str, primary_reader: ReaderMethod, fallback_reader: ReaderMethod = None) -> ReaderReturnType:
+    def scan(self, path: str) -> PhysicalFileHeader:
+        """
+        Scan a file and return only its metadata, based on its content, or its extension.
+        The curves data is not decoded.
+
+        Args:
+            path (str): Path to the file.
+
+        Returns:
+            PhysicalFileHeader: The metadata of the file.
+        """
+        choice = self.choose_reader(path)
+        readers = {'dlis': self.dlis_reader.scan, 'lis': self.lis_reader.scan, 'las': self.las_reader.scan}
+        return self._attempt_reading(path, readers[choice.file_type], readers.get(choice.fallback), choice)
+
+    def _attempt_reading(
+        self,
+        path: str,
+        primary_reader: ReaderMethod,
+        fallback_reader: ReaderMethod = None,
+        choice: Optional[ReaderChoice] = None,
+    ) -> ReaderReturnType:
         """
         Attempt to read the file with a primary reader. If it fails and a fallback is provided, try with the fallback.
 
@@ -57,6 +245,7 @@ class MainReader:
             path (str): Path to the file.
             primary_reader (callable): Primary function to read the file.
             fallback_reader (callable, optional): Fallback function if the primary fails.
+            choice (ReaderChoice, optional): The choice of the reader, marked if the fallback reads the file.
 
         Returns:
             list[LogicalFile]: List of LogicalFile objects.
@@ -69,10 +258,13 @@ class MainReader:
             if fallback_reader:
                 self.logger.info(f"Attempting to read {path} with fallback reader.")
                 try:
-                    return fallback_reader(path)
+                    model = fallback_reader(path)
                 except Exception as fallback_error:
                     self.logger.error(f"Fallback reader also failed for file {path}: {fallback_error}")
                     raise
+                if choice is not None:
+                    choice.used_fallback = True
+                return model
             else:
                 raise
 
@@ -87,3 +279,79 @@ class MainReader:
             list[LogicalFile]: List of LogicalFile objects.
         """
         return self._attempt_reading(path, self.dlis_reader.process_physical_file, self.lis_reader.process_physical_file)
+
+    def load_many(
+        self,
+        paths: Iterable[str],
+        workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[FileLoadResult]:
+        """
+        Load many files in parallel, using a pool of processes.
+        The results are yielded as soon as each file is read, not in the order of the paths.
+
+        Errors are isolated per file: an exception while reading a file is set in its result.
+        If a worker process crashes, the pool is restarted and the files that were running are read
+        again one at a time, so only the file that crashed is reported as an error.
+
+        Args:
+            paths (Iterable[str]): The paths to the files.
+            workers (int, optional): The number of processes. Defaults to the number of CPUs.
+                With 1 worker, the files are read in the current process.
+            max_in_flight (int, optional): Max number of files submitted at once. Defaults to 2 * workers.
+
+        Yields:
+            FileLoadResult: The result of each file, with the model and the time spent.
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1:
+            for path in paths:
+                yield load_file_timed(self, str(path))
+            return
+
+        max_in_flight = max_in_flight or 2 * workers
+        pending = deque(str(path) for path in paths)
+        suspects = deque()
+
+        while pending or suspects:
+            crashed = False
+            executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(self.reader_options(),)
+            )
+            running = {}
+            try:
+                while (pending or suspects or running) and not crashed:
+                    # NOTE After a crash, the suspect files are read one at a time, to find the one that crashed
+                    if suspects:
+                        if not running:
+                            path = suspects.popleft()
+                            running[executor.submit(_worker_load_file, path)] = path
+                    else:
+                        # NOTE Only a few files are submitted at once, to keep the memory bounded
+                        while pending and len(running) < max_in_flight:
+                            path = pending.popleft()
+                            running[executor.submit(_worker_load_file, path)] = path
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        try:
+                            result = future.result()
+                        except BrokenProcessPool:
+                            crashed = True
+                            continue
+                        except Exception as e:
+                            result = FileLoadResult(path=running[future], error=True, error_message=str(e))
+                        running.pop(future)
+                        yield self._collect_worker_profile(result)
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+            if not crashed:
+                continue
+            # NOTE With only one file running, it is the one that crashed the worker
+            if len(running) == 1:
+                path, = running.values()
+                self.logger.error(f"Worker process crashed while reading {path}")
+                yield FileLoadResult(path=path, error=True, error_message='The worker process crashed while reading the file.')
+            else:
+                suspects.extend(running.values())
@@ -1,11 +1,18 @@
 
 from datetime import datetime
-from typing import Union
+from typing import Any, Optional, Union
 
 from bson import ObjectId
 from shapely.geometry import shape
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, field_serializer
+
+from wellbelog.utils.arrays import DepthIndex, arrays_to_df, structured_to_arrays
+from wellbelog.utils.arrow import arrays_to_table, read_parquet, table_metadata, table_to_arrays, write_parquet
+
+ARROW_EXCLUDED_FIELDS = {'id', 'created_at', 'updated_at', 'data', 'arrays'}
+"""The fields that are not saved in the Arrow metadata."""
 
 
 class HasIdSchema(BaseModel):
@@ -53,16 +60,252 @@ class DataframeSchema(TimeStampedModelSchema):
     Base class for all models that have a dataframe field.
     Specialized for pandas dataframes.
 
+    The data can be stored in two ways:
+        - As a list of records (dicts), the default.
+        - As columns, a dict of NumPy arrays, one per curve.
+          The records are only created when requested.
+
     Attributes:
-        dataframe: dict: Pandas dataframe object.
+        data (list): The data as a list of records.
+        arrays (dict[str, np.ndarray]): The data as NumPy columns.
+        index_name (str): The name of the index column, if any.
     """
     data: list = None
+    arrays: Optional[dict[str, Any]] = Field(None, description="The data as NumPy columns.")
+    index_name: Optional[str] = Field(None, description="The name of the index column.")
+
+    # NOTE The depth index is built once, for the data or arrays object it was built from
+    _depth_index: Optional[DepthIndex] = PrivateAttr(None)
+    _depth_source: Any = PrivateAttr(None)
+
+    @field_serializer('arrays', when_used='json')
+    def serialize_arrays(self, arrays: Optional[dict[str, Any]]) -> Optional[dict[str, list]]:
+        if arrays is None:
+            return None
+        return {name: np.asarray(values).tolist() for name, values in arrays.items()}
+
+    @classmethod
+    def from_arrays(cls, arrays: dict[str, np.ndarray], **kwargs) -> 'DataframeSchema':
+        """
+        Create the model from a dict of NumPy arrays.
+        The arrays are kept as they are, no copy is made.
+
+        Args:
+            arrays (dict[str, np.ndarray]): The columns of the data.
+            **kwargs: The other fields of the model.
+        """
+        return cls(arrays=arrays, **kwargs)
+
+    @classmethod
+    def from_structured(cls, values: np.ndarray, **kwargs) -> 'DataframeSchema':
+        """
+        Create the model from a NumPy structured array, like the ones
+        returned by dlisio curves.
+        Each field becomes a column, that is a view over the original array.
+
+        Args:
+            values (np.ndarray): The structured array.
+            **kwargs: The other fields of the model.
+        """
+        return cls.from_arrays(structured_to_arrays(values), **kwargs)
+
+    @property
+    def is_columnar(self) -> bool:
+        """
+        If the data is stored as columns.
+        """
+        return self.arrays is not None
+
+    @property
+    def columns_names(self) -> list[str]:
+        """
+        The names of the columns of the data.
+        """
+        if self.is_columnar:
+            return list(self.arrays.keys())
+        if not self.data:
+            return []
+        return list(self.data[0].keys())
+
+    @property
+    def rows_count(self) -> int:
+        """
+        The number of rows of the data.
+        """
+        if self.is_columnar:
+            return len(next(iter(self.arrays.values()), []))
+        return len(self.data) if self.data else 0
+
+    def records(self) -> list[dict]:
+        """
+        Get the data as a list of records.
+        When the data is columnar, the records are created on demand.
+        """
+        if not self.is_columnar:
+            return self.data
+        names = list(self.arrays.keys())
+        columns = [np.asarray(values).tolist() for values in self.arrays.values()]
+        return [dict(zip(names, row)) for row in zip(*columns)]
 
     def as_df(self) -> pd.DataFrame:
         """
         Convert the data to a pandas dataframe.
+        When the data is columnar, the dataframe is a view over the arrays.
+        Multi-dimensional curves are split in one column per dimension, like CURVE[0], CURVE[1].
+        """
+        if not self.is_columnar:
+            return pd.DataFrame(self.data)
+        return arrays_to_df(self.arrays)
+
+    def as_arrays(self) -> dict[str, np.ndarray]:
+        """
+        Get the data as a dict of NumPy arrays.
+        When the data is columnar, the arrays are returned as they are.
+        """
+        if self.is_columnar:
+            return self.arrays
+        columns = {}
+        for name, values in pd.DataFrame(self.data).items():
+            values = values.to_numpy()
+            if values.dtype == object and len(values) and isinstance(values[0], (list, tuple)):
+                # NOTE The multi-dimensional channels are kept as lists in the records
+                values = np.array(values.tolist())
+            columns[name] = values
+        return columns
+
+    @property
+    def depth_name(self) -> Optional[str]:
+        """
+        The name of the depth column, the index column or DEPT.
+        """
+        names = self.columns_names
+        for name in (self.index_name, 'DEPT'):
+            if name and name in names:
+                return name
+        return None
+
+    def depth_index(self) -> DepthIndex:
+        """
+        Get the depth index of the data, it is built on the first call.
+
+        Raises:
+            ValueError: If the data has no depth column.
+        """
+        name = self.depth_name
+        if name is None:
+            raise ValueError('The data has no depth column.')
+        source = self.arrays if self.is_columnar else self.data
+        if self._depth_index is None or self._depth_source is not source:
+            if self.is_columnar:
+                depth = self.arrays[name]
+            else:
+                depth = np.array([record.get(name) for record in self.data], dtype=float)
+            self._depth_index = DepthIndex(depth)
+            self._depth_source = source
+        return self._depth_index
+
+    def slice_depth(
+        self,
+        top: float,
+        bottom: float,
+        curves: Optional[list[str]] = None,
+        as_dataframe: bool = False,
+    ) -> Union[dict[str, np.ndarray], pd.DataFrame]:
+        """
+        Get the rows between two depths, both included, using binary searches on the depth index.
+        For columnar data and monotonic depths, the columns are views over the arrays.
+        Decreasing depths, like up logs, are supported, and the rows keep their original order.
+
+        Args:
+            top (float): The top of the interval.
+            bottom (float): The bottom of the interval.
+            curves (list[str], optional): The curves to get, the depth is always included. Defaults to all.
+            as_dataframe (bool): If True, returns a dataframe instead of a dict of arrays.
+
+        Returns:
+            Union[dict[str, np.ndarray], pd.DataFrame]: The selected rows.
+
+        Raises:
+            ValueError: If the data has no depth column, or a curve is not found.
+        """
+        rows = self.depth_index().rows(top, bottom)
+        depth_name = self.depth_name
+        names = self.columns_names
+        if curves is None:
+            curves = names
+        missing = [curve for curve in curves if curve not in names]
+        if missing:
+            raise ValueError(f'Curves not found: {missing}')
+        selected = [depth_name] + [curve for curve in curves if curve != depth_name]
+
+        if self.is_columnar:
+            columns = {name: self.arrays[name][rows] for name in selected}
+            return arrays_to_df(columns) if as_dataframe else columns
+
+        records = self.data[rows] if isinstance(rows, slice) else [self.data[row] for row in rows]
+        df = pd.DataFrame(records, columns=selected)
+        return df if as_dataframe else {name: values.to_numpy() for name, values in df.items()}
+
+    def to_arrow(self, channels: Optional[dict[str, dict[str, Any]]] = None):
+        """
+        Convert the data to an Apache Arrow table, without building the records.
+        The other fields of the model are saved in the table metadata.
+
+        Args:
+            channels (dict[str, dict], optional): The metadata of each channel, like {'GR': {'units': 'gAPI'}}.
+
+        Returns:
+            pa.Table: The table.
+        """
+        metadata = self.model_dump(mode='json', exclude=ARROW_EXCLUDED_FIELDS)
+        return arrays_to_table(self.as_arrays(), channels=channels, metadata=metadata)
+
+    def to_parquet(
+        self,
+        path: str,
+        channels: Optional[dict[str, dict[str, Any]]] = None,
+        compression: Optional[str] = 'zstd',
+        **kwargs,
+    ) -> str:
+        """
+        Save the data to a Parquet file.
+
+        Args:
+            path (str): The path to save the file.
+            channels (dict[str, dict], optional): The metadata of each channel, like {'GR': {'units': 'gAPI'}}.
+            compression (str, optional): The compression codec, like 'zstd', 'snappy' or None.
+            **kwargs: Additional keyword arguments to pass to pyarrow.parquet.write_table.
+
+        Returns:
+            str: the path to the file.
+        """
+        return write_parquet(self.to_arrow(channels=channels), path, compression=compression, **kwargs)
+
+    @classmethod
+    def from_arrow(cls, table, **kwargs) -> 'DataframeSchema':
+        """
+        Create the model from an Arrow table, like the ones created by `to_arrow`.
+        The data is columnar, and the other fields are restored from the table metadata.
+
+        Args:
+            table (pa.Table): The table.
+            **kwargs: The other fields of the model, they take precedence over the metadata.
+        """
+        fields = {name: value for name, value in table_metadata(table).items() if name in cls.model_fields}
+        fields.update(kwargs)
+        return cls.from_arrays(table_to_arrays(table), **fields)
+
+    @classmethod
+    def read_parquet(cls, path: str, columns: Optional[list[str]] = None, **kwargs) -> 'DataframeSchema':
+        """
+        Read the model from a Parquet file, like the ones saved by `to_parquet`.
+
+        Args:
+            path (str): The path to the file.
+            columns (list[str], optional): Read only these columns.
+            **kwargs: The other fields of the model, they take precedence over the metadata.
         """
-        return pd.DataFrame(self.data)
+        return cls.from_arrow(read_parquet(path, columns=columns), **kwargs)
 
     def to_csv(self, path: str, **kwargs,) -> str:
         """
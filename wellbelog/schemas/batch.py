@@ -0,0 +1,44 @@
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ReaderChoice(BaseModel):
+    """
+    The reader chosen by the MainReader for a file, kept for diagnostics.
+
+    Attributes:
+        file_type (str): The format the file is read as, 'dlis', 'lis' or 'las'.
+        detected_by (str): 'content' when the format was recognized from the first bytes, or 'extension'.
+        fallback (Optional[str]): The format tried if the first reader raises, if any.
+        used_fallback (bool): If the file was read by the fallback reader.
+    """
+
+    file_type: str = Field(..., description="The format the file is read as.")
+    detected_by: str = Field(..., description="'content' or 'extension'.")
+    fallback: Optional[str] = Field(None, description="The format tried if the first reader raises.")
+    used_fallback: bool = Field(False, description="If the file was read by the fallback reader.")
+
+
+class FileLoadResult(BaseModel):
+    """
+    The result of loading one file in a batch.
+    If any error occurs while reading the file, the error flag is set to True and the model is None.
+
+    Attributes:
+        path (str): The path to the file.
+        model (Any): The model returned by the reader.
+        error (bool): If the file has any error during reading.
+        error_message (Optional[str]): The error exception if any.
+        elapsed (float): The time spent reading the file, in seconds.
+        worker_pid (Optional[int]): The id of the process that read the file.
+        choice (Optional[ReaderChoice]): The reader chosen for the file.
+    """
+
+    path: str = Field(..., description="The path to the file.")
+    model: Optional[Any] = Field(None, description="The model returned by the reader.")
+    error: bool = Field(False, description="If the file has any error during reading.")
+    error_message: Optional[str] = Field(None, description="The error exception if any.")
+    elapsed: float = Field(0.0, description="The time spent reading the file, in seconds.")
+    worker_pid: Optional[int] = Field(None, description="The id of the process that read the file.")
+    choice: Optional[ReaderChoice] = Field(None, description="The reader chosen for the file.")
@@ -0,0 +1,260 @@
+"""
+Compact tables of the channels metadata, like the DLIS frame channels or the LAS curves specs.
+
+The wide files have thousands of channels, and a pydantic model per channel is slow to build and to keep.
+A table keeps each field as a column, one list per field, and the channels are only read as:
+    - records: light `__slots__` objects with the fields as attributes, built when a channel is accessed.
+    - pydantic views: the channel model, built on demand by `model` and `models`.
+The channels are found by their name with a dict, built on the first lookup.
+"""
+from collections.abc import Mapping, Sequence
+from typing import Any, ClassVar, Iterable, Iterator, Optional, Union
+
+from pydantic import BaseModel
+from pydantic_core import core_schema
+
+BASE_FIELDS = frozenset({'id', 'created_at', 'updated_at'})
+"""The fields of the base schemas that are not kept in the tables."""
+
+
+class ChannelRecord:
+    """
+    A channel of a table, with the fields of the channel model as attributes.
+    The values are read from the table, no copy is made.
+    """
+
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table: 'ChannelTable', row: int) -> None:
+        self._table = table
+        self._row = row
+
+    def __getattr__(self, name: str) -> Any:
+        # NOTE The private names are left out, so a record being copied does not look up its table
+        if not name.startswith('_'):
+            column = self._table._columns.get(name)
+            if column is not None:
+                return column[self._row]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        The fields of the channel.
+        """
+        return self._table.row(self._row)
+
+    def model(self) -> BaseModel:
+        """
+        The pydantic view of the channel.
+        """
+        return self._table.model(self._row)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ChannelRecord):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={value!r}' for name, value in self.as_dict().items())
+        return f'{type(self._table).__name__}.Record({fields})'
+
+
+class ChannelTable(Sequence):
+    """
+    The channels metadata of a file, stored by field.
+    It is a sequence of `ChannelRecord`, and the subclasses set the pydantic model of the channels,
+    and the field used as the channel name:
+
+        class FrameChannelTable(ChannelTable, model=FrameChannel, key='name'):
+            __slots__ = ()
+
+    It can be used as a pydantic field. The tables are validated from lists of channel models, records or dicts,
+    and are serialized as lists of dicts, without the ids and timestamps of the channel models.
+    """
+
+    __slots__ = ('_columns', '_size', '_index')
+
+    model_class: ClassVar[type[BaseModel]]
+    key: ClassVar[str]
+    fields: ClassVar[tuple[str, ...]]
+
+    def __init_subclass__(cls, model: Optional[type[BaseModel]] = None, key: Optional[str] = None, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if model is not None:
+            cls.model_class = model
+            cls.fields = tuple(name for name in model.model_fields if name not in BASE_FIELDS)
+            assert key in cls.fields, f'The key {key} is not a field of {model.__name__}.'
+            cls.key = key
+
+    def __init__(self, columns: Optional[Mapping[str, list]] = None) -> None:
+        """
+        Args:
+            columns (Mapping[str, list], optional): The values of each field, the missing fields are None.
+                The lists are kept, not copied.
+        """
+        columns = columns or {}
+        sizes = {len(values) for values in columns.values()}
+        assert len(sizes) <= 1, 'All the columns must have the same length.'
+        size = sizes.pop() if sizes else 0
+        self._size = size
+        self._columns = {name: columns[name] if name in columns else [None] * size for name in self.fields}
+        self._index = None
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Union[Mapping, BaseModel, ChannelRecord]]) -> 'ChannelTable':
+        """
+        Build a table from channels, as dicts or objects with the fields as attributes.
+        The values are not validated, and the other keys are ignored.
+        """
+        columns = {name: [] for name in cls.fields}
+        for row in rows:
+            if isinstance(row, Mapping):
+                for name, column in columns.items():
+                    column.append(row.get(name))
+            else:
+                for name, column in columns.items():
+                    column.append(getattr(row, name, None))
+        return cls(columns)
+
+    @classmethod
+    def validate(cls, value: Any) -> 'ChannelTable':
+        """
+        Validate a table from a pydantic field.
+        The dicts, like the ones loaded from JSON, are validated by the channel model, the other channels are kept as is.
+
+        Raises:
+            ValueError: If the value is not a table or a list of channels.
+        """
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, ChannelTable):
+            return cls.from_rows(value)
+        if isinstance(value, (list, tuple)):
+            return cls.from_rows(
+                cls.model_class.model_validate(row) if isinstance(row, Mapping) else row for row in value
+            )
+        raise ValueError(f'{cls.__name__} expects a list of channels, got {type(value).__name__}.')
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls.validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda table, info: table.rows(exclude_none=info.exclude_none), info_arg=True,
+            ),
+        )
+
+    @property
+    def index(self) -> dict[str, int]:
+        """
+        The position of each channel by its name. With repeated names, the first channel is kept.
+        """
+        if self._index is None:
+            index = {}
+            for row, name in enumerate(self._columns[self.key]):
+                index.setdefault(name, row)
+            self._index = index
+        return self._index
+
+    @property
+    def names(self) -> list:
+        """
+        The names of the channels, in order.
+        """
+        return list(self._columns[self.key])
+
+    def column(self, name: str) -> list:
+        """
+        The values of a field, for all the channels.
+        """
+        return list(self._columns[name])
+
+    def position(self, item: Union[int, str]) -> Optional[int]:
+        """
+        The position of a channel, by its position or its name. None if it is not found.
+        """
+        if isinstance(item, str):
+            return self.index.get(item)
+        if -self._size <= item < self._size:
+            return item % self._size
+        return None
+
+    def get(self, name: str, default: Any = None) -> Optional[ChannelRecord]:
+        """
+        Get a channel by its name, or the default if it is not found.
+        """
+        row = self.index.get(name)
+        return default if row is None else ChannelRecord(self, row)
+
+    def row(self, item: Union[int, str]) -> dict[str, Any]:
+        """
+        The fields of a channel, by its position or its name.
+
+        Raises:
+            KeyError: If the channel is not found.
+        """
+        row = self.position(item)
+        if row is None:
+            raise KeyError(item)
+        return {name: column[row] for name, column in self._columns.items()}
+
+    def rows(self, exclude_none: bool = False) -> list[dict[str, Any]]:
+        """
+        The fields of all the channels, as dicts.
+        """
+        rows = [dict(zip(self.fields, values)) for values in zip(*self._columns.values())]
+        if exclude_none:
+            return [{name: value for name, value in row.items() if value is not None} for row in rows]
+        return rows
+
+    def model(self, item: Union[int, str]) -> Optional[BaseModel]:
+        """
+        The pydantic view of a channel, by its position or its name. None if it is not found.
+        """
+        row = self.position(item)
+        return None if row is None else self.model_class(**self.row(row))
+
+    def models(self) -> list[BaseModel]:
+        """
+        The pydantic views of all the channels.
+        """
+        return [self.model_class(**row) for row in self.rows()]
+
+    def metadata(self, fields: Iterable[str]) -> dict[Any, dict[str, Any]]:
+        """
+        Some fields of each channel, by the channel name. With repeated names, the first channel is kept, like `index`.
+        """
+        fields = list(fields)
+        columns = [self._columns[name] for name in fields]
+        return {name: {field: column[row] for field, column in zip(fields, columns)} for name, row in self.index.items()}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[ChannelRecord, 'ChannelTable']:
+        if isinstance(item, slice):
+            return type(self)({name: column[item] for name, column in self._columns.items()})
+        row = self.position(item)
+        if row is None or isinstance(item, str):
+            raise IndexError(f'{type(self).__name__} index out of range: {item}')
+        return ChannelRecord(self, row)
+
+    def __iter__(self) -> Iterator[ChannelRecord]:
+        return (ChannelRecord(self, row) for row in range(self._size))
+
+    def __contains__(self, item: Any) -> bool:
+        if isinstance(item, str):
+            return item in self.index
+        return super().__contains__(item)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ChannelTable):
+            return NotImplemented
+        return type(self) is type(other) and self._columns == other._columns
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.names})'
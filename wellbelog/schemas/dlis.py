@@ -1,11 +1,18 @@
 from functools import cached_property
-from typing import Any, Union, Optional
+from typing import Any, Callable, Iterable, Union, Optional
 
-from pydantic import Field
+import numpy as np
+import pandas as pd
+from pydantic import Field, PrivateAttr
 from rich.table import Table
 
+from wellbelog.utils.arrow import read_parquet, table_channels
+from wellbelog.utils.nullvalues import NULL_VALUES
+from wellbelog.utils.resample import common_depth, resample
 from wellbelog.utils.console import console
 from wellbelog.schemas.base_schema import TimeStampedModelSchema, DataframeSchema
+from wellbelog.schemas.channels import ChannelTable
+from wellbelog.schemas.profiling import ReadProfile
 
 
 class FrameChannel(TimeStampedModelSchema):
@@ -22,8 +29,15 @@ class FrameChannel(TimeStampedModelSchema):
     data: Any = Field(None, description="The data of the channel")
 
 
-ChannelsList = list[FrameChannel]
-"""List of FrameChannel objects."""
+class FrameChannelTable(ChannelTable, model=FrameChannel, key='name'):
+    """
+    The channels of a frame, stored by field. The channels are records, and `model` gives their FrameChannel view.
+    """
+    __slots__ = ()
+
+
+ChannelsList = FrameChannelTable
+"""The channels of a frame."""
 
 
 class FrameDataframe(DataframeSchema):
@@ -40,6 +54,84 @@ class FrameDataframe(DataframeSchema):
     logical_file_id: str = Field(..., description="The id of the logical file.")
 
 
+class LazyFrameDataframe(FrameDataframe):
+    """
+    A Dlis frame data that is only decoded when it is accessed.
+    The `as_df`, `records`, `to_csv` and `to_excel` methods load the data on the first call.
+    The `data` and `arrays` fields are only filled after the data is loaded.
+    The data can be released, and it will be decoded again on the next access.
+    """
+
+    _loader: Optional[Callable[[], FrameDataframe]] = PrivateAttr(None)
+
+    def set_loader(self, loader: Callable[[], Union[FrameDataframe, Exception]]) -> None:
+        """
+        Set the function that decodes the frame data.
+        """
+        self._loader = loader
+
+    @property
+    def is_loaded(self) -> bool:
+        """
+        If the data was already decoded.
+        """
+        return self.data is not None or self.arrays is not None
+
+    def load(self) -> 'LazyFrameDataframe':
+        """
+        Decode the frame data, if it is not loaded yet.
+
+        Raises:
+            RuntimeError: If there is no loader, like when the source file was closed.
+            Exception: Any error raised while decoding the frame.
+        """
+        if self.is_loaded:
+            return self
+        if self._loader is None:
+            raise RuntimeError('The frame data can not be loaded, the source file is closed.')
+        decoded = self._loader()
+        if isinstance(decoded, Exception):
+            raise decoded
+        self.data = decoded.data
+        self.arrays = decoded.arrays
+        return self
+
+    def release(self) -> None:
+        """
+        Release the decoded data, keeping the loader.
+        """
+        self.data = None
+        self.arrays = None
+
+    def close(self) -> None:
+        """
+        Drop the loader, the data already loaded is kept.
+        """
+        self._loader = None
+
+    @property
+    def is_columnar(self) -> bool:
+        return self.load().arrays is not None
+
+    @property
+    def columns_names(self) -> list[str]:
+        self.load()
+        return super().columns_names
+
+    @property
+    def rows_count(self) -> int:
+        self.load()
+        return super().rows_count
+
+    def records(self) -> list[dict]:
+        self.load()
+        return super().records()
+
+    def as_df(self) -> pd.DataFrame:
+        self.load()
+        return super().as_df()
+
+
 class FrameModel(TimeStampedModelSchema):
     """
     A class used to represent a Dlis Frame.
@@ -48,7 +140,7 @@ class FrameModel(TimeStampedModelSchema):
         file_name (str): The name of the file.
         logical_file_id (str): The id of the logical file.
         description (Optional[str]): The description of the file.
-        channels (ChannelsList): The channels of the file.
+        channels (Optional[FrameChannelTable]): The channels of the file.
         error (bool): If the file has any error during opening.
         error_message (Optional[str]): The error exception if any.
         data (Optional[FrameDataframe]): The dataframe of the file.
@@ -57,11 +149,84 @@ class FrameModel(TimeStampedModelSchema):
     file_name: str = Field(..., description="The name of the file.")
     logical_file_id: str = Field(..., description="The id of the logical file.")
     description: Optional[str] = Field(None, description="The description of the file.")
-    channels: ChannelsList = Field(None, description="The channels of the file.")
+    channels: Optional[FrameChannelTable] = Field(None, description="The channels of the file.")
     error: bool = Field(False, description="If the file has any error during opening.")
     error_message: Optional[str] = Field(None, description="The error exception if any.")
     data: Optional[FrameDataframe] = Field(None, description="The dataframe of the file.")
 
+    def channels_metadata(self) -> dict[str, dict[str, Any]]:
+        """
+        Get the units, long name and representation of each channel, by the channel name.
+        """
+        if not self.channels:
+            return {}
+        return self.channels.metadata(('units', 'long_name', 'repr'))
+
+    @property
+    def curves_names(self) -> list[str]:
+        """
+        The names of the channels, in order.
+        """
+        return self.channels.names if self.channels else []
+
+    def get_curve(self, name: str) -> Optional[FrameChannel]:
+        """
+        Get the FrameChannel view of a channel by its name.
+        If the channel is not found, return None.
+        """
+        return self.channels.model(name) if self.channels else None
+
+    def slice_depth(
+        self,
+        top: float,
+        bottom: float,
+        curves: Optional[list[str]] = None,
+        as_dataframe: bool = False,
+    ) -> Union[dict[str, np.ndarray], pd.DataFrame]:
+        """
+        Get the frame rows between two depths, see `DataframeSchema.slice_depth`.
+
+        Args:
+            top (float): The top of the interval.
+            bottom (float): The bottom of the interval.
+            curves (list[str], optional): The curves to get, the depth is always included. Defaults to all.
+            as_dataframe (bool): If True, returns a dataframe instead of a dict of arrays.
+        """
+        assert self.data is not None, "The frame has no data."
+        return self.data.slice_depth(top, bottom, curves=curves, as_dataframe=as_dataframe)
+
+    def to_parquet(self, path: str, compression: Optional[str] = 'zstd', **kwargs) -> str:
+        """
+        Save the frame data to a Parquet file, keeping the channels metadata.
+
+        Args:
+            path (str): The path to save the file.
+            compression (str, optional): The compression codec, like 'zstd', 'snappy' or None.
+            **kwargs: Additional keyword arguments to pass to pyarrow.parquet.write_table.
+
+        Returns:
+            str: the path to the file.
+        """
+        assert self.data is not None, "The frame has no data to save."
+        return self.data.to_parquet(path, channels=self.channels_metadata(), compression=compression, **kwargs)
+
+    @classmethod
+    def read_parquet(cls, path: str, columns: Optional[list[str]] = None) -> 'FrameModel':
+        """
+        Read a frame from a Parquet file saved by `to_parquet`.
+        The data is columnar, and the channels are restored from the file metadata.
+
+        Args:
+            path (str): The path to the file.
+            columns (list[str], optional): Read only these columns.
+        """
+        table = read_parquet(path, columns=columns)
+        data = FrameDataframe.from_arrow(table)
+        channels = FrameChannelTable.from_rows(
+            {**metadata, 'name': name} for name, metadata in table_channels(table).items()
+        )
+        return cls(file_name=data.file_name, logical_file_id=data.logical_file_id, channels=channels, data=data)
+
 
 class LogicalFileSummary(TimeStampedModelSchema):
     """
@@ -75,7 +240,9 @@ class LogicalFileSummary(TimeStampedModelSchema):
         comments (Optional[dict]): List of dicts with the comments of the file.
         header (Optional[str]): String with the header of the file.
         frames (Optional[list]): List of dicts with the frames of the file.
+    The sections that were not built are None.
     """
+    parameters: Optional[list] = Field(None, alias='parameters')
     tools: Optional[list] = Field(None, alias='tools')
     remarks: Optional[dict] = Field(None, alias='remarks')
     comments: Optional[dict] = Field(None, alias='comments')
@@ -119,7 +286,7 @@ class LogicalFileModel(TimeStampedModelSchema):
         """
         if not self.frames or self.error:
             return None
-        curves = [channel.name for frame in self.frames for channel in frame.channels]
+        curves = [name for frame in self.frames for name in frame.curves_names]
         return list(set(curves))
 
     def get_frame(self, index: int = 0) -> FrameModel:
@@ -132,6 +299,96 @@ class LogicalFileModel(TimeStampedModelSchema):
             return self.frames[0]
         return self.frames[index]
 
+    def merge_frames(
+        self,
+        depth: Optional[np.ndarray] = None,
+        step: Optional[float] = None,
+        method: str = 'linear',
+        tolerance: Optional[float] = None,
+        null_values: Optional[Iterable[float]] = NULL_VALUES,
+    ) -> FrameModel:
+        """
+        Merge the frames of the file onto one depth axis, in a single columnar frame.
+        The frames sampled at different rates are aligned with vectorized resampling, see `wellbelog.utils.resample`.
+        The channels keep their metadata. A name found in more than one frame gets the frame position as suffix,
+        like GR_1, with a counter if the suffixed name is already used, like GR_1_2.
+        The FRAMENO columns of the frames are left out.
+
+        Args:
+            depth (np.ndarray, optional): The depth axis. Defaults to a regular axis that covers all the frames,
+                with the finest step of the frames.
+            step (float, optional): The step of the default axis.
+            method (str): 'linear' to interpolate the curves, or 'nearest' to take the closest sample.
+            tolerance (float, optional): The max distance to the closest sample of a frame, farther depths are NaN.
+            null_values (Iterable[float], optional): The null values, replaced with NaN before the resampling.
+
+        Raises:
+            ValueError: If there is no frame with data, a frame has no depth column,
+                or the depth channels of the frames have different units.
+
+        Returns:
+            FrameModel: The merged frame, with the depth as the first column and the index.
+        """
+        assert not self.error, "The file has an error. Cannot merge the frames."
+        frames = [frame for frame in self.frames or [] if not frame.error and frame.data is not None]
+        if not frames:
+            raise ValueError('There are no frames with data to merge.')
+
+        columns, depths, units = [], [], {}
+        for frame in frames:
+            depth_name = frame.data.depth_name
+            if depth_name is None:
+                raise ValueError(f'The frame {frame.description} has no depth column.')
+            arrays = frame.data.as_arrays()
+            columns.append((depth_name, arrays))
+            depths.append(arrays[depth_name])
+            depth_channel = frame.channels.get(depth_name) if frame.channels else None
+            # NOTE The frames without depth units are assumed to be in the units of the others
+            if depth_channel is not None and depth_channel.units and str(depth_channel.units).strip():
+                units.setdefault(str(depth_channel.units).strip(), frame.description)
+        if len(units) > 1:
+            raise ValueError(
+                'The depth channels of the frames have different units: '
+                + ', '.join(f'{unit} ({description})' for unit, description in units.items())
+            )
+
+        index_name = columns[0][0]
+        target = common_depth(depths, step=step) if depth is None else np.asarray(depth, dtype=np.float64)
+        arrays = {index_name: target}
+        index_channel = frames[0].channels.get(index_name) if frames[0].channels else None
+        channels = [index_channel.as_dict() if index_channel else {'name': index_name}]
+
+        # NOTE The suffixed names can not take the names of the channels of any frame
+        used = {name for _, frame_arrays in columns for name in frame_arrays}
+        for position, (frame, (depth_name, frame_arrays)) in enumerate(zip(frames, columns)):
+            frame_channels = frame.channels or FrameChannelTable()
+            for name, values in frame_arrays.items():
+                # NOTE The frame numbers only count the rows of each frame
+                if name in (depth_name, 'FRAMENO'):
+                    continue
+                merged_name = name
+                if name in arrays:
+                    merged_name, count = f'{name}_{position}', 1
+                    while merged_name in used:
+                        merged_name, count = f'{name}_{position}_{count}', count + 1
+                    used.add(merged_name)
+                arrays[merged_name] = resample(
+                    frame_arrays[depth_name], values, target, method=method, tolerance=tolerance, null_values=null_values,
+                )
+                channel = frame_channels.get(name)
+                channels.append({**channel.as_dict(), 'name': merged_name} if channel else {'name': merged_name})
+
+        data = FrameDataframe.from_arrays(
+            arrays, file_name=self.file_name, logical_file_id=frames[0].logical_file_id, index_name=index_name,
+        )
+        return FrameModel(
+            file_name=self.file_name,
+            logical_file_id=frames[0].logical_file_id,
+            description=f'Merged {len(frames)} frames',
+            channels=FrameChannelTable.from_rows(channels),
+            data=data,
+        )
+
     def table_view(self) -> Table:
         """
         Get a table view of the file.
@@ -155,22 +412,48 @@ class PhysicalFileModel(TimeStampedModelSchema):
 
     Attributes:
         file_name (str): The name of the file.
+        folder_name (Optional[str]): The name of the folder.
         logical_files (list[dlis.LogicalFile]): The logical files.
         error (bool): If the file has any error during opening.
         error_message (Optional[str]): The error exception if any.
+        profile (Optional[ReadProfile]): The stages timings of the read, when the reader has a profiler.
     """
 
     file_name: str = Field(..., description="The name of the file.")
+    folder_name: Optional[str] = Field(None, description="The name of the folder.")
     error: bool = Field(False, description="If the file has any error during opening.")
     error_message: Optional[str] = Field(None, description="The error exception if any.")
     logical_files: Optional[list[LogicalFileModel]] = Field(default_factory=list, description="The logical files.")
     error_files: Optional[list[LogicalFileModel]] = Field(default_factory=list, description="The error files.")
     mnemonics: Optional[list[str]] = Field(default_factory=list, description="The mnemonics of the file.")
+    profile: Optional[ReadProfile] = Field(None, description="The stages timings of the read, when the reader has a profiler.")
+
+    # NOTE The opened dlis file, only kept when the file is read in lazy mode
+    _source: Any = PrivateAttr(None)
 
     @property
     def logical_files_count(self) -> int:
         return len(self.logical_files)
 
+    def set_source(self, source: Any) -> None:
+        """
+        Keep a reference to the opened dlis file, used by the lazy frames.
+        """
+        self._source = source
+
+    def close(self) -> None:
+        """
+        Close the source file of a lazy model.
+        After closing, the frames data that was not loaded can not be loaded anymore.
+        """
+        for file in self.logical_files + self.error_files:
+            for frame in file.frames or []:
+                if isinstance(frame.data, LazyFrameDataframe):
+                    frame.data.close()
+        if self._source is not None:
+            self._source.close()
+            self._source = None
+
     def logical_files_table(self) -> Table:
         """
         Get a table view of the logical files.
@@ -191,5 +474,5 @@ class PhysicalFileModel(TimeStampedModelSchema):
         """
         if not self.logical_files or self.error:
             return None
-        curves = [channel.name for file in self.logical_files for frame in file.frames for channel in frame.channels]
+        curves = [name for file in self.logical_files for frame in file.frames for name in frame.curves_names]
         return list(set(curves))
@@ -1,11 +1,16 @@
-from functools import cached_property
-from typing import Any, Optional
+from typing import Any, Optional, Union
+
+import numpy as np
+import pandas as pd
 
 from pydantic import BaseModel, Field
 from rich.table import Table
 
+from wellbelog.utils.arrow import read_parquet, table_channels
 from wellbelog.utils.console import console
 from wellbelog.schemas.base_schema import TimeStampedModelSchema, DataframeSchema
+from wellbelog.schemas.channels import ChannelTable
+from wellbelog.schemas.profiling import ReadProfile
 
 
 class LasDataframe(DataframeSchema):
@@ -41,20 +46,29 @@ class LasCurvesSpecs(BaseModel):
     shape: Optional[tuple] = Field(None, description="The shape of the curve.")
 
 
+class LasCurvesTable(ChannelTable, model=LasCurvesSpecs, key='mnemonic'):
+    """
+    The curves specs of a LAS file, stored by field. The curves are records, and `model` gives their LasCurvesSpecs view.
+    """
+    __slots__ = ()
+
+
 class LasFileModel(TimeStampedModelSchema):
     """
     A class used to represent a BeloDlis object.
 
     Attributes:
         file_name (str): The name of the file.
-        logical_files (list[dlis.LogicalFile]): The logical files.
+        specs (LasCurvesTable): The curves specs.
+        profile (Optional[ReadProfile]): The stages timings of the read, when the reader has a profiler.
     """
 
     file_name: str = Field(..., description="The name of the file.")
     folder_name: Optional[str] = Field(None, description="The name of the folder.")
-    specs: list[LasCurvesSpecs] = Field([], description="The curves specs.")
+    specs: LasCurvesTable = Field(default_factory=LasCurvesTable, description="The curves specs.")
     error: bool = Field(False, description="If the file has any error during opening.")
     error_message: Optional[str] = Field(None, description="The error exception if any.")
+    profile: Optional[ReadProfile] = Field(None, description="The stages timings of the read, when the reader has a profiler.")
 
     data: Optional[LasDataframe] = Field(None, description="The data of the file.")
 
@@ -69,16 +83,73 @@ class LasFileModel(TimeStampedModelSchema):
             column (str): The column name.
 
         Returns:
-            Optional[LasCurvesSpecs]: The curve.
+            Optional[LasCurvesSpecs]: The pydantic view of the curve.
         """
-        for spec in self.specs:
-            if spec.mnemonic == column:
-                return spec
-        return None
+        return self.specs.model(column)
 
-    @cached_property
+    @property
     def curves_names(self) -> list[str]:
-        return [spec.mnemonic for spec in self.specs]
+        return self.specs.names
+
+    def channels_metadata(self) -> dict[str, dict[str, Any]]:
+        """
+        Get the unit and description of each curve, by the curve mnemonic.
+        """
+        return self.specs.metadata(('unit', 'descr'))
+
+    def slice_depth(
+        self,
+        top: float,
+        bottom: float,
+        curves: Optional[list[str]] = None,
+        as_dataframe: bool = False,
+    ) -> Union[dict[str, np.ndarray], pd.DataFrame]:
+        """
+        Get the curves rows between two depths, see `DataframeSchema.slice_depth`.
+
+        Args:
+            top (float): The top of the interval.
+            bottom (float): The bottom of the interval.
+            curves (list[str], optional): The curves to get, the depth is always included. Defaults to all.
+            as_dataframe (bool): If True, returns a dataframe instead of a dict of arrays.
+        """
+        assert self.data is not None, "The file has no data."
+        return self.data.slice_depth(top, bottom, curves=curves, as_dataframe=as_dataframe)
+
+    def to_parquet(self, path: str, compression: Optional[str] = 'zstd', **kwargs) -> str:
+        """
+        Save the curves data to a Parquet file, keeping the curves units and descriptions.
+
+        Args:
+            path (str): The path to save the file.
+            compression (str, optional): The compression codec, like 'zstd', 'snappy' or None.
+            **kwargs: Additional keyword arguments to pass to pyarrow.parquet.write_table.
+
+        Returns:
+            str: the path to the file.
+        """
+        assert self.data is not None, "The file has no data to save."
+        return self.data.to_parquet(path, channels=self.channels_metadata(), compression=compression, **kwargs)
+
+    @classmethod
+    def read_parquet(cls, path: str, columns: Optional[list[str]] = None) -> 'LasFileModel':
+        """
+        Read a LAS file model from a Parquet file saved by `to_parquet`.
+        The data is columnar, and the curves specs are restored from the file metadata.
+
+        Args:
+            path (str): The path to the file.
+            columns (list[str], optional): Read only these columns.
+        """
+        table = read_parquet(path, columns=columns)
+        data = LasDataframe.from_arrow(table)
+        channels = table_channels(table)
+        specs = LasCurvesTable({
+            'mnemonic': list(channels),
+            'unit': [metadata.get('unit', '') for metadata in channels.values()],
+            'descr': [metadata.get('descr', '') for metadata in channels.values()],
+        })
+        return cls(file_name=data.file_name, specs=specs, data=data)
 
     def table_view(self) -> Table:
         """
@@ -1,11 +1,15 @@
 from functools import cached_property
 from typing import Any, Union, Optional
 
+import numpy as np
+import pandas as pd
 from pydantic import BaseModel, Field
 from rich.table import Table
 
 from wellbelog.utils.console import console
 from wellbelog.schemas.base_schema import TimeStampedModelSchema, DataframeSchema
+from wellbelog.schemas.channels import ChannelTable
+from wellbelog.schemas.profiling import ReadProfile
 
 LOGICAL_FILE_ATTR = [
     'api_curve_class', 'api_curve_type', 'api_log_type',
@@ -82,16 +86,45 @@ class LisLogicalFileSpecsDict(BaseModel):
         )
 
 
+class LisSpecsTable(ChannelTable, model=LisLogicalFileSpecsDict, key='mnemonic'):
+    """
+    The specs of the channels of a LIS logical file, stored by field.
+    The channels are records, and `model` gives their LisLogicalFileSpecsDict view.
+    """
+    __slots__ = ()
+
+
 class LisLogicalSpecs(BaseModel):
     file_name: str = Field(..., description="The name of the file.")
     logical_id: Union[str, int] = Field(..., description="The id of the logical file.")
-    specs_dicts: list[LisLogicalFileSpecsDict] = Field(default_factory=list, description="The specification of the file.")
+    specs_dicts: LisSpecsTable = Field(default_factory=LisSpecsTable, description="The specification of the file.")
+
+
+class LisSampleRateLayout(BaseModel):
+    """
+    The channels of a frame sampled at the same rate.
+    The fast channels are sampled many times per frame, and are kept as 2D arrays in the frame data,
+    with one row per frame and one column per sample.
+
+    Attributes:
+        frame (int): The position of the frame in the logical file, one frame per format spec.
+        sample_rate (int): The number of samples of the channels per frame.
+        channels (list[str]): The mnemonics of the channels, without the index.
+        samples (int): The number of samples of each channel, the frames times the sample rate.
+        spacing (Optional[float]): The depth between two samples, when the format spec declares the frame spacing.
+    """
+    frame: int = Field(..., description="The position of the frame in the logical file.")
+    sample_rate: int = Field(..., description="The number of samples of the channels per frame.")
+    channels: list[str] = Field(default_factory=list, description="The mnemonics of the channels.")
+    samples: int = Field(0, description="The number of samples of each channel.")
+    spacing: Optional[float] = Field(None, description="The depth between two samples.")
 
 
 class LogicalLisFileModel(TimeStampedModelSchema):
     """
     Represents a logical LIS file.
-    It can have multiple frames. But generally only one.
+    It can have multiple frames, one per data format spec. But generally only one.
+    The channels sampled many times per frame are 2D arrays in the frame data, see `sample_rates`.
 
     Attributes:
         file_name (str): The name of the file.
@@ -100,8 +133,9 @@ class LogicalLisFileModel(TimeStampedModelSchema):
         error (bool): If the file has any error during opening.
         error_message (str): The error exception if any.
         well_site_specs (LisLogicalWellSiteSpec): The well site specifications.
-        specs (list[Any]): The specification of the file.
+        specs (LisLogicalSpecs): The specification of the file.
         header (str): The header of the file.
+        sample_rates (list[LisSampleRateLayout]): The channels of each sample rate of each frame.
     """
 
     file_name: str = Field(..., description="The name of the file.")
@@ -111,8 +145,9 @@ class LogicalLisFileModel(TimeStampedModelSchema):
     error: bool = Field(False, description="If the file has any error during opening.")
     error_message: Optional[str] = Field(None, description="The error exception if any.")
     well_site_specs: Optional[LisLogicalWellSiteSpec] = Field(None, description="The well site specifications.")
-    specs: list[Any] = Field(None, description="The specification of the file.")
+    specs: Optional[LisLogicalSpecs] = Field(None, description="The specification of the file.")
     header: Optional[str] = Field(None, description="The header of the file.")
+    sample_rates: list[LisSampleRateLayout] = Field(default_factory=list, description="The channels of each sample rate.")
 
     @property
     def frames_count(self) -> int:
@@ -124,6 +159,51 @@ class LogicalLisFileModel(TimeStampedModelSchema):
             return self.frames[0]
         return self.frames[index]
 
+    def channels_metadata(self) -> dict[str, dict[str, Any]]:
+        """
+        Get the units and samples of each curve, by the curve mnemonic.
+        """
+        if not self.specs:
+            return {}
+        metadata = self.specs.specs_dicts.metadata(('units', 'samples'))
+        return {mnemonic.strip(): values for mnemonic, values in metadata.items() if mnemonic}
+
+    def slice_depth(
+        self,
+        top: float,
+        bottom: float,
+        curves: Optional[list[str]] = None,
+        as_dataframe: bool = False,
+        index: int = 0,
+    ) -> Union[dict[str, np.ndarray], pd.DataFrame]:
+        """
+        Get the rows of a frame between two depths, see `DataframeSchema.slice_depth`.
+
+        Args:
+            top (float): The top of the interval.
+            bottom (float): The bottom of the interval.
+            curves (list[str], optional): The curves to get, the depth is always included. Defaults to all.
+            as_dataframe (bool): If True, returns a dataframe instead of a dict of arrays.
+            index (int): The index of the frame.
+        """
+        return self.get_frame(index).slice_depth(top, bottom, curves=curves, as_dataframe=as_dataframe)
+
+    def to_parquet(self, path: str, index: int = 0, compression: Optional[str] = 'zstd', **kwargs) -> str:
+        """
+        Save the data of a frame to a Parquet file, keeping the curves units.
+
+        Args:
+            path (str): The path to save the file.
+            index (int): The index of the frame.
+            compression (str, optional): The compression codec, like 'zstd', 'snappy' or None.
+            **kwargs: Additional keyword arguments to pass to pyarrow.parquet.write_table.
+
+        Returns:
+            str: the path to the file.
+        """
+        frame = self.get_frame(index)
+        return frame.to_parquet(path, channels=self.channels_metadata(), compression=compression, **kwargs)
+
     def table_view(self) -> Table:
         """
         Create a table view of the file.
@@ -150,6 +230,7 @@ class PhysicalLisFileModel(TimeStampedModelSchema):
         error_files (list[LogicalLisFileModel]): The error files.
         error (bool): If the file has any error during opening.
         error_message (str): The error exception if any.
+        profile (Optional[ReadProfile]): The stages timings of the read, when the reader has a profiler.
     """
 
     file_name: str = Field(..., description="The name of the file.")
@@ -158,6 +239,7 @@ class PhysicalLisFileModel(TimeStampedModelSchema):
     error_files: Optional[list[LogicalLisFileModel]] = Field(default_factory=list, description="The error files.")
     error: bool = Field(False, description="If the file has any error during opening.")
     error_message: Optional[str] = Field(None, description="The error exception if any.")
+    profile: Optional[ReadProfile] = Field(None, description="The stages timings of the read, when the reader has a profiler.")
 
     @property
     def logical_files_count(self) -> int:
@@ -0,0 +1,77 @@
+from datetime import datetime
+from typing import Optional, Union
+
+from pydantic import BaseModel, Field
+
+
+class ManifestEntry(BaseModel):
+    """
+    A file indexed by the ArchiveIndexer.
+
+    Attributes:
+        path (str): The path to the file, relative to the root of the archive.
+        size (int): The size of the file in bytes, when it was indexed.
+        mtime_ns (int): The modification time of the file in nanoseconds, when it was indexed.
+        hash (Optional[str]): The sha256 of the file content, only when the indexer uses hashes.
+        status (str): The result of the reading, 'ok' or 'error'.
+        error_message (Optional[str]): The error of the reading, if any.
+        file_id (Optional[Union[int, str]]): The id of the file in the sink, if the indexer has one.
+        elapsed (float): The time spent reading the file, in seconds.
+        indexed_at (datetime): When the file was read.
+    """
+
+    path: str = Field(..., description="The path to the file, relative to the root.")
+    size: int = Field(..., description="The size of the file in bytes.")
+    mtime_ns: int = Field(..., description="The modification time of the file in nanoseconds.")
+    hash: Optional[str] = Field(None, description="The sha256 of the file content.")
+    status: str = Field('ok', description="The result of the reading, 'ok' or 'error'.")
+    error_message: Optional[str] = Field(None, description="The error of the reading, if any.")
+    file_id: Optional[Union[int, str]] = Field(None, description="The id of the file in the sink.")
+    elapsed: float = Field(0.0, description="The time spent reading the file, in seconds.")
+    indexed_at: datetime = Field(default_factory=datetime.now, description="When the file was read.")
+
+    @property
+    def error(self) -> bool:
+        return self.status == 'error'
+
+
+class Manifest(BaseModel):
+    """
+    The files of an archive indexed by the ArchiveIndexer, saved between the runs.
+
+    Attributes:
+        root (str): The root of the archive.
+        version (str): The wellbelog version of the last run.
+        updated_at (datetime): When the manifest was last saved.
+        entries (dict[str, ManifestEntry]): The entries, by their relative path.
+    """
+
+    root: str = Field(..., description="The root of the archive.")
+    version: Optional[str] = Field(None, description="The wellbelog version of the last run.")
+    updated_at: datetime = Field(default_factory=datetime.now, description="When the manifest was last saved.")
+    entries: dict[str, ManifestEntry] = Field(default_factory=dict, description="The entries by relative path.")
+
+
+class IndexReport(BaseModel):
+    """
+    The changes found by a run of the ArchiveIndexer. The paths are relative to the root.
+
+    Attributes:
+        added (list[str]): The new files, read in this run.
+        modified (list[str]): The files changed since the last run, read again.
+        deleted (list[str]): The files removed since the last run, dropped from the manifest.
+        unchanged (int): The number of files not read again.
+        errors (list[str]): The files read with errors in this run.
+        elapsed (float): The time of the run, in seconds.
+    """
+
+    added: list[str] = Field(default_factory=list, description="The new files.")
+    modified: list[str] = Field(default_factory=list, description="The changed files.")
+    deleted: list[str] = Field(default_factory=list, description="The removed files.")
+    unchanged: int = Field(0, description="The number of files not read again.")
+    errors: list[str] = Field(default_factory=list, description="The files read with errors.")
+    elapsed: float = Field(0.0, description="The time of the run, in seconds.")
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.modified or self.deleted)
@@ -0,0 +1,64 @@
+from typing import Optional
+
+import pandas as pd
+from pydantic import BaseModel, Field
+
+
+class StageTiming(BaseModel):
+    """
+    The time of a stage of a reader, for a physical file, a logical file or a frame.
+
+    Attributes:
+        stage (str): The name of the stage, like open, summary, curves, dataframe or json.
+        file_name (str): The name of the file.
+        logical_file (Optional[int]): The position of the logical file, None for the stages of the physical file.
+        frame (Optional[int]): The position of the frame in the logical file, None for the other stages.
+        seconds (float): The wall time of the stage.
+        bytes (Optional[int]): The bytes read or created by the stage, if known.
+        samples (Optional[int]): The samples decoded or converted by the stage, if known.
+        error (bool): If the stage raised an exception.
+    """
+
+    stage: str = Field(..., description="The name of the stage.")
+    file_name: str = Field(..., description="The name of the file.")
+    logical_file: Optional[int] = Field(None, description="The position of the logical file.")
+    frame: Optional[int] = Field(None, description="The position of the frame.")
+    seconds: float = Field(..., description="The wall time of the stage.")
+    bytes: Optional[int] = Field(None, description="The bytes of the stage.")
+    samples: Optional[int] = Field(None, description="The samples of the stage.")
+    error: bool = Field(False, description="If the stage raised an exception.")
+
+
+class ReadProfile(BaseModel):
+    """
+    The stages timings of a read, attached to the file models when the reader has a profiler.
+
+    Attributes:
+        stages (list[StageTiming]): The stages, in the order they ended.
+    """
+
+    stages: list[StageTiming] = Field(default_factory=list, description="The timings of the stages.")
+
+    def totals(self) -> dict[str, float]:
+        """
+        The total seconds of each stage, in the order the stages first ended.
+        """
+        totals: dict[str, float] = {}
+        for timing in self.stages:
+            totals[timing.stage] = totals.get(timing.stage, 0.0) + timing.seconds
+        return totals
+
+    def total(self, stage: Optional[str] = None) -> float:
+        """
+        The total seconds of a stage, or of all the stages.
+        """
+        return sum(timing.seconds for timing in self.stages if stage is None or timing.stage == stage)
+
+    def as_df(self) -> pd.DataFrame:
+        """
+        The stages as a dataframe, one row per stage.
+        """
+        return pd.DataFrame(
+            [timing.model_dump() for timing in self.stages],
+            columns=list(StageTiming.model_fields),
+        )
@@ -0,0 +1,96 @@
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ChannelHeader(BaseModel):
+    """
+    The metadata of a channel, read without decoding the samples.
+
+    Attributes:
+        name (str): The name of the channel.
+        units (Optional[str]): The units of the channel.
+        long_name (Optional[str]): The description of the channel.
+        dimension (Optional[list[int]]): The number of values of each sample.
+    """
+
+    name: str = Field(..., description="The name of the channel.")
+    units: Optional[str] = Field(None, description="The units of the channel.")
+    long_name: Optional[str] = Field(None, description="The description of the channel.")
+    dimension: Optional[list[int]] = Field(None, description="The number of values of each sample.")
+
+
+class FrameHeader(BaseModel):
+    """
+    The metadata of a frame, or of a LIS format spec, or of the LAS curves.
+
+    Attributes:
+        name (Optional[str]): The name of the frame.
+        index_name (Optional[str]): The name of the index channel.
+        index_units (Optional[str]): The units of the index channel.
+        channels (list[ChannelHeader]): The channels of the frame.
+        start (Optional[float]): The first value of the index.
+        stop (Optional[float]): The last value of the index.
+        spacing (Optional[float]): The spacing of the index.
+        direction (Optional[str]): The direction of the index, INCREASING or DECREASING.
+        samples (Optional[int]): The number of samples of the frame.
+    """
+
+    name: Optional[str] = Field(None, description="The name of the frame.")
+    index_name: Optional[str] = Field(None, description="The name of the index channel.")
+    index_units: Optional[str] = Field(None, description="The units of the index channel.")
+    channels: list[ChannelHeader] = Field(default_factory=list, description="The channels of the frame.")
+    start: Optional[float] = Field(None, description="The first value of the index.")
+    stop: Optional[float] = Field(None, description="The last value of the index.")
+    spacing: Optional[float] = Field(None, description="The spacing of the index.")
+    direction: Optional[str] = Field(None, description="The direction of the index.")
+    samples: Optional[int] = Field(None, description="The number of samples of the frame.")
+
+    @property
+    def curves_names(self) -> list[str]:
+        return [channel.name for channel in self.channels]
+
+
+class LogicalFileHeader(BaseModel):
+    """
+    The metadata of a logical file.
+
+    Attributes:
+        logical_id (Any): The id of the logical file.
+        frames (list[FrameHeader]): The frames of the logical file.
+        error (bool): If the logical file has any error during the scan.
+        error_message (Optional[str]): The error exception if any.
+    """
+
+    logical_id: Optional[Any] = Field(None, description="The id of the logical file.")
+    frames: list[FrameHeader] = Field(default_factory=list, description="The frames of the logical file.")
+    error: bool = Field(False, description="If the logical file has any error during the scan.")
+    error_message: Optional[str] = Field(None, description="The error exception if any.")
+
+
+class PhysicalFileHeader(BaseModel):
+    """
+    A lightweight representation of a file, built only from the metadata.
+    It is returned by the scan method of the readers.
+
+    Attributes:
+        file_name (str): The name of the file.
+        file_type (str): The type of the file, dlis, lis or las.
+        logical_files (list[LogicalFileHeader]): The logical files.
+        error (bool): If the file has any error during the scan.
+        error_message (Optional[str]): The error exception if any.
+    """
+
+    file_name: str = Field(..., description="The name of the file.")
+    file_type: str = Field(..., description="The type of the file, dlis, lis or las.")
+    logical_files: list[LogicalFileHeader] = Field(default_factory=list, description="The logical files.")
+    error: bool = Field(False, description="If the file has any error during the scan.")
+    error_message: Optional[str] = Field(None, description="The error exception if any.")
+
+    @property
+    def curves_names(self) -> list[str]:
+        """
+        The names of the curves in the file, without repetitions.
+        """
+        curves = [name for file in self.logical_files for frame in file.frames for name in frame.curves_names]
+        return list(dict.fromkeys(curves))
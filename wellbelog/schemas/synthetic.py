@@ -0,0 +1,42 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class SyntheticLogSpec(BaseModel):
+    """
+    The layout of a synthetic log file, written by the generators of `wellbelog.synthetic`.
+
+    Attributes:
+        well_name (str): The name of the well.
+        logical_files (int): The number of logical files, only for DLIS and LIS.
+        frames (int): The number of frames of each logical file, only for DLIS.
+            The frame k is sampled every k + 1 steps, like the slow frames of the real files.
+        samples (int): The number of samples of the first frame.
+        curves (int): The number of scalar curves, besides the depth.
+        array_curves (int): The number of array curves.
+        array_shape (tuple[int, ...]): The shape of each sample of the array curves.
+            In LIS the samples are flattened, as fast channels. In LAS each element is a curve, like CURVE[0].
+        null_density (float): The fraction of the samples replaced by the null value, from 0 to 1.
+        null_value (float): The null value.
+        top (float): The first depth.
+        step (float): The depth step of the first frame.
+        decreasing (bool): If True, the depth decreases from `top`.
+        depth_units (str): The units of the depth.
+        seed (int): The seed of the random curves, the same spec always writes the same file.
+    """
+
+    well_name: str = Field('SYNTHETIC', description="The name of the well.")
+    logical_files: int = Field(1, ge=1, description="The number of logical files.")
+    frames: int = Field(1, ge=1, description="The number of frames of each logical file.")
+    samples: int = Field(1000, ge=0, description="The number of samples of the first frame.")
+    curves: int = Field(10, ge=0, description="The number of scalar curves.")
+    array_curves: int = Field(0, ge=0, description="The number of array curves.")
+    array_shape: tuple[int, ...] = Field((8,), description="The shape of each sample of the array curves.")
+    null_density: float = Field(0.0, ge=0.0, le=1.0, description="The fraction of null samples.")
+    null_value: float = Field(-999.25, description="The null value.")
+    top: float = Field(1000.0, description="The first depth.")
+    step: float = Field(0.1524, gt=0, description="The depth step of the first frame.")
+    decreasing: bool = Field(False, description="If True, the depth decreases.")
+    depth_units: str = Field('M', description="The units of the depth.")
+    seed: Optional[int] = Field(0, description="The seed of the random curves.")
@@ -0,0 +1,3 @@
+from .dlis import write_dlis
+from .las import write_las
+from .lis import write_lis
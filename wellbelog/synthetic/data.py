@@ -0,0 +1,102 @@
+"""
+The curves of the synthetic files, generated in chunks of rows so files of any size can be written.
+"""
+from typing import Iterator, NamedTuple
+
+import numpy as np
+
+from wellbelog.schemas.synthetic import SyntheticLogSpec
+
+DEPTH_NAME = 'DEPT'
+CURVES_UNITS = ('GAPI', 'OHMM', 'G/C3', 'V/V', 'US/F')
+
+
+class SyntheticChannel(NamedTuple):
+    """
+    A channel of a synthetic frame.
+
+    Attributes:
+        name (str): The name of the channel.
+        units (str): The units of the channel.
+        shape (tuple[int, ...]): The shape of each sample, empty for the scalar channels.
+    """
+    name: str
+    units: str
+    shape: tuple[int, ...] = ()
+
+    @property
+    def size(self) -> int:
+        """
+        The number of values of each sample.
+        """
+        return int(np.prod(self.shape, dtype=int))
+
+
+def frame_channels(spec: SyntheticLogSpec, frame: int = 0) -> list[SyntheticChannel]:
+    """
+    The channels of a frame, the depth is always the first one.
+    The curves of the frames after the first have the frame as prefix, like F1CURVE0.
+    """
+    prefix = f'F{frame}' if frame else ''
+    channels = [SyntheticChannel(DEPTH_NAME, spec.depth_units)]
+    channels += [SyntheticChannel(f'{prefix}CURVE{i}', CURVES_UNITS[i % len(CURVES_UNITS)]) for i in range(spec.curves)]
+    channels += [SyntheticChannel(f'{prefix}ARRAY{i}', 'US', tuple(spec.array_shape)) for i in range(spec.array_curves)]
+    return channels
+
+
+def frame_samples(spec: SyntheticLogSpec, frame: int = 0) -> int:
+    """
+    The number of samples of a frame, the frame k is sampled every k + 1 steps.
+    """
+    return spec.samples // (frame + 1)
+
+
+def frame_step(spec: SyntheticLogSpec, frame: int = 0) -> float:
+    """
+    The depth step of a frame.
+    """
+    return spec.step * (frame + 1)
+
+
+def iter_frame_chunks(
+    spec: SyntheticLogSpec,
+    logical_file: int = 0,
+    frame: int = 0,
+    chunk_size: int = 100_000,
+) -> Iterator[dict[str, np.ndarray]]:
+    """
+    Generate the curves of a frame in chunks of rows.
+    The depth is float64, the curves are float32 random walks, and the array curves float32 noise.
+
+    Args:
+        spec (SyntheticLogSpec): The layout of the file.
+        logical_file (int): The logical file, each one has its own random curves.
+        frame (int): The frame of the logical file.
+        chunk_size (int): The max number of rows of each chunk.
+
+    Yields:
+        dict[str, np.ndarray]: The columns of each chunk, by the channel name.
+    """
+    assert chunk_size > 0, 'The chunk size must be positive.'
+    seed = None if spec.seed is None else [spec.seed, logical_file, frame]
+    rng = np.random.default_rng(seed)
+    channels = frame_channels(spec, frame)[1:]
+    total = frame_samples(spec, frame)
+    step = -frame_step(spec, frame) if spec.decreasing else frame_step(spec, frame)
+    # NOTE The random walks continue from one chunk to the next
+    levels = rng.uniform(10.0, 100.0, len(channels))
+
+    for start in range(0, total, chunk_size):
+        rows = min(chunk_size, total - start)
+        arrays = {DEPTH_NAME: spec.top + step * np.arange(start, start + rows, dtype=np.float64)}
+        for i, channel in enumerate(channels):
+            if channel.shape:
+                values = rng.normal(levels[i], 5.0, (rows, *channel.shape)).astype(np.float32)
+            else:
+                walk = levels[i] + np.cumsum(rng.normal(0.0, 1.0, rows))
+                levels[i] = walk[-1]
+                values = walk.astype(np.float32)
+            if spec.null_density:
+                values[rng.random(values.shape) < spec.null_density] = spec.null_value
+            arrays[channel.name] = values
+        yield arrays
@@ -0,0 +1,304 @@
+"""
+A writer of synthetic DLIS (RP66 V1) files.
+
+The file has a storage unit label, then visible records with the logical record segments.
+Each logical file has a FILE-HEADER, an ORIGIN, a PARAMETER set with the well name and the absent value,
+the CHANNEL and FRAME sets, and one FDATA record per frame row. The rows are encoded with NumPy,
+one visible record each, so large files are written without a Python loop per row.
+"""
+import pathlib
+import struct
+from typing import Any, Iterable, Iterator, NamedTuple, Optional, Union
+
+import numpy as np
+
+from wellbelog.schemas.synthetic import SyntheticLogSpec
+from wellbelog.synthetic.data import SyntheticChannel, frame_channels, frame_samples, frame_step, iter_frame_chunks
+
+# NOTE The representation codes used by the writer
+FSINGL, FDOUBL, USHORT, UVARI, IDENT, ASCII, OBNAME, UNITS = 2, 7, 15, 18, 19, 20, 23, 27
+
+# NOTE The logical record types
+FHLR, OLR, CHANNL, FRAME, STATIC, FDATA = 0, 1, 3, 4, 5, 0
+
+MAX_VISIBLE_RECORD = 8192
+MAX_SEGMENT_BODY = 8000
+ORIGIN = 1
+
+# NOTE The component descriptors: a set with a type, a template attribute with a label and a
+# representation code, an object with a name, an attribute with a count and a value, an absent attribute
+SET, TEMPLATE, OBJECT, ATTRIBUTE, TYPED_ATTRIBUTE, ABSENT = 0xF0, 0x34, 0x70, 0x29, 0x2D, 0x00
+
+
+class Typed(NamedTuple):
+    """
+    An attribute value with its own representation code, instead of the one of the template.
+    """
+    reprc: int
+    values: list
+
+
+def uvari(value: int) -> bytes:
+    """
+    Encode an unsigned integer of variable length, of 1, 2 or 4 bytes.
+    """
+    if value < 0x80:
+        return struct.pack('>B', value)
+    if value < 0x4000:
+        return struct.pack('>H', value | 0x8000)
+    return struct.pack('>I', value | 0xC0000000)
+
+
+def ident(value: str) -> bytes:
+    data = value.encode('ascii')
+    return struct.pack('>B', len(data)) + data
+
+
+def ascii_(value: str) -> bytes:
+    data = value.encode('ascii')
+    return uvari(len(data)) + data
+
+
+def obname(name: str, copy: int = 0, origin: int = ORIGIN) -> bytes:
+    return uvari(origin) + struct.pack('>B', copy) + ident(name)
+
+
+ENCODERS = {
+    FSINGL: lambda value: struct.pack('>f', value),
+    FDOUBL: lambda value: struct.pack('>d', value),
+    USHORT: lambda value: struct.pack('>B', value),
+    UVARI: uvari,
+    IDENT: ident,
+    ASCII: ascii_,
+    OBNAME: lambda value: obname(*value) if isinstance(value, tuple) else obname(value),
+    UNITS: ident,
+}
+
+
+def eflr_body(set_type: str, template: list[tuple[str, int]], objects: Iterable[tuple[bytes, list[Any]]]) -> bytes:
+    """
+    Encode a set of objects.
+
+    Args:
+        set_type (str): The type of the set, like CHANNEL.
+        template (list[tuple[str, int]]): The label and the representation code of each attribute.
+        objects: The encoded name of each object, and its attributes values in the template order.
+            A value is a scalar, a list, a Typed value or None for an absent attribute.
+    """
+    body = bytearray(struct.pack('>B', SET) + ident(set_type))
+    for label, reprc in template:
+        body += struct.pack('>B', TEMPLATE) + ident(label) + struct.pack('>B', reprc)
+    for name, values in objects:
+        body += struct.pack('>B', OBJECT) + name
+        for (_, reprc), value in zip(template, values):
+            if value is None:
+                body += struct.pack('>B', ABSENT)
+                continue
+            if isinstance(value, Typed):
+                items = value.values
+                body += struct.pack('>B', TYPED_ATTRIBUTE) + uvari(len(items)) + struct.pack('>B', value.reprc)
+                reprc = value.reprc
+            else:
+                items = value if isinstance(value, list) else [value]
+                body += struct.pack('>B', ATTRIBUTE) + uvari(len(items))
+            body += b''.join(ENCODERS[reprc](item) for item in items)
+    return bytes(body)
+
+
+def segments(body: bytes, record_type: int, explicit: bool) -> Iterator[bytes]:
+    """
+    Split a logical record in segments, padded to an even length of at least 16 bytes.
+    """
+    parts = [body[i:i + MAX_SEGMENT_BODY] for i in range(0, len(body), MAX_SEGMENT_BODY)] or [b'']
+    for i, part in enumerate(parts):
+        attributes = (0x80 if explicit else 0) | (0x40 if i > 0 else 0) | (0x20 if i < len(parts) - 1 else 0)
+        length = 4 + len(part)
+        padding = max(16 - length, length % 2)
+        if padding:
+            # NOTE The last pad byte is the number of pad bytes
+            attributes |= 0x01
+            part += bytes(padding - 1) + struct.pack('>B', padding)
+        yield struct.pack('>HBB', length + padding, attributes, record_type) + part
+
+
+def visible_records(records: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Pack the segments in visible records.
+    """
+    buffer = bytearray()
+    for segment in records:
+        if buffer and 4 + len(buffer) + len(segment) > MAX_VISIBLE_RECORD:
+            yield struct.pack('>HBB', 4 + len(buffer), 0xFF, 1) + buffer
+            buffer = bytearray()
+        buffer += segment
+    if buffer:
+        yield struct.pack('>HBB', 4 + len(buffer), 0xFF, 1) + buffer
+
+
+def storage_unit_label(set_identifier: str) -> bytes:
+    return f'{1:>4}V1.00RECORD{MAX_VISIBLE_RECORD:>5}{set_identifier[:60]:<60}'.encode('ascii')
+
+
+def frame_name(frame: int) -> str:
+    return f'FRAME{frame}'
+
+
+def logical_file_records(spec: SyntheticLogSpec, logical_file: int) -> list[bytes]:
+    """
+    The segments of the explicit records of a logical file.
+    """
+    fileheader = eflr_body(
+        'FILE-HEADER', [('SEQUENCE-NUMBER', ASCII), ('ID', ASCII)],
+        [(obname('0'), [str(logical_file + 1), f'{spec.well_name}.{logical_file + 1:03d}'])],
+    )
+    origin = eflr_body(
+        'ORIGIN',
+        [('FILE-ID', ASCII), ('FILE-SET-NAME', IDENT), ('FILE-SET-NUMBER', UVARI), ('FILE-NUMBER', UVARI),
+         ('PRODUCT', ASCII), ('WELL-NAME', ASCII), ('COMPANY', ASCII)],
+        [(obname('DEFINING_ORIGIN'), [
+            f'{spec.well_name}.{logical_file + 1:03d}', spec.well_name, 1, logical_file + 1,
+            'wellbelog', spec.well_name, 'SYNTHETIC',
+        ])],
+    )
+    parameters = eflr_body(
+        'PARAMETER', [('LONG-NAME', ASCII), ('VALUES', ASCII)],
+        [
+            (obname('WN'), ['Well name', spec.well_name]),
+            (obname('ABSV'), ['Absent value', Typed(FDOUBL, [spec.null_value])]),
+        ],
+    )
+
+    channels_objects, frames_objects = [], []
+    for frame in range(spec.frames):
+        channels = frame_channels(spec, frame)
+        for channel in channels:
+            # NOTE The dimensions are written in the reverse order, dlisio reverses them back
+            dimension = list(reversed(channel.shape)) or [1]
+            channels_objects.append((obname(channel.name, copy=frame), [
+                channel.name, FDOUBL if channel.name == channels[0].name else FSINGL, channel.units, dimension, dimension,
+            ]))
+        samples, step = frame_samples(spec, frame), frame_step(spec, frame)
+        sign = -1 if spec.decreasing else 1
+        frames_objects.append((obname(frame_name(frame)), [
+            f'Synthetic frame {frame}',
+            [(channel.name, frame) for channel in channels],
+            'BOREHOLE-DEPTH',
+            'DECREASING' if spec.decreasing else 'INCREASING',
+            sign * step,
+            min(spec.top, spec.top + sign * step * max(samples - 1, 0)),
+            max(spec.top, spec.top + sign * step * max(samples - 1, 0)),
+        ]))
+    channels_body = eflr_body(
+        'CHANNEL',
+        [('LONG-NAME', ASCII), ('REPRESENTATION-CODE', USHORT), ('UNITS', UNITS), ('DIMENSION', UVARI), ('ELEMENT-LIMIT', UVARI)],
+        channels_objects,
+    )
+    frames_body = eflr_body(
+        'FRAME',
+        [('DESCRIPTION', ASCII), ('CHANNELS', OBNAME), ('INDEX-TYPE', IDENT), ('DIRECTION', IDENT),
+         ('SPACING', FDOUBL), ('INDEX-MIN', FDOUBL), ('INDEX-MAX', FDOUBL)],
+        frames_objects,
+    )
+    records = []
+    for body, record_type in ((fileheader, FHLR), (origin, OLR), (parameters, STATIC), (channels_body, CHANNL), (frames_body, FRAME)):
+        records.extend(segments(body, record_type, explicit=True))
+    return records
+
+
+def _uvari_dtype(start: int) -> tuple[str, int]:
+    if start < 0x80:
+        return 'u1', 0
+    if start < 0x4000:
+        return '>u2', 0x8000
+    return '>u4', 0xC0000000
+
+
+def encode_rows(name: bytes, channels: list[SyntheticChannel], chunk: dict[str, np.ndarray], first: int) -> bytes:
+    """
+    Encode a chunk of rows of a frame, each row as its own visible record with one FDATA segment.
+    The rows bigger than a visible record are split in segments over several visible records.
+
+    Args:
+        name (bytes): The encoded name of the frame.
+        channels (list[SyntheticChannel]): The channels of the frame.
+        chunk (dict[str, np.ndarray]): The columns of the chunk.
+        first (int): The frame number of the first row, starting at 1.
+    """
+    rows = len(chunk[channels[0].name])
+    numbers = np.arange(first, first + rows)
+    output = bytearray()
+    # NOTE The frame numbers are UVARI, the rows are grouped by the size of their number
+    for low, high in ((0, 0x80), (0x80, 0x4000), (0x4000, 0x40000000)):
+        selected = (numbers >= low) & (numbers < high)
+        if not selected.any():
+            continue
+        number_dtype, flag = _uvari_dtype(low)
+        values_dtype = [
+            (f'c{i}', '>f8' if i == 0 else '>f4', channel.shape) for i, channel in enumerate(channels)
+        ]
+        body_dtype = np.dtype([('name', 'u1', (len(name),)), ('number', number_dtype), *values_dtype])
+        padding = max(16 - 4 - body_dtype.itemsize, (4 + body_dtype.itemsize) % 2)
+        segment = 4 + body_dtype.itemsize + padding
+        if 4 + segment > MAX_VISIBLE_RECORD:
+            # NOTE The rows that do not fit a visible record are split in segments, one row at a time
+            bodies = np.zeros(int(selected.sum()), dtype=body_dtype)
+            bodies['name'] = np.frombuffer(name, dtype='u1')
+            bodies['number'] = numbers[selected] | flag
+            for i, channel in enumerate(channels):
+                bodies[f'c{i}'] = chunk[channel.name][selected]
+            for row in bodies:
+                output += b''.join(visible_records(segments(row.tobytes(), FDATA, explicit=False)))
+            continue
+        dtype = np.dtype([
+            ('record_length', '>u2'), ('record_marker', 'u1'), ('record_version', 'u1'),
+            ('segment_length', '>u2'), ('segment_attributes', 'u1'), ('segment_type', 'u1'),
+            ('name', 'u1', (len(name),)), ('number', number_dtype), *values_dtype,
+            *([('padding', 'u1', (padding,))] if padding else []),
+        ])
+        records = np.zeros(int(selected.sum()), dtype=dtype)
+        records['record_length'] = 4 + segment
+        records['record_marker'] = 0xFF
+        records['record_version'] = 1
+        records['segment_length'] = segment
+        records['segment_attributes'] = 0x01 if padding else 0
+        records['segment_type'] = FDATA
+        records['name'] = np.frombuffer(name, dtype='u1')
+        records['number'] = numbers[selected] | flag
+        for i, channel in enumerate(channels):
+            records[f'c{i}'] = chunk[channel.name][selected]
+        if padding:
+            records['padding'][:, -1] = padding
+        output += records.tobytes()
+    return bytes(output)
+
+
+def write_dlis(
+    path: Union[str, pathlib.Path],
+    spec: Optional[SyntheticLogSpec] = None,
+    chunk_size: int = 100_000,
+    **kwargs,
+) -> str:
+    """
+    Write a synthetic DLIS file.
+
+    Args:
+        path (str): The path to the file.
+        spec (SyntheticLogSpec, optional): The layout of the file.
+        chunk_size (int): The number of rows generated and written at once.
+        **kwargs: The fields of the spec, when it is not given.
+
+    Returns:
+        str: The path to the file.
+    """
+    spec = spec or SyntheticLogSpec(**kwargs)
+    with open(path, 'wb') as f:
+        f.write(storage_unit_label(spec.well_name))
+        for logical_file in range(spec.logical_files):
+            for record in visible_records(logical_file_records(spec, logical_file)):
+                f.write(record)
+            for frame in range(spec.frames):
+                name, channels, first = obname(frame_name(frame)), frame_channels(spec, frame), 1
+                for chunk in iter_frame_chunks(spec, logical_file, frame, chunk_size):
+                    f.write(encode_rows(name, channels, chunk, first))
+                    first += len(chunk[channels[0].name])
+    return str(path)
@@ -0,0 +1,53 @@
+"""
+A writer of synthetic LAS 2.0 files.
+The header is written by lasio, and the data section is appended in chunks, so the file is never in memory.
+"""
+import pathlib
+from typing import Optional, Union
+
+import lasio
+import numpy as np
+
+from wellbelog.schemas.synthetic import SyntheticLogSpec
+from wellbelog.synthetic.data import frame_channels, frame_samples, frame_step, iter_frame_chunks
+from wellbelog.utils.arrays import arrays_to_df
+
+
+def write_las(
+    path: Union[str, pathlib.Path],
+    spec: Optional[SyntheticLogSpec] = None,
+    chunk_size: int = 100_000,
+    **kwargs,
+) -> str:
+    """
+    Write a synthetic LAS file. Only the first logical file and frame of the spec are written,
+    and the array curves are split in one curve per element, like CURVE[0].
+
+    Args:
+        path (str): The path to the file.
+        spec (SyntheticLogSpec, optional): The layout of the file.
+        chunk_size (int): The number of rows generated and written at once.
+        **kwargs: The fields of the spec, when it is not given.
+
+    Returns:
+        str: The path to the file.
+    """
+    spec = spec or SyntheticLogSpec(**kwargs)
+    channels = frame_channels(spec)
+    samples = frame_samples(spec)
+    step = -frame_step(spec) if spec.decreasing else frame_step(spec)
+
+    las = lasio.LASFile()
+    las.well['WELL'].value = spec.well_name
+    las.well['NULL'].value = spec.null_value
+    for channel in channels:
+        names = [channel.name] if not channel.shape else [f'{channel.name}[{i}]' for i in range(channel.size)]
+        for name in names:
+            las.append_curve(name, np.empty(0), unit=channel.units)
+
+    with open(path, 'w') as f:
+        las.write(f, version=2.0, STRT=spec.top, STOP=spec.top + step * max(samples - 1, 0), STEP=step)
+        for chunk in iter_frame_chunks(spec, chunk_size=chunk_size):
+            # NOTE The same split of the array curves as the header
+            np.savetxt(f, arrays_to_df(chunk).to_numpy(), fmt='%.4f')
+    return str(path)
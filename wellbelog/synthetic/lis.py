@@ -0,0 +1,174 @@
+"""
+A writer of synthetic LIS (LIS79) files.
+
+The file has a reel and a tape header, then for each logical file a file header, a data format spec,
+the data records and a file trailer, and at the end a tape and a reel trailer. Each logical record
+is written in its own physical record. The curves are encoded as LIS 32-bit floats (code 68),
+and the array curves are written as fast channels, with one sample per element.
+"""
+import pathlib
+import struct
+from typing import Optional, Union
+
+import numpy as np
+
+from wellbelog.schemas.synthetic import SyntheticLogSpec
+from wellbelog.synthetic.data import SyntheticChannel, frame_channels, iter_frame_chunks
+
+# NOTE The logical record types
+NORMAL_DATA, DATA_FORMAT_SPEC = 0, 64
+FILE_HEADER, FILE_TRAILER, TAPE_HEADER, TAPE_TRAILER, REEL_HEADER, REEL_TRAILER = 128, 129, 130, 131, 132, 133
+
+# NOTE The representation codes used by the writer
+F32, I16, ASCII, BYTE = 68, 79, 65, 66
+
+MAX_PHYSICAL_RECORD = 8192
+SERVICE_ID = 'WELBLG'
+# NOTE A fixed date in the headers, so the same spec always writes the same bytes
+HEADER_DATE = '70/01/01'
+
+
+def lis_f32(values: np.ndarray) -> np.ndarray:
+    """
+    Encode floats as LIS 32-bit floats (code 68): a sign bit, an 8 bits exponent in excess 128,
+    and a 23 bits fraction. The negative numbers have the exponent and the fraction complemented.
+
+    Args:
+        values (np.ndarray): The values, any shape.
+
+    Returns:
+        np.ndarray: The encoded values, as big endian uint32.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    fraction, exponent = np.frexp(np.abs(values))
+    fraction = np.rint(fraction * 2 ** 23).astype(np.int64)
+    # NOTE The rounding can carry to the next power of 2
+    carry = fraction >= 2 ** 23
+    fraction[carry] >>= 1
+    exponent = exponent.astype(np.int64) + carry + 128
+    negative = values < 0
+    exponent = np.where(negative, ~exponent & 0xFF, exponent & 0xFF)
+    fraction = np.where(negative, (2 ** 23 - fraction) & 0x7FFFFF, fraction)
+    words = (negative.astype(np.int64) << 31) | (exponent << 23) | fraction
+    words[values == 0] = 0
+    return words.astype('>u4')
+
+
+def physical_record(record_type: int, body: bytes) -> bytes:
+    """
+    Wrap a logical record in a physical record, without trailer.
+    """
+    return struct.pack('>HHBB', 6 + len(body), 0, record_type, 0) + body
+
+
+def reel_or_tape_record(record_type: int, spec: SyntheticLogSpec, name: str) -> bytes:
+    body = (
+        f'{SERVICE_ID:<6}{"":6}{HEADER_DATE:<8}{"":2}{"WBLG":<4}{"":2}{name[:8]:<8}{"":2}{"01":<2}{"":2}{"":8}{"":2}'
+        f'{("SYNTHETIC " + spec.well_name)[:74]:<74}'
+    )
+    return physical_record(record_type, body.encode('ascii'))
+
+
+def file_record(record_type: int, logical_file: int) -> bytes:
+    name = f'{SERVICE_ID}.{logical_file + 1:03d}'
+    body = f'{name:<10}{"":2}{"":6}{"1.0":<8}{HEADER_DATE:<8}{"":1}{MAX_PHYSICAL_RECORD:>5}{"":2}{"LO":<2}{"":2}{"":10}'
+    return physical_record(record_type, body.encode('ascii'))
+
+
+def entry(entry_type: int, reprc: int, value: bytes) -> bytes:
+    return struct.pack('>BBB', entry_type, len(value), reprc) + value
+
+
+def data_format_spec(spec: SyntheticLogSpec, channels: list[SyntheticChannel], frames_per_record: int) -> bytes:
+    """
+    The data format spec record, with the entry blocks and one spec block (subtype 1) per channel.
+    The depth is the first channel, the depth recording mode is 0.
+    """
+    frame_size = 4 * sum(channel.size for channel in channels)
+    body = b''.join([
+        entry(1, BYTE, b'\x00'),
+        entry(3, I16, struct.pack('>h', frame_size)),
+        # NOTE 1 is up, the depth decreases, 255 is down
+        entry(4, BYTE, struct.pack('>B', 1 if spec.decreasing else 255)),
+        entry(11, BYTE, struct.pack('>B', frames_per_record)),
+        entry(12, F32, lis_f32(np.array([spec.null_value])).tobytes()),
+        entry(13, BYTE, b'\x00'),
+        entry(16, BYTE, b'\x01'),
+        entry(0, BYTE, b'\x00'),
+    ])
+    for channel in channels:
+        body += struct.pack(
+            '>4s6s8s4sIhh3xBB5x',
+            channel.name[:4].ljust(4).encode('ascii'),
+            SERVICE_ID.encode('ascii'),
+            b' ' * 8,
+            channel.units[:4].ljust(4).encode('ascii'),
+            0, 1, 4 * channel.size, channel.size, F32,
+        )
+    return physical_record(DATA_FORMAT_SPEC, body)
+
+
+def lis_channels(spec: SyntheticLogSpec) -> list[SyntheticChannel]:
+    """
+    The channels of the LIS files, the mnemonics have only 4 characters.
+    The curves are named C0, C1 and the array curves A0, A1.
+    """
+    channels = frame_channels(spec)
+    renamed = [channels[0]]
+    for channel in channels[1:]:
+        kind, number = ('A', channel.name[5:]) if channel.shape else ('C', channel.name[5:])
+        renamed.append(channel._replace(name=f'{kind}{number}'[:4]))
+    return renamed
+
+
+def write_lis(
+    path: Union[str, pathlib.Path],
+    spec: Optional[SyntheticLogSpec] = None,
+    chunk_size: int = 100_000,
+    **kwargs,
+) -> str:
+    """
+    Write a synthetic LIS file. Only the first frame of each logical file is written.
+    The mnemonics have 4 characters, so the curves are named C0, C1 and the array curves A0, A1,
+    the array curves have one sample per element.
+
+    Args:
+        path (str): The path to the file.
+        spec (SyntheticLogSpec, optional): The layout of the file.
+        chunk_size (int): The number of rows generated and written at once.
+        **kwargs: The fields of the spec, when it is not given.
+
+    Returns:
+        str: The path to the file.
+
+    Raises:
+        ValueError: If a frame does not fit in a physical record.
+    """
+    spec = spec or SyntheticLogSpec(**kwargs)
+    channels = lis_channels(spec)
+    frame_size = 4 * sum(channel.size for channel in channels)
+    # NOTE The max frames per record is a byte in the data format spec
+    frames_per_record = min((MAX_PHYSICAL_RECORD - 6) // frame_size, 255)
+    if not frames_per_record:
+        if frame_size > 0xFFFF - 6:
+            raise ValueError(f'The frames have {frame_size} bytes, more than a physical record can hold.')
+        frames_per_record = 1
+
+    with open(path, 'wb') as f:
+        f.write(reel_or_tape_record(REEL_HEADER, spec, 'REEL'))
+        f.write(reel_or_tape_record(TAPE_HEADER, spec, 'TAPE'))
+        for logical_file in range(spec.logical_files):
+            f.write(file_record(FILE_HEADER, logical_file))
+            f.write(data_format_spec(spec, channels, frames_per_record))
+            for chunk in iter_frame_chunks(spec, logical_file, chunk_size=chunk_size):
+                rows = len(chunk['DEPT'])
+                frames = np.concatenate([
+                    lis_f32(values.reshape(rows, -1)) for values in chunk.values()
+                ], axis=1).astype('>u4').tobytes()
+                record_size = frames_per_record * frame_size
+                for start in range(0, len(frames), record_size):
+                    f.write(physical_record(NORMAL_DATA, frames[start:start + record_size]))
+            f.write(file_record(FILE_TRAILER, logical_file))
+        f.write(reel_or_tape_record(TAPE_TRAILER, spec, 'TAPE'))
+        f.write(reel_or_tape_record(REEL_TRAILER, spec, 'REEL'))
+    return str(path)
@@ -0,0 +1,174 @@
+"""
+Utility functions to work with the curves as NumPy arrays.
+"""
+import itertools
+from typing import Iterable, Iterator, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from wellbelog.utils.mnemonicfix import MnemonicFix
+
+
+def structured_to_arrays(values: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Split a NumPy structured array, like the ones returned by dlisio, in one array per field.
+    The arrays are views over the original array, and the names have the mnemonics fixed.
+
+    Args:
+        values (np.ndarray): The structured array.
+
+    Returns:
+        dict[str, np.ndarray]: The columns.
+    """
+    return {MnemonicFix.replace_index(name).strip(): values[name] for name in values.dtype.names}
+
+
+def arrays_to_df(arrays: dict[str, np.ndarray]) -> pd.DataFrame:
+    """
+    Create a dataframe that is a view over the arrays.
+    Multi-dimensional arrays are split in one column per dimension, like CURVE[0], CURVE[1].
+
+    Args:
+        arrays (dict[str, np.ndarray]): The columns.
+
+    Returns:
+        pd.DataFrame: The dataframe.
+    """
+    columns = {}
+    for name, values in arrays.items():
+        if values.ndim == 1:
+            columns[name] = values
+            continue
+        flat = values.reshape(len(values), -1)
+        for i in range(flat.shape[1]):
+            columns[f'{name}[{i}]'] = flat[:, i]
+    return pd.DataFrame(columns, copy=False)
+
+
+def iter_depth_windows(chunks: Iterable[np.ndarray], index_name: str, step: float) -> Iterator[np.ndarray]:
+    """
+    Regroup chunks of rows in windows of fixed depth.
+    The windows start at the first depth, and follow the direction of the index,
+    so it works for both increasing and decreasing depths.
+
+    Args:
+        chunks (Iterable[np.ndarray]): Structured arrays, in the order of the index.
+        index_name (str): The name of the index field.
+        step (float): The size of each window, in the units of the index.
+
+    Yields:
+        np.ndarray: A structured array for each window.
+    """
+    assert step > 0, 'The step must be positive.'
+    origin = None
+    pending = []
+    current = 0
+    for chunk in chunks:
+        if not len(chunk):
+            continue
+        depth = chunk[index_name]
+        if origin is None:
+            origin = depth[0]
+        windows = (np.abs(depth - origin) // step).astype(np.int64)
+        # NOTE The chunk is split wherever the window changes
+        breaks = np.flatnonzero(np.diff(windows)) + 1
+        for part in np.split(np.arange(len(chunk)), breaks):
+            window = windows[part[0]]
+            if window != current and pending:
+                yield np.concatenate(pending)
+                pending = []
+            current = window
+            pending.append(chunk[part[0]:part[-1] + 1])
+    if pending:
+        yield np.concatenate(pending)
+
+
+def format_chunks(
+    chunks: Iterable[np.ndarray],
+    index_name: Optional[str] = None,
+    depth_step: Optional[float] = None,
+    as_dataframe: bool = False,
+) -> Iterator[Union[np.ndarray, pd.DataFrame]]:
+    """
+    Prepare the chunks of a curves iterator.
+    Optionally regroups the chunks in depth windows, and converts them to dataframes.
+
+    Args:
+        chunks (Iterable[np.ndarray]): Structured arrays, in the order of the index.
+        index_name (str): The name of the index field, used by the depth windows. Defaults to the first field.
+        depth_step (float): If given, the size of the depth windows.
+        as_dataframe (bool): If True, yields dataframes instead of structured arrays.
+
+    Yields:
+        Union[np.ndarray, pd.DataFrame]: The chunks.
+    """
+    if depth_step:
+        chunks = iter(chunks)
+        first = next(chunks, None)
+        if first is None:
+            return
+        index_name = index_name or first.dtype.names[0]
+        chunks = iter_depth_windows(itertools.chain([first], chunks), index_name, depth_step)
+    for chunk in chunks:
+        yield arrays_to_df(structured_to_arrays(chunk)) if as_dataframe else chunk
+
+
+class DepthIndex:
+    """
+    A sorted index over a depth column, to find the rows of a depth interval with binary searches.
+    Monotonic depths, increasing or decreasing, are searched in place, without any copy.
+    Other depths, like repeated sections, are searched through a sort order built once.
+
+    Attributes:
+        size (int): The number of rows.
+        direction (str): INCREASING, DECREASING or None when the depth is not monotonic.
+    """
+
+    def __init__(self, depth: np.ndarray) -> None:
+        depth = np.asarray(depth)
+        assert depth.ndim == 1, 'The depth must be one dimensional.'
+        self.size = len(depth)
+        self.order: Optional[np.ndarray] = None
+        steps = np.diff(depth)
+        if np.all(steps >= 0):
+            self.direction = 'INCREASING'
+            self.sorted = depth
+        elif np.all(steps <= 0):
+            self.direction = 'DECREASING'
+            # NOTE A reversed view, the rows positions are mirrored back in `rows`
+            self.sorted = depth[::-1]
+        else:
+            self.direction = None
+            self.order = np.argsort(depth, kind='stable')
+            self.sorted = depth[self.order]
+
+    @property
+    def top(self) -> Optional[float]:
+        return self.sorted[0] if self.size else None
+
+    @property
+    def bottom(self) -> Optional[float]:
+        return self.sorted[-1] if self.size else None
+
+    def rows(self, top: float, bottom: float) -> Union[slice, np.ndarray]:
+        """
+        Find the rows with the depth between top and bottom, both included.
+        The rows keep the original order of the data.
+
+        Args:
+            top (float): The top of the interval.
+            bottom (float): The bottom of the interval, it can be given before the top.
+
+        Returns:
+            Union[slice, np.ndarray]: A slice for monotonic depths, or the positions of the rows.
+        """
+        if top > bottom:
+            top, bottom = bottom, top
+        start = int(np.searchsorted(self.sorted, top, side='left'))
+        stop = int(np.searchsorted(self.sorted, bottom, side='right'))
+        if self.direction == 'INCREASING':
+            return slice(start, stop)
+        if self.direction == 'DECREASING':
+            return slice(self.size - stop, self.size - start)
+        return np.sort(self.order[start:stop])
@@ -0,0 +1,176 @@
+"""
+Utility functions to convert the curves to Apache Arrow tables, and to read and write Parquet files.
+The pyarrow package is optional, it is only imported when these functions are used.
+
+The channels metadata, like the units and the long names, is kept in the metadata of each field.
+The model fields, like the file name, are kept as JSON in the metadata of the schema.
+Multi-dimensional channels are stored as fixed size lists, and restored with their original shape.
+"""
+import json
+from typing import Any, Optional
+
+import numpy as np
+
+SCHEMA_METADATA_KEY = b'wellbelog'
+"""The key of the model fields in the schema metadata."""
+SHAPE_METADATA_KEY = b'shape'
+"""The key of the shape of the multi-dimensional channels in the field metadata."""
+
+
+def import_pyarrow():
+    """
+    Import pyarrow and its parquet module.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa
+    except ImportError as e:
+        raise ImportError('The Arrow and Parquet export needs pyarrow, install it with `pip install pyarrow`.') from e
+    return pyarrow
+
+
+def array_to_arrow(values: Any):
+    """
+    Convert a column to an Arrow array, without copying the buffers of the numeric columns.
+    Multi-dimensional arrays are converted to nested fixed size lists.
+
+    Args:
+        values (Any): The column, a NumPy array or a list.
+
+    Returns:
+        pa.Array: The Arrow array.
+    """
+    pa = import_pyarrow()
+    values = np.asarray(values)
+    if values.ndim <= 1:
+        return pa.array(values)
+    # NOTE The flat buffer is wrapped once per dimension, like [[..], [..]] per row
+    array = pa.array(np.ascontiguousarray(values).reshape(-1))
+    for size in reversed(values.shape[1:]):
+        array = pa.FixedSizeListArray.from_arrays(array, size)
+    return array
+
+
+def arrays_to_table(
+    arrays: dict[str, Any],
+    channels: Optional[dict[str, dict[str, Any]]] = None,
+    metadata: Optional[dict[str, Any]] = None,
+):
+    """
+    Create an Arrow table from the columns.
+
+    Args:
+        arrays (dict[str, Any]): The columns.
+        channels (dict[str, dict], optional): The metadata of each channel, like {'GR': {'units': 'gAPI'}}.
+        metadata (dict, optional): The model fields, saved as JSON in the schema metadata.
+
+    Returns:
+        pa.Table: The table.
+    """
+    pa = import_pyarrow()
+    channels = channels or {}
+    columns, fields = [], []
+    for name, values in arrays.items():
+        column = array_to_arrow(values)
+        field_metadata = {
+            key.encode(): str(value).encode()
+            for key, value in channels.get(name, {}).items()
+            if value is not None
+        }
+        shape = np.shape(values)
+        if len(shape) > 1:
+            field_metadata[SHAPE_METADATA_KEY] = json.dumps(shape[1:]).encode()
+        columns.append(column)
+        fields.append(pa.field(name, column.type, metadata=field_metadata or None))
+    schema_metadata = {SCHEMA_METADATA_KEY: json.dumps(metadata or {}, default=str).encode()}
+    return pa.Table.from_arrays(columns, schema=pa.schema(fields, metadata=schema_metadata))
+
+
+def table_to_arrays(table) -> dict[str, np.ndarray]:
+    """
+    Convert an Arrow table to a dict of NumPy arrays.
+    The multi-dimensional channels are restored with their original shape.
+
+    Args:
+        table (pa.Table): The table.
+
+    Returns:
+        dict[str, np.ndarray]: The columns.
+    """
+    pa = import_pyarrow()
+    arrays = {}
+    for field, column in zip(table.schema, table.columns):
+        field_metadata = field.metadata or {}
+        if SHAPE_METADATA_KEY in field_metadata:
+            shape = tuple(json.loads(field_metadata[SHAPE_METADATA_KEY]))
+            flat = column.combine_chunks() if isinstance(column, pa.ChunkedArray) else column
+            for _ in shape:
+                flat = flat.flatten()
+            arrays[field.name] = flat.to_numpy(zero_copy_only=False).reshape((len(table), *shape))
+        else:
+            arrays[field.name] = column.to_numpy()
+    return arrays
+
+
+def table_metadata(table) -> dict[str, Any]:
+    """
+    Get the model fields saved in the schema metadata of a table.
+    """
+    metadata = table.schema.metadata or {}
+    if SCHEMA_METADATA_KEY not in metadata:
+        return {}
+    return json.loads(metadata[SCHEMA_METADATA_KEY])
+
+
+def table_channels(table) -> dict[str, dict[str, str]]:
+    """
+    Get the metadata of each channel of a table, like the units.
+
+    Returns:
+        dict[str, dict[str, str]]: The metadata by channel name.
+    """
+    channels = {}
+    for field in table.schema:
+        field_metadata = field.metadata or {}
+        channels[field.name] = {
+            key.decode(): value.decode()
+            for key, value in field_metadata.items()
+            if key != SHAPE_METADATA_KEY
+        }
+    return channels
+
+
+def write_parquet(table, path: str, compression: Optional[str] = 'zstd', **kwargs) -> str:
+    """
+    Write an Arrow table to a Parquet file.
+
+    Args:
+        table (pa.Table): The table.
+        path (str): The path to the file.
+        compression (str, optional): The compression codec, like 'zstd', 'snappy' or None.
+        **kwargs: Additional keyword arguments to pass to pyarrow.parquet.write_table.
+
+    Returns:
+        str: the path to the file.
+    """
+    pa = import_pyarrow()
+    pa.parquet.write_table(table, str(path), compression=compression, **kwargs)
+    return path
+
+
+def read_parquet(path: str, columns: Optional[list[str]] = None):
+    """
+    Read a Parquet file to an Arrow table.
+
+    Args:
+        path (str): The path to the file.
+        columns (list[str], optional): Read only these columns.
+
+    Returns:
+        pa.Table: The table.
+    """
+    pa = import_pyarrow()
+    return pa.parquet.read_table(str(path), columns=columns)
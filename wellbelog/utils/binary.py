@@ -0,0 +1,143 @@
+"""
+A compact binary serialization of the read files models.
+
+The layout of a serialized model is:
+    - The magic bytes and the format version.
+    - The length of the header, as a little endian uint64.
+    - The header, a JSON with the model without its data, and the dtype, shape and offset of each column.
+    - The columns, as raw typed buffers, aligned to 64 bytes.
+
+The loaded columns are read only NumPy views over the serialized bytes (or the memory mapped file),
+so no copy is made and no records are created.
+"""
+import json
+import pathlib
+import struct
+from typing import Union
+
+import numpy as np
+
+from wellbelog import __version__
+from wellbelog.utils.store import StoredModel, dump_model, load_model, model_dataframes, model_type, storable_array
+
+MAGIC = b'WBLG'
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+
+_PREAMBLE = struct.Struct('<4sHQ')
+
+
+def _padding(offset: int) -> int:
+    return -offset % ALIGNMENT
+
+
+def dumps(model: StoredModel) -> bytes:
+    """
+    Serialize a model to bytes.
+
+    Args:
+        model (StoredModel): A PhysicalFileModel, PhysicalLisFileModel or LasFileModel.
+
+    Returns:
+        bytes: The serialized model.
+    """
+    buffers = []
+    frames = []
+    offset = 0
+    for dataframe in model_dataframes(model):
+        columns = []
+        for name, values in dataframe.as_arrays().items():
+            values = np.ascontiguousarray(storable_array(values))
+            offset += _padding(offset)
+            columns.append({'name': name, 'dtype': values.dtype.str, 'shape': values.shape, 'offset': offset})
+            buffers.append((offset, values))
+            offset += values.nbytes
+        frames.append({'columns': columns})
+
+    header = json.dumps({
+        'version': __version__,
+        'type': model_type(model),
+        'model': dump_model(model),
+        'frames': frames,
+    }, separators=(',', ':'), default=str).encode('utf-8')
+
+    # NOTE The columns offsets are relative to the start of the data section, that is aligned too
+    start = _PREAMBLE.size + len(header)
+    start += _padding(start)
+    output = bytearray(start + offset)
+    _PREAMBLE.pack_into(output, 0, MAGIC, FORMAT_VERSION, len(header))
+    output[_PREAMBLE.size:_PREAMBLE.size + len(header)] = header
+    for column_offset, values in buffers:
+        position = start + column_offset
+        output[position:position + values.nbytes] = values.view(np.uint8).reshape(-1).data
+    return bytes(output)
+
+
+def loads(data: Union[bytes, bytearray, memoryview, np.ndarray]) -> StoredModel:
+    """
+    Load a model serialized by `dumps`.
+    The columns are views over `data`, it must not be changed while the model is used.
+
+    Args:
+        data: The serialized model, bytes or a uint8 array like a np.memmap.
+
+    Returns:
+        StoredModel: The model, with columnar dataframes.
+
+    Raises:
+        ValueError: If the data is not a serialized model, or its format version is not supported.
+    """
+    buffer = memoryview(data).cast('B') if not isinstance(data, np.ndarray) else data
+    if len(buffer) < _PREAMBLE.size:
+        raise ValueError('The data is not a serialized wellbelog model.')
+    magic, version, header_size = _PREAMBLE.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError('The data is not a serialized wellbelog model.')
+    if version != FORMAT_VERSION:
+        raise ValueError(f'Unsupported format version: {version}')
+
+    header = json.loads(bytes(buffer[_PREAMBLE.size:_PREAMBLE.size + header_size]))
+    start = _PREAMBLE.size + header_size
+    start += _padding(start)
+
+    model = load_model(header['type'], header['model'])
+    dataframes = model_dataframes(model)
+    if len(dataframes) != len(header['frames']):
+        raise ValueError('The serialized model is corrupted.')
+    for dataframe, frame in zip(dataframes, header['frames']):
+        arrays = {}
+        for column in frame['columns']:
+            dtype = np.dtype(column['dtype'])
+            shape = tuple(column['shape'])
+            count = int(np.prod(shape))
+            values = np.frombuffer(buffer, dtype=dtype, count=count, offset=start + column['offset'])
+            arrays[column['name']] = values.reshape(shape)
+        dataframe.arrays = arrays
+    return model
+
+
+def dump(model: StoredModel, path: str) -> str:
+    """
+    Serialize a model to a file.
+
+    Returns:
+        str: the path to the file.
+    """
+    pathlib.Path(path).write_bytes(dumps(model))
+    return path
+
+
+def load(path: str, mmap: bool = False) -> StoredModel:
+    """
+    Load a model from a file saved by `dump`.
+
+    Args:
+        path (str): The path to the file.
+        mmap (bool): If True, the file is memory mapped, and the columns pages are only read when touched.
+
+    Returns:
+        StoredModel: The model, with columnar dataframes.
+    """
+    if mmap:
+        return loads(np.memmap(path, dtype=np.uint8, mode='r'))
+    return loads(pathlib.Path(path).read_bytes())
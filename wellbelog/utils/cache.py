@@ -0,0 +1,246 @@
+"""
+A persistent cache for the models created by the readers.
+The models are pickled to a folder, one file per entry, so a file that was already
+read is loaded without opening it again with dlisio or lasio.
+"""
+import functools
+import hashlib
+import itertools
+import os
+import pathlib
+import pickle
+import tempfile
+from typing import Any, Callable, Optional
+
+from wellbelog import __version__
+from wellbelog.utils.logging import setup_logger
+
+CACHE_SUFFIX = '.pkl'
+RESCAN_FRACTION = 0.1
+"""The fraction of max_size written by a process after which the folder size is scanned again."""
+
+
+def file_hash(path: str) -> str:
+    """
+    The sha256 of the file content, read in chunks of 1MB.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """
+    On disk cache of parsed files.
+    The entries are keyed by the file path, size and modification time (or the content hash),
+    the reader and its options, and the wellbelog version.
+    When the folder is bigger than max_size, the least recently used entries are removed.
+    The size of the folder is scanned on the first write, then kept up to date by the writes of this process.
+    The folder is scanned again when the size goes over max_size, and after each RESCAN_FRACTION of max_size
+    written by this process, so the entries written by other processes, like the load_many workers, are counted too.
+
+    Attributes:
+        folder (pathlib.Path): The folder of the cache.
+        max_size (int): The max size of the cache, in bytes.
+        use_hash (bool): If True, the file content hash is used in the key instead of the modification time.
+        hits (int): The number of cache hits.
+        misses (int): The number of cache misses.
+    """
+
+    def __init__(self, folder: str, max_size: int = 2 * 1024 ** 3, use_hash: bool = False) -> None:
+        self.folder = pathlib.Path(folder)
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.use_hash = use_hash
+        self.hits = 0
+        self.misses = 0
+        self.logger = setup_logger(__class__.__name__)
+        # NOTE Access order of this process, breaks the ties of file systems with coarse modification times
+        self._accesses: dict[str, int] = {}
+        self._clock = itertools.count(1)
+        # NOTE The running size of the folder, None until it is scanned
+        self._size: Optional[int] = None
+        self._unscanned = 0
+
+    def __getstate__(self) -> dict:
+        # NOTE The counters are local to each process
+        state = self.__dict__.copy()
+        state['hits'] = state['misses'] = 0
+        state['_accesses'] = {}
+        state['_clock'] = itertools.count(1)
+        state['_size'] = None
+        state['_unscanned'] = 0
+        return state
+
+    def file_hash(self, path: str) -> str:
+        """
+        The sha256 of the file content.
+        """
+        return file_hash(path)
+
+    def key(self, path: str, reader: str, options: Optional[dict] = None) -> str:
+        """
+        Create the key of a file.
+
+        Args:
+            path (str): The path to the file.
+            reader (str): The name of the reader.
+            options (dict, optional): The options that change the reader result.
+
+        Returns:
+            str: The key of the entry.
+        """
+        file_path = pathlib.Path(path).absolute()
+        stat = file_path.stat()
+        version = self.file_hash(file_path) if self.use_hash else stat.st_mtime_ns
+        options = sorted((options or {}).items())
+        raw = f'{file_path}|{stat.st_size}|{version}|{reader}|{options}|{__version__}'
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def entry_path(self, key: str) -> pathlib.Path:
+        return self.folder / f'{key}{CACHE_SUFFIX}'
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a model from the cache, or None if it is not cached.
+        """
+        entry = self.entry_path(key)
+        try:
+            with open(entry, 'rb') as f:
+                model = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            # NOTE A broken entry is removed and read again
+            self.logger.error(f'Error while loading the cache entry {entry.name}: {e}')
+            entry.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        self._touch(entry)
+        self.hits += 1
+        return model
+
+    def set(self, key: str, model: Any) -> None:
+        """
+        Save a model in the cache, then remove the old entries if the cache is too big.
+        """
+        if self._size is None:
+            self._size = self.size
+            self._unscanned = 0
+        entry = self.entry_path(key)
+        fd, temp_path = tempfile.mkstemp(dir=self.folder, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+            added = os.path.getsize(temp_path)
+            replaced = entry.stat().st_size if entry.exists() else 0
+            os.replace(temp_path, entry)
+            self._touch(entry)
+        except Exception as e:
+            self.logger.error(f'Error while saving the cache entry: {e}')
+            pathlib.Path(temp_path).unlink(missing_ok=True)
+            return
+        self._size += added - replaced
+        self._unscanned += added
+        if self._size > self.max_size or self._unscanned > self.max_size * RESCAN_FRACTION:
+            self.evict()
+
+    def _touch(self, entry: pathlib.Path) -> None:
+        """
+        Mark the entry as used, the modification time is used as the last access time.
+        """
+        self._accesses[entry.name] = next(self._clock)
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+
+    def entries(self) -> list[os.DirEntry]:
+        """
+        The entries of the cache, from the least to the most recently used.
+        """
+        entries = []
+        with os.scandir(self.folder) as it:
+            for entry in it:
+                if entry.name.endswith(CACHE_SUFFIX):
+                    try:
+                        order = (entry.stat().st_mtime_ns, self._accesses.get(entry.name, 0))
+                        entries.append((order, entry))
+                    except FileNotFoundError:
+                        continue
+        return [entry for _, entry in sorted(entries, key=lambda item: item[0])]
+
+    @property
+    def size(self) -> int:
+        """
+        The size of the cache, in bytes, scanning the folder.
+        """
+        return sum(self._entry_size(entry) for entry in self.entries())
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache fits in max_size.
+        The folder is scanned, so the entries written by other processes are counted too.
+        """
+        entries = self.entries()
+        total = sum(self._entry_size(entry) for entry in entries)
+        for entry in entries:
+            if total <= self.max_size:
+                break
+            total -= self._entry_size(entry)
+            pathlib.Path(entry.path).unlink(missing_ok=True)
+        self._size = total
+        self._unscanned = 0
+
+    def clear(self) -> None:
+        """
+        Remove all the entries of the cache.
+        """
+        for entry in self.entries():
+            pathlib.Path(entry.path).unlink(missing_ok=True)
+        self._size = 0
+        self._unscanned = 0
+
+    @staticmethod
+    def _entry_size(entry: os.DirEntry) -> int:
+        try:
+            return entry.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+
+def cached_reading(method: Callable) -> Callable:
+    """
+    Decorator for the readers methods that receive a path and return a model.
+    If the reader has a cache, the model is loaded from it, or saved to it after reading.
+    Models with errors, and lazy models, are not cached.
+    """
+    @functools.wraps(method)
+    def wrapper(self, path: str, *args, **kwargs):
+        cache: Optional[ParseCache] = getattr(self, 'cache', None)
+        options = self.reader_options()
+        if cache is None or options.get('lazy'):
+            return method(self, path, *args, **kwargs)
+
+        options.update(args=args, kwargs=sorted(kwargs.items()))
+        try:
+            key = cache.key(path, f'{type(self).__name__}.{method.__name__}', options)
+        except OSError:
+            return method(self, path, *args, **kwargs)
+
+        model = cache.get(key)
+        if model is not None:
+            return model
+        model = method(self, path, *args, **kwargs)
+        if not getattr(model, 'error', False):
+            # NOTE The timings are of this read, the cached model is saved without them
+            if getattr(model, 'profile', None) is not None:
+                cache.set(key, model.model_copy(update={'profile': None}))
+            else:
+                cache.set(key, model)
+        return model
+    return wrapper
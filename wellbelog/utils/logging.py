@@ -32,6 +32,10 @@ def setup_logger(app_name: str, debug: bool = True):
     logger = logging.getLogger(app_name)
     logger.setLevel(logging.DEBUG)
 
+    # NOTE The loggers are shared by name, so the handler is only added once
+    if logger.handlers:
+        return logger
+
     handler = logging.StreamHandler()
     formatter = ColorfulFormatter(app_name)
     handler.setFormatter(formatter)
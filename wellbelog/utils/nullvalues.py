@@ -1,6 +1,11 @@
 """
 Export set of null values, for checkink in the dataframes.
 """
+from typing import Iterable, Union
+
+import numpy as np
+import pandas as pd
+
 NULL_VALUES = {
     -999.25,
     -999.250,
@@ -17,3 +22,65 @@ NULL_VALUES = {
     -999.00,
     -999.9999999999,
 }
+
+
+def null_mask(values: np.ndarray, null_values: Iterable[float] = NULL_VALUES, atol: float = 1e-6) -> np.ndarray:
+    """
+    Find the null values of a float array, with a tolerance.
+    The tolerance grows with the precision of the array type, so a float32 -9999.999 is still found.
+
+    Args:
+        values (np.ndarray): A float array, of any shape.
+        null_values (Iterable[float]): The null values.
+        atol (float): The absolute tolerance of the comparison.
+
+    Returns:
+        np.ndarray: A boolean array, True where the values are null.
+    """
+    values = np.asarray(values)
+    mask = np.zeros(values.shape, dtype=bool)
+    if values.dtype.kind != 'f':
+        return mask
+    eps = np.finfo(values.dtype).eps
+    for null in sorted({float(value) for value in null_values}):
+        tolerance = atol + 2 * eps * abs(null)
+        mask |= np.abs(values - null) <= tolerance
+    return mask
+
+
+def replace_null_values(
+    values: Union[np.ndarray, dict[str, np.ndarray], pd.DataFrame],
+    null_values: Iterable[float] = NULL_VALUES,
+    atol: float = 1e-6,
+) -> Union[np.ndarray, dict[str, np.ndarray], pd.DataFrame]:
+    """
+    Replace the null values with NaN, in place.
+    Only the float columns are changed, the integer columns can not hold NaN.
+
+    Args:
+        values: A float array, a structured array (like the dlisio curves), a dict of arrays or a dataframe.
+        null_values (Iterable[float]): The null values.
+        atol (float): The absolute tolerance of the comparison.
+
+    Returns:
+        The same object, with the null values replaced.
+    """
+    null_values = set(null_values)
+    if isinstance(values, pd.DataFrame):
+        for name in values.columns[values.dtypes.map(lambda dtype: dtype.kind == 'f')]:
+            mask = null_mask(values[name].to_numpy(), null_values, atol)
+            if mask.any():
+                values.loc[mask, name] = np.nan
+        return values
+    if isinstance(values, dict):
+        for column in values.values():
+            replace_null_values(column, null_values, atol)
+        return values
+    if values.dtype.names:
+        for name in values.dtype.names:
+            replace_null_values(values[name], null_values, atol)
+        return values
+    mask = null_mask(values, null_values, atol)
+    if mask.any():
+        values[mask] = np.nan
+    return values
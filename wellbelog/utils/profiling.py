@@ -0,0 +1,209 @@
+"""
+Timing hooks of the readers pipelines.
+
+A reader with a Profiler records the time, and the bytes and samples counts, of each stage of a read:
+opening the file, the logical file summary, the curves decoding, the dataframe and the JSON records.
+The timings are attached to the returned model as a ReadProfile, and sent to the collectors as they end.
+
+Without a profiler the readers use NULL_PROFILE, whose stages do nothing.
+"""
+import threading
+import time
+from typing import Callable, Iterable, Optional, Union
+
+from wellbelog.schemas.profiling import ReadProfile, StageTiming
+
+Collector = Callable[[StageTiming], None]
+"""A callable that receives the timings of the stages as they end."""
+
+
+class Stage:
+    """
+    A running stage, used as a context manager. The bytes and samples can be set inside the block.
+    """
+    __slots__ = ('profile', 'name', 'logical_file', 'frame', 'bytes', 'samples', 'start')
+
+    def __init__(
+        self,
+        profile: 'FileProfile',
+        name: str,
+        logical_file: Optional[int] = None,
+        frame: Optional[int] = None,
+        bytes: Optional[int] = None,
+        samples: Optional[int] = None,
+    ) -> None:
+        self.profile = profile
+        self.name = name
+        self.logical_file = logical_file
+        self.frame = frame
+        self.bytes = bytes
+        self.samples = samples
+
+    def __enter__(self) -> 'Stage':
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        seconds = time.perf_counter() - self.start
+        self.profile.record(StageTiming(
+            stage=self.name,
+            file_name=self.profile.file_name,
+            logical_file=self.logical_file,
+            frame=self.frame,
+            seconds=seconds,
+            bytes=self.bytes,
+            samples=self.samples,
+            error=exc_type is not None,
+        ))
+
+
+class FileProfile:
+    """
+    The timings of the read of one file. The stages can be recorded from many threads.
+
+    Attributes:
+        file_name (str): The name of the file.
+        stages (list[StageTiming]): The timings of the ended stages.
+        collectors (list[Collector]): The collectors of the profiler.
+    """
+    enabled = True
+
+    def __init__(self, file_name: str, collectors: Iterable[Collector] = ()) -> None:
+        self.file_name = file_name
+        self.stages: list[StageTiming] = []
+        self.collectors = list(collectors)
+        self._lock = threading.Lock()
+
+    def stage(self, name: str, logical_file: Optional[int] = None, frame: Optional[int] = None, **counts) -> Stage:
+        """
+        Time a stage.
+
+        Args:
+            name (str): The name of the stage.
+            logical_file (int, optional): The position of the logical file.
+            frame (int, optional): The position of the frame.
+            **counts: The bytes and samples of the stage, if known before it starts.
+        """
+        return Stage(self, name, logical_file, frame, **counts)
+
+    def record(self, timing: StageTiming) -> None:
+        with self._lock:
+            self.stages.append(timing)
+        for collector in self.collectors:
+            collector(timing)
+
+    def extend(self, timings: Iterable[StageTiming]) -> None:
+        """
+        Record the timings of stages that ran elsewhere, like in a worker process.
+        """
+        for timing in timings:
+            self.record(timing)
+
+    def result(self) -> ReadProfile:
+        with self._lock:
+            return ReadProfile(stages=list(self.stages))
+
+
+class _NullStage:
+    """
+    A stage that records nothing. The bytes and samples set in it are ignored.
+    """
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullStage':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        return None
+
+    def __setattr__(self, name, value) -> None:
+        return None
+
+
+class _NullProfile:
+    """
+    The profile of the readers without a profiler, every stage is the same no op context manager.
+    """
+    enabled = False
+    _stage = _NullStage()
+
+    def stage(self, name: str, logical_file: Optional[int] = None, frame: Optional[int] = None, **counts) -> _NullStage:
+        return self._stage
+
+    def extend(self, timings: Iterable[StageTiming]) -> None:
+        return None
+
+    def result(self) -> None:
+        return None
+
+
+NULL_PROFILE = _NullProfile()
+
+AnyProfile = Union[FileProfile, _NullProfile]
+"""The profile of a read, NULL_PROFILE when the reader has no profiler."""
+
+
+class ProfileCollector:
+    """
+    A collector that keeps the timings of all the reads, like of a folder.
+
+    Attributes:
+        stages (list[StageTiming]): The collected timings.
+    """
+
+    def __init__(self) -> None:
+        self.stages: list[StageTiming] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, timing: StageTiming) -> None:
+        with self._lock:
+            self.stages.append(timing)
+
+    def profile(self) -> ReadProfile:
+        """
+        The collected timings, as a single ReadProfile.
+        """
+        with self._lock:
+            return ReadProfile(stages=list(self.stages))
+
+    def clear(self) -> None:
+        with self._lock:
+            self.stages.clear()
+
+
+class Profiler:
+    """
+    The timing hooks of the readers.
+
+    Attributes:
+        collectors (list[Collector]): Called with each StageTiming as the stage ends.
+        attach (bool): If True, the ReadProfile is set in the `profile` field of the returned models.
+    """
+
+    def __init__(self, collector: Optional[Collector] = None, attach: bool = True) -> None:
+        self.collectors: list[Collector] = [collector] if collector is not None else []
+        self.attach = attach
+
+    def add_collector(self, collector: Collector) -> None:
+        self.collectors.append(collector)
+
+    def file(self, file_name: str) -> FileProfile:
+        """
+        Start the profile of the read of a file.
+        """
+        return FileProfile(file_name, self.collectors)
+
+
+def file_profile(profiler: Optional[Profiler], file_name: str) -> AnyProfile:
+    """
+    The profile of a read, NULL_PROFILE when there is no profiler.
+    """
+    return profiler.file(file_name) if profiler is not None else NULL_PROFILE
+
+
+def attach_profile(profiler: Optional[Profiler], model, profile: AnyProfile) -> None:
+    """
+    Set the timings of the read in the model, if the profiler attaches them.
+    """
+    if profiler is not None and profiler.attach:
+        model.profile = profile.result()
@@ -0,0 +1,173 @@
+"""
+Resampling of curves onto a common depth, with vectorized NumPy.
+
+The frames of a DLIS logical file can be sampled at different rates. Each curve is aligned onto one depth axis
+with binary searches over its own depth, so no row-wise join is done:
+    - linear: the value is interpolated between the two samples around each depth.
+    - nearest: the value of the closest sample is taken, it also works for the text curves.
+The depths outside of a curve, or farther than the tolerance from its samples, are NaN.
+"""
+from typing import Iterable, Optional
+
+import numpy as np
+
+from wellbelog.utils.arrays import DepthIndex
+from wellbelog.utils.nullvalues import NULL_VALUES, null_mask
+
+RESAMPLE_METHODS = ('linear', 'nearest')
+
+
+def depth_step(depth: np.ndarray) -> Optional[float]:
+    """
+    The sampling step of a depth, the median of the absolute steps that are not zero.
+    None if the depth has less than two distinct samples.
+    """
+    steps = np.abs(np.diff(np.asarray(depth, dtype=np.float64)))
+    steps = steps[np.isfinite(steps) & (steps > 0)]
+    return float(np.median(steps)) if len(steps) else None
+
+
+def common_depth(
+    depths: Iterable[np.ndarray],
+    step: Optional[float] = None,
+    top: Optional[float] = None,
+    bottom: Optional[float] = None,
+) -> np.ndarray:
+    """
+    Build a regular depth axis that covers all the depths.
+    The axis goes through the first sample of the first depth, and follows its direction,
+    so a decreasing log stays decreasing.
+
+    Args:
+        depths (Iterable[np.ndarray]): The depths of the curves, like the index of each frame.
+        step (float, optional): The step of the axis. Defaults to the finest step of the depths.
+        top (float, optional): The shallowest depth of the axis. Defaults to the shallowest of the depths.
+        bottom (float, optional): The deepest depth of the axis. Defaults to the deepest of the depths.
+
+    Raises:
+        ValueError: If the depths are empty, or no step can be found.
+
+    Returns:
+        np.ndarray: The float64 depth axis.
+    """
+    depths = [np.asarray(depth, dtype=np.float64) for depth in depths]
+    finite = [depth[np.isfinite(depth)] for depth in depths]
+    finite = [depth for depth in finite if len(depth)]
+    if not finite:
+        raise ValueError('There are no depths to build the axis.')
+    if step is None:
+        steps = [value for value in map(depth_step, finite) if value is not None]
+        if not steps:
+            raise ValueError('The step of the depth can not be found.')
+        step = min(steps)
+    assert step > 0, 'The step must be positive.'
+
+    top = min(float(depth.min()) for depth in finite) if top is None else top
+    bottom = max(float(depth.max()) for depth in finite) if bottom is None else bottom
+    # NOTE The axis is anchored on the first sample of the first depth, so its samples fall on the axis.
+    # It is built by multiplication, so the float error does not accumulate along it.
+    first = finite[0]
+    anchor = float(first[0])
+    start = int(np.ceil((top - anchor) / step - 1e-9))
+    stop = int(np.floor((bottom - anchor) / step + 1e-9))
+    axis = anchor + step * np.arange(start, stop + 1, dtype=np.float64)
+    if len(first) > 1 and first[-1] < first[0]:
+        axis = axis[::-1].copy()
+    return axis
+
+
+def _sorted_samples(depth: np.ndarray, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The samples sorted by depth, without the NaN depths. Monotonic depths are not copied.
+    """
+    valid = np.isfinite(depth)
+    if not valid.all():
+        depth, values = depth[valid], values[valid]
+    index = DepthIndex(depth)
+    if index.direction == 'INCREASING':
+        return index.sorted, values
+    if index.direction == 'DECREASING':
+        return index.sorted, values[::-1]
+    return index.sorted, values[index.order]
+
+
+def _missing(values: np.ndarray, rows: int) -> np.ndarray:
+    """
+    An array of missing values, NaN or None, with the sample shape of the values.
+    """
+    if values.dtype.kind in 'biuf':
+        return np.full((rows,) + values.shape[1:], np.nan)
+    return np.full((rows,) + values.shape[1:], None, dtype=object)
+
+
+def resample(
+    depth: np.ndarray,
+    values: np.ndarray,
+    target: np.ndarray,
+    method: str = 'linear',
+    tolerance: Optional[float] = None,
+    null_values: Optional[Iterable[float]] = NULL_VALUES,
+) -> np.ndarray:
+    """
+    Resample a curve onto a target depth.
+    The depth can be increasing, decreasing, or not monotonic, like a repeated section.
+    Multi-dimensional curves are resampled sample by sample, keeping their shape.
+
+    Args:
+        depth (np.ndarray): The depth of each sample of the curve.
+        values (np.ndarray): The curve, with one sample per depth.
+        target (np.ndarray): The depths to get the values at.
+        method (str): 'linear' or 'nearest'. Only numeric curves are interpolated, the others use 'nearest'.
+        tolerance (float, optional): The max distance to the closest sample, farther depths are missing.
+        null_values (Iterable[float], optional): The null values, replaced with NaN before the resampling.
+
+    Returns:
+        np.ndarray: The values at the target depths. Numeric curves are float, the missing values are NaN.
+            The other curves are object arrays, the missing values are None.
+    """
+    assert method in RESAMPLE_METHODS, f'Unknown resample method: {method}'
+    depth = np.asarray(depth, dtype=np.float64)
+    values = np.asarray(values)
+    target = np.asarray(target, dtype=np.float64)
+    assert len(depth) == len(values), 'The curve must have one sample per depth.'
+
+    if values.dtype.kind in 'biu':
+        values = values.astype(np.float64)
+    if null_values is not None and values.dtype.kind == 'f':
+        mask = null_mask(values, null_values)
+        if mask.any():
+            values = np.where(mask, np.nan, values)
+
+    depth, values = _sorted_samples(depth, values)
+    result = _missing(values, len(target))
+    if not len(depth):
+        return result
+
+    # NOTE The sample at or after each target depth, and the one before it
+    right = np.clip(np.searchsorted(depth, target, side='left'), 1, max(len(depth) - 1, 1))
+    left = right - 1
+    if len(depth) == 1:
+        right = left = np.zeros(len(target), dtype=np.intp)
+    before, after = target - depth[left], depth[right] - target
+    inside = (target >= depth[0]) & (target <= depth[-1])
+    if tolerance is not None:
+        inside &= np.minimum(np.abs(before), np.abs(after)) <= tolerance
+
+    if method == 'nearest' or values.dtype.kind != 'f':
+        nearest = np.where(after < before, right, left)
+        result[inside] = values[nearest[inside]]
+        return result
+
+    span = depth[right] - depth[left]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        weight = np.where(span > 0, before / span, 0.0)
+    # NOTE The float error of the axis is rounded away, so the depths on a sample are exact
+    weight[np.abs(weight) < 1e-9] = 0.0
+    weight[np.abs(weight - 1) < 1e-9] = 1.0
+    weight = weight.reshape((-1,) + (1,) * (values.ndim - 1))
+    lower, upper = values[left], values[right]
+    interpolated = lower + (upper - lower) * weight
+    # NOTE The depths on a sample take its value, even when the other sample is NaN
+    interpolated = np.where(weight == 0, lower, np.where(weight == 1, upper, interpolated))
+    result[inside] = interpolated[inside]
+    return result
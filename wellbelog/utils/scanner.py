@@ -0,0 +1,79 @@
+"""
+A single pass scanner of the log files of a folder tree, of all the formats at once.
+
+The tree is walked once, in parallel, with os.scandir. Each file is classified by its extension, in any case,
+and by its first bytes when the extension does not tell the format. The files are yielded as the walk goes.
+"""
+import functools
+import os
+from typing import Iterable, Iterator, Optional
+
+from wellbelog.utils.sniff import sniff_file
+from wellbelog.utils.walk import FileStat, OnError, walk_files
+
+EXTENSIONS = {'.dlis': 'dlis', '.lis': 'lis', '.las': 'las', '.tif': 'tiff', '.tiff': 'tiff'}
+"""The file type of each extension. The TIF files can wrap DLIS or LIS files."""
+
+FILE_TYPES = ('dlis', 'lis', 'las', 'tiff')
+
+SNIFF_MODES = ('never', 'unknown', 'all')
+"""
+When the first bytes of the files are read:
+    - never: the files are classified only by their extensions.
+    - unknown: the files without a log extension, and the TIF files, are sniffed.
+    - all: all the files are sniffed, the content wins over a wrong extension.
+"""
+
+
+def classify_file(path: str, sniff: str = 'unknown', file_types: Optional[frozenset[str]] = None) -> Optional[str]:
+    """
+    Get the type of a log file, by its extension and its content.
+
+    Args:
+        path (str): The path to the file.
+        sniff (str): When the file content is read, one of SNIFF_MODES.
+        file_types (frozenset[str], optional): The types kept, all of FILE_TYPES by default.
+
+    Returns:
+        Optional[str]: 'dlis', 'lis', 'las' or 'tiff', None if it is not a log file or its type is not kept.
+            A TIF file is 'tiff' only when its content is not recognized.
+    """
+    file_type = EXTENSIONS.get(os.path.splitext(path)[1].lower())
+    if sniff == 'all' or (sniff == 'unknown' and file_type in (None, 'tiff')):
+        file_type = sniff_file(path) or file_type
+    if file_types is not None and file_type not in file_types:
+        return None
+    return file_type
+
+
+def scan_log_files(
+    root: str,
+    file_types: Optional[Iterable[str]] = None,
+    sniff: str = 'unknown',
+    workers: int = 8,
+    follow_symlinks: bool = False,
+    on_error: Optional[OnError] = None,
+) -> Iterator[FileStat]:
+    """
+    Find the log files of a folder tree, walking it once.
+
+    Args:
+        root (str): The folder to walk.
+        file_types (Iterable[str], optional): The types of the files yielded, like ['dlis', 'tiff']. All by default.
+        sniff (str): When the first bytes of the files are read, one of SNIFF_MODES.
+            With 'unknown' every file without a log extension is opened, use 'never' on trees with many other files.
+        workers (int): The number of threads walking the folders and reading the files.
+        follow_symlinks (bool): If the links to folders are walked.
+        on_error (OnError, optional): Called with the errors of the folders that could not be listed.
+
+    Yields:
+        FileStat: The path, size, modification time and type of each log file, in no particular order.
+    """
+    assert sniff in SNIFF_MODES, f'Unknown sniff mode: {sniff}'
+    file_types = frozenset(file_types) if file_types is not None else None
+    suffixes = None
+    if sniff == 'never':
+        # NOTE Without sniffing, the other files are left out by their extensions, before they are classified
+        suffixes = [suffix for suffix, kind in EXTENSIONS.items() if file_types is None or kind in file_types]
+    classify = functools.partial(classify_file, sniff=sniff, file_types=file_types)
+    return walk_files(root, suffixes, workers, follow_symlinks, on_error, classify)
@@ -0,0 +1,88 @@
+"""
+Detection of the format of a log file from its first bytes.
+
+    - DLIS: the storage unit label, with the RP66 version 'V1.00' and the structure 'RECORD'.
+    - LAS: the first section, after comments and blank lines, is the ~V(ersion) section.
+    - LIS: a physical record header, followed by the header of a reel, tape or file record.
+
+The TIF markers, of the .tif and .tiff files, are skipped before the LIS record header.
+"""
+import struct
+from typing import Optional
+
+SNIFF_SIZE = 512
+"""The number of bytes read from the start of a file."""
+
+DLIS_LABEL = b'V1.00RECORD'
+
+# NOTE The logical records that start a LIS file: file header, tape header, reel header and comment
+LIS_FIRST_RECORDS = {128, 130, 132, 232}
+
+TIF_MARKER_SIZE = 12
+_TIF_MARKER = struct.Struct('<III')
+
+
+def has_tif_marker(head: bytes) -> bool:
+    """
+    If the bytes start with a TIF marker: a block type 0 or 1, no previous block and the next block after it.
+    """
+    if len(head) < TIF_MARKER_SIZE:
+        return False
+    block_type, previous, following = _TIF_MARKER.unpack_from(head)
+    return block_type in (0, 1) and previous == 0 and following > TIF_MARKER_SIZE
+
+
+def is_dlis(head: bytes) -> bool:
+    # NOTE The label has the sequence number before the version, and it can be after a TIF marker
+    return DLIS_LABEL in head[:200]
+
+
+def is_las(head: bytes) -> bool:
+    # NOTE The UTF-8 byte order mark is skipped
+    text = head.removeprefix(b'\xef\xbb\xbf').decode('latin-1')
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        return line[:2].upper() == '~V'
+    return False
+
+
+def is_lis(head: bytes) -> bool:
+    offset = TIF_MARKER_SIZE if has_tif_marker(head) else 0
+    if len(head) < offset + 6:
+        return False
+    length, = struct.unpack_from('>H', head, offset)
+    record_type, attributes = head[offset + 4], head[offset + 5]
+    return length >= 6 and record_type in LIS_FIRST_RECORDS and attributes == 0
+
+
+def sniff_bytes(head: bytes) -> Optional[str]:
+    """
+    Detect the format from the first bytes of a file.
+
+    Args:
+        head (bytes): The first bytes, SNIFF_SIZE is enough.
+
+    Returns:
+        Optional[str]: 'dlis', 'las' or 'lis', or None if the format is not recognized.
+    """
+    if is_dlis(head):
+        return 'dlis'
+    if is_las(head):
+        return 'las'
+    if is_lis(head):
+        return 'lis'
+    return None
+
+
+def sniff_file(path: str) -> Optional[str]:
+    """
+    Detect the format of a file from its first bytes. None if it is not recognized, or can not be read.
+    """
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(SNIFF_SIZE)
+    except OSError:
+        return None
+    return sniff_bytes(head)
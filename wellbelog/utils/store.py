@@ -0,0 +1,259 @@
+"""
+A columnar on-disk store for the read files.
+Each file is saved to a folder, with one .npy file per column and a small JSON sidecar
+with the rest of the model. Reopening a file only parses the sidecar, the columns are
+memory mapped, so their pages are only read from the disk when they are touched.
+"""
+import hashlib
+import json
+import pathlib
+import re
+import shutil
+import tempfile
+from typing import Optional, Union
+
+import numpy as np
+
+from wellbelog import __version__
+from wellbelog.schemas.base_schema import DataframeSchema
+from wellbelog.schemas.dlis import PhysicalFileModel
+from wellbelog.schemas.las import LasFileModel
+from wellbelog.schemas.lis import PhysicalLisFileModel
+from wellbelog.utils.logging import setup_logger
+
+METADATA_FILE = 'metadata.json'
+
+StoredModel = Union[PhysicalFileModel, PhysicalLisFileModel, LasFileModel]
+"""The models that can be saved to the store."""
+
+_DATA_FIELDS = {'data', 'arrays'}
+
+MODEL_TYPES: dict[str, type] = {
+    'dlis': PhysicalFileModel,
+    'lis': PhysicalLisFileModel,
+    'las': LasFileModel,
+}
+
+# NOTE The nested fields excluded from the sidecar, the columns are saved to their own files
+_EXCLUDE: dict[str, dict] = {
+    'dlis': {
+        'logical_files': {'__all__': {'frames': {'__all__': {'data': _DATA_FIELDS}}}},
+        'error_files': {'__all__': {'frames': {'__all__': {'data': _DATA_FIELDS}}}},
+    },
+    'lis': {
+        'logical_files': {'__all__': {'frames': {'__all__': _DATA_FIELDS}}},
+        'error_files': {'__all__': {'frames': {'__all__': _DATA_FIELDS}}},
+    },
+    'las': {'data': _DATA_FIELDS},
+}
+
+
+def model_type(model: StoredModel) -> str:
+    """
+    Get the type name of a model, used in the sidecar.
+    """
+    for name, cls in MODEL_TYPES.items():
+        if isinstance(model, cls):
+            return name
+    raise TypeError(f'Can not store a {type(model).__name__}.')
+
+
+def model_dataframes(model: StoredModel) -> list[DataframeSchema]:
+    """
+    Get the dataframes of a model, always in the same order.
+    """
+    if isinstance(model, LasFileModel):
+        return [model.data] if model.data is not None else []
+    dataframes = []
+    for logical_file in model.logical_files + model.error_files:
+        for frame in logical_file.frames or []:
+            # NOTE The dlis frames hold a dataframe, the lis frames are the dataframes
+            data = frame.data if isinstance(model, PhysicalFileModel) else frame
+            if isinstance(data, DataframeSchema):
+                dataframes.append(data)
+    return dataframes
+
+
+def dump_model(model: StoredModel) -> dict:
+    """
+    Dump a model to a JSON ready dict, without the data of its dataframes.
+    """
+    return model.model_dump(mode='json', by_alias=True, exclude_none=True, exclude=_EXCLUDE[model_type(model)])
+
+
+def load_model(kind: str, dump: dict) -> StoredModel:
+    """
+    Create a model from a dict created by `dump_model`, the dataframes have no data.
+    """
+    return MODEL_TYPES[kind].model_validate(dump)
+
+
+def storable_array(values) -> np.ndarray:
+    """
+    Convert a column to an array that can be memory mapped.
+    The object columns, that come from the records, are converted to floats or strings.
+    """
+    values = np.asarray(values)
+    if values.dtype != object:
+        return values
+    try:
+        return values.astype(float)
+    except (TypeError, ValueError):
+        return values.astype(str)
+
+
+class ColumnarStore:
+    """
+    A folder with the columns of the read files, as memory mapped arrays.
+
+    The layout of the folder is:
+        <folder>/<key>/metadata.json: The model without the data, and the columns of each frame.
+        <folder>/<key>/<frame>/<column>.npy: The columns.
+
+    Attributes:
+        folder (pathlib.Path): The folder of the store.
+    """
+
+    def __init__(self, folder: str) -> None:
+        self.folder = pathlib.Path(folder)
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.logger = setup_logger(__class__.__name__)
+
+    def path(self, key: str) -> pathlib.Path:
+        """
+        The folder of an entry.
+        """
+        return self.folder / key
+
+    @staticmethod
+    def default_key(model: StoredModel, source: Optional[str] = None) -> str:
+        """
+        Create a key from the file name of the model, safe to use as a folder name.
+        Files with the same name in different folders are told apart by a short hash
+        of the source path, or of the folder name of the model, added to the name.
+        """
+        name = re.sub(r'[^\w.-]', '_', model.file_name)
+        origin = str(pathlib.Path(source).resolve()) if source is not None else getattr(model, 'folder_name', None)
+        if origin is None:
+            return name
+        return f"{name}-{hashlib.sha1(origin.encode('utf-8')).hexdigest()[:8]}"
+
+    def unused_key(self, key: str) -> str:
+        """
+        The key, or the key with the first free counter, like run1.dlis-2, if it is already in the store.
+        """
+        candidate, counter = key, 1
+        while candidate in self:
+            counter += 1
+            candidate = f'{key}-{counter}'
+        return candidate
+
+    def keys(self) -> list[str]:
+        """
+        The keys of the stored files.
+        """
+        return sorted(path.parent.name for path in self.folder.glob(f'*/{METADATA_FILE}'))
+
+    def __contains__(self, key: str) -> bool:
+        return (self.path(key) / METADATA_FILE).exists()
+
+    def write(self, model: StoredModel, key: str = None, source: Optional[str] = None) -> str:
+        """
+        Save a model to the store, replacing the entry with the same key.
+        The columns are written to a temporary folder, that is moved in place at the end.
+
+        Without a key, the key is built by `default_key`. When neither the source path nor the folder name
+        of the model is known, the files can not be told apart by their names, so an existing entry
+        is never replaced: the key gets a counter instead.
+
+        Args:
+            model (StoredModel): A PhysicalFileModel, PhysicalLisFileModel or LasFileModel.
+            key (str, optional): The key of the entry, defaults to the file name and a hash of its origin.
+            source (str, optional): The path of the file the model was read from.
+
+        Returns:
+            str: The key of the entry.
+        """
+        kind = model_type(model)
+        if key is None:
+            key = self.default_key(model, source)
+            if source is None and getattr(model, 'folder_name', None) is None:
+                key = self.unused_key(key)
+        temporary = pathlib.Path(tempfile.mkdtemp(dir=self.folder, prefix='.tmp-'))
+        try:
+            # NOTE mkdtemp creates a private folder, the store is usually shared
+            temporary.chmod(0o755)
+            frames = []
+            for frame_index, dataframe in enumerate(model_dataframes(model)):
+                frame_folder = temporary / str(frame_index)
+                frame_folder.mkdir()
+                columns = []
+                for column_index, (name, values) in enumerate(dataframe.as_arrays().items()):
+                    values = storable_array(values)
+                    file_name = f'{column_index}.npy'
+                    np.save(frame_folder / file_name, values, allow_pickle=False)
+                    columns.append({'name': name, 'file': file_name, 'dtype': values.dtype.str, 'shape': values.shape})
+                frames.append({'folder': str(frame_index), 'columns': columns})
+
+            metadata = {
+                'version': __version__,
+                'type': kind,
+                'model': dump_model(model),
+                'frames': frames,
+            }
+            with open(temporary / METADATA_FILE, 'w', encoding='utf-8') as f:
+                json.dump(metadata, f, default=str)
+
+            destination = self.path(key)
+            if destination.exists():
+                shutil.rmtree(destination)
+            temporary.replace(destination)
+        except Exception:
+            shutil.rmtree(temporary, ignore_errors=True)
+            raise
+        self.logger.info(f'Stored {model.file_name} as {key}')
+        return key
+
+    def metadata(self, key: str) -> dict:
+        """
+        Read the sidecar of an entry.
+
+        Raises:
+            KeyError: If the key is not in the store.
+        """
+        if key not in self:
+            raise KeyError(key)
+        with open(self.path(key) / METADATA_FILE, encoding='utf-8') as f:
+            return json.load(f)
+
+    def open(self, key: str) -> StoredModel:
+        """
+        Open a stored file.
+        Only the sidecar is parsed, the data of the dataframes are memory mapped, read only, arrays.
+
+        Args:
+            key (str): The key of the entry.
+
+        Returns:
+            StoredModel: The model, with columnar dataframes.
+
+        Raises:
+            KeyError: If the key is not in the store.
+        """
+        metadata = self.metadata(key)
+        model = load_model(metadata['type'], metadata['model'])
+        dataframes = model_dataframes(model)
+        assert len(dataframes) == len(metadata['frames']), f'The entry {key} is corrupted.'
+        for dataframe, frame in zip(dataframes, metadata['frames']):
+            frame_folder = self.path(key) / frame['folder']
+            dataframe.arrays = {
+                column['name']: np.load(frame_folder / column['file'], mmap_mode='r')
+                for column in frame['columns']
+            }
+        return model
+
+    def remove(self, key: str) -> None:
+        """
+        Remove an entry from the store.
+        """
+        shutil.rmtree(self.path(key), ignore_errors=True)
@@ -0,0 +1,124 @@
+"""
+A parallel walk of a folder tree with os.scandir.
+
+Each folder is listed in a thread, and its subfolders are submitted as soon as they are found,
+so many folders are listed at once. This matters on network file systems, where each listing waits on the server.
+"""
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import os
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
+
+OnError = Callable[[OSError], None]
+"""Called with the errors of the folders that could not be listed, like the onerror of os.walk."""
+
+Classifier = Callable[[str], Optional[str]]
+"""Called with the path of each file, returns the type of the file, or None to leave the file out."""
+
+
+class FileStat(NamedTuple):
+    """
+    A file found by the walk.
+
+    Attributes:
+        path (str): The path to the file.
+        size (int): The size of the file in bytes.
+        mtime_ns (int): The modification time of the file, in nanoseconds.
+        file_type (Optional[str]): The type of the file given by the classifier of the walk, if any.
+    """
+    path: str
+    size: int
+    mtime_ns: int
+    file_type: Optional[str] = None
+
+
+def scan_folder(
+    path: str,
+    suffixes: Optional[set[str]] = None,
+    follow_symlinks: bool = False,
+    on_error: Optional[OnError] = None,
+    classify: Optional[Classifier] = None,
+) -> tuple[list[FileStat], list[str]]:
+    """
+    List a folder, without going into its subfolders.
+
+    Args:
+        path (str): The path to the folder.
+        suffixes (set[str], optional): The lower case suffixes of the files kept, like {'.dlis', '.las'}. All by default.
+        follow_symlinks (bool): If the links to folders are walked.
+        on_error (OnError, optional): Called with the error if the folder can not be listed.
+        classify (Classifier, optional): Gives the type of each file kept by the suffixes, or None to leave it out.
+
+    Returns:
+        tuple[list[FileStat], list[str]]: The files and the subfolders.
+    """
+    files, folders = [], []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=follow_symlinks):
+                        folders.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                    if suffixes is not None and os.path.splitext(entry.name)[1].lower() not in suffixes:
+                        continue
+                    file_type = None
+                    if classify is not None:
+                        file_type = classify(entry.path)
+                        if file_type is None:
+                            continue
+                    stat = entry.stat()
+                    files.append(FileStat(entry.path, stat.st_size, stat.st_mtime_ns, file_type))
+                except OSError:
+                    # NOTE The file was removed, or is a broken link
+                    continue
+    except OSError as e:
+        if on_error is not None:
+            on_error(e)
+    return files, folders
+
+
+def walk_files(
+    root: str,
+    suffixes: Optional[Iterable[str]] = None,
+    workers: int = 8,
+    follow_symlinks: bool = False,
+    on_error: Optional[OnError] = None,
+    classify: Optional[Classifier] = None,
+) -> Iterator[FileStat]:
+    """
+    Walk a folder tree, listing up to `workers` folders at once.
+    The files are yielded as each folder is listed, so they can be processed before the walk ends.
+    The order of the files is not defined.
+
+    Args:
+        root (str): The folder to walk.
+        suffixes (Iterable[str], optional): The suffixes of the files kept, in any case. All the files by default.
+        workers (int): The number of threads listing the folders. With 1, the walk is done in this thread.
+        follow_symlinks (bool): If the links to folders are walked. NOTE Links cycles are not detected.
+        on_error (OnError, optional): Called with the errors of the folders that could not be listed.
+        classify (Classifier, optional): Gives the type of each file, or None to leave it out.
+            It runs in the threads of the walk, so the files can be read by it at the same time.
+
+    Yields:
+        FileStat: The path, size and modification time of each file.
+    """
+    suffixes = {suffix.lower() for suffix in suffixes} if suffixes is not None else None
+    if workers <= 1:
+        folders = [os.fspath(root)]
+        while folders:
+            files, subfolders = scan_folder(folders.pop(), suffixes, follow_symlinks, on_error, classify)
+            folders.extend(subfolders)
+            yield from files
+        return
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='wellbelog-walk') as executor:
+        running = {executor.submit(scan_folder, os.fspath(root), suffixes, follow_symlinks, on_error, classify)}
+        while running:
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subfolders = future.result()
+                for folder in subfolders:
+                    running.add(executor.submit(scan_folder, folder, suffixes, follow_symlinks, on_error, classify))
+                yield from files